@@ -0,0 +1,477 @@
+"""
+ExamSplitter 명령줄 도구
+
+tkinter 없이 폴더 안의 시험지 PDF들을 한 번에 분할합니다.
+
+사용 예:
+    python -m src.cli split exams/ --formats images,pdfs --dpi 200 --workers 4
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config.defaults import DefaultSettings
+from src.utils.logger import get_logger, setup_logging
+from src.utils.question_detector import QuestionDetector
+from src.utils.question_exporter import QuestionExporter
+from src.utils.validators import (
+    validate_confidence,
+    validate_dpi,
+    validate_group_size,
+    validate_shuffle_seed,
+)
+
+# 명령줄에서 사용할 출력 형식 별칭
+OUTPUT_FORMAT_ALIASES: Dict[str, str] = {
+    "images": "개별 이미지",
+    "pdfs": "개별 PDF",
+    "groups": "그룹 PDF",
+    "workbook": "전체 문제집",
+    "shuffled": "셔플 문제집",
+}
+
+# PDF별 출력 폴더에 기록하는 처리 완료 정보 파일명
+MANIFEST_FILENAME = ".examsplitter.json"
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SplitResult:
+    """PDF 한 개의 분할 결과"""
+
+    pdf_path: Path
+    output_dir: Path
+    pages: int = 0
+    questions: int = 0
+    files: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+    error: Optional[str] = None
+    # 문제가 없는 페이지로 보고 감지를 건너뛴 페이지 (페이지 번호 → 이유)
+    skipped_pages: Dict[int, str] = field(default_factory=dict)
+
+
+def parse_output_formats(value: str) -> Dict[str, bool]:
+    """쉼표로 구분된 출력 형식 목록을 출력 형식 딕셔너리로 변환합니다."""
+    selected = set()
+    for name in value.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        format_name = OUTPUT_FORMAT_ALIASES.get(name, name)
+        if format_name not in OUTPUT_FORMAT_ALIASES.values():
+            choices = ", ".join(OUTPUT_FORMAT_ALIASES)
+            raise argparse.ArgumentTypeError(
+                f"지원하지 않는 출력 형식입니다: {name} (사용 가능: {choices})"
+            )
+        selected.add(format_name)
+
+    if not selected:
+        raise argparse.ArgumentTypeError("출력 형식을 하나 이상 지정하세요")
+
+    return {name: name in selected for name in OUTPUT_FORMAT_ALIASES.values()}
+
+
+def _argument_type(
+    convert: Callable[[str], T], validate: Callable[[T], T]
+) -> Callable[[str], T]:
+    """값 변환과 validators 검증을 argparse 타입 함수로 묶습니다."""
+
+    def parse(value: str) -> T:
+        try:
+            return validate(convert(value))
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    return parse
+
+
+def _default_output_formats() -> str:
+    """기본 처리 설정에서 활성화된 출력 형식 별칭을 반환합니다."""
+    defaults = DefaultSettings.get_processing_defaults()["output_formats"]
+    return ",".join(
+        alias
+        for alias, name in OUTPUT_FORMAT_ALIASES.items()
+        if defaults.get(name, False)
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서를 생성합니다."""
+    defaults = DefaultSettings.get_processing_defaults()
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="ExamSplitter 명령줄 도구 - GUI 없이 시험지 PDF를 분할합니다.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="로그 레벨 (DEBUG, INFO, WARNING, ERROR)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    split_parser = subparsers.add_parser(
+        "split", help="폴더(또는 파일)의 PDF들을 문제 단위로 분할합니다."
+    )
+    split_parser.add_argument("input", type=Path, help="PDF 파일 또는 PDF가 있는 폴더")
+    split_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path.cwd() / "outputs",
+        help="출력 폴더 (PDF마다 하위 폴더 생성, 기본값: ./outputs)",
+    )
+    split_parser.add_argument(
+        "--formats",
+        type=parse_output_formats,
+        default=parse_output_formats(_default_output_formats()),
+        help=f"출력 형식 (쉼표 구분: {', '.join(OUTPUT_FORMAT_ALIASES)})",
+    )
+    split_parser.add_argument(
+        "--dpi",
+        type=_argument_type(int, validate_dpi),
+        default=defaults["dpi"],
+        help="문제 이미지 DPI (150-600)",
+    )
+    split_parser.add_argument(
+        "--detection-dpi",
+        type=int,
+        default=None,
+        help="감지에 사용할 렌더링 DPI (기본값: 설정의 detection_dpi)",
+    )
+    split_parser.add_argument(
+        "--confidence",
+        type=_argument_type(float, validate_confidence),
+        default=defaults["confidence"],
+        help="감지 신뢰도 (0.1-1.0)",
+    )
+    split_parser.add_argument(
+        "--group-size",
+        type=_argument_type(int, validate_group_size),
+        default=defaults["group_size"],
+        help="그룹 PDF 한 개에 들어갈 문제 수 (1-20)",
+    )
+    split_parser.add_argument(
+        "--seed",
+        type=_argument_type(int, validate_shuffle_seed),
+        default=None,
+        help="셔플 문제집 시드 (1-9999)",
+    )
+    split_parser.add_argument(
+        "--model", default=None, help="models 폴더의 모델 파일명 (기본값: 첫 번째 모델)"
+    )
+    split_parser.add_argument(
+        "--workers", type=int, default=1, help="동시에 처리할 PDF 수"
+    )
+    split_parser.add_argument(
+        "--batch-size", type=int, default=None, help="한 번에 추론할 페이지 수"
+    )
+    split_parser.add_argument(
+        "-r", "--recursive", action="store_true", help="하위 폴더의 PDF도 처리"
+    )
+    split_parser.add_argument(
+        "--raster-pdf",
+        dest="vector_pdf",
+        action="store_false",
+        default=defaults["vector_pdf"],
+        help="PDF를 원본 벡터 복사 대신 문제 이미지로 생성",
+    )
+    split_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="같은 설정으로 이미 처리된 PDF도 다시 처리",
+    )
+    split_parser.add_argument(
+        "--no-cache", action="store_true", help="감지 결과 캐시를 사용하지 않음"
+    )
+    split_parser.add_argument(
+        "--no-text-layer",
+        action="store_true",
+        help="텍스트 레이어의 문제 번호를 사용하지 않고 모든 페이지를 모델로 감지",
+    )
+    split_parser.add_argument(
+        "--no-page-filter",
+        action="store_true",
+        help="표지, 여백 페이지, OMR 답안지를 건너뛰지 않고 모든 페이지를 감지",
+    )
+    split_parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help="저해상도 감지 결과가 의심스러운 페이지만 고해상도로 다시 감지",
+    )
+    split_parser.set_defaults(handler=run_split)
+
+    return parser
+
+
+def find_pdf_files(input_path: Path, recursive: bool = False) -> List[Path]:
+    """입력 경로에서 처리할 PDF 파일 목록을 찾습니다."""
+    if input_path.is_file():
+        return [input_path]
+
+    if not input_path.is_dir():
+        raise FileNotFoundError(f"입력 경로를 찾을 수 없습니다: {input_path}")
+
+    pattern = "**/*" if recursive else "*"
+    return sorted(
+        path
+        for path in input_path.glob(pattern)
+        if path.is_file() and path.suffix.lower() == ".pdf"
+    )
+
+
+def _manifest_settings(
+    detector: QuestionDetector, pdf_path: Path, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """처리 결과를 결정하는 입력과 설정을 반환합니다."""
+    return {
+        # 감지 결과는 신뢰도 하한 기준이므로 신뢰도는 따로 기록
+        "detection": detector.detection_cache_key(
+            str(pdf_path), args.dpi, args.confidence, save_page_images=False
+        ),
+        "confidence": round(args.confidence, 4),
+        "dpi": args.dpi,
+        "formats": sorted(name for name, enabled in args.formats.items() if enabled),
+        "group_size": args.group_size,
+        "seed": args.seed,
+        "vector_pdf": args.vector_pdf,
+    }
+
+
+def load_manifest(output_dir: Path) -> Optional[Dict[str, Any]]:
+    """출력 폴더의 처리 완료 정보를 읽습니다. 없거나 손상되었으면 None을 반환합니다."""
+    manifest_path = output_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest: Dict[str, Any] = json.load(f)
+        return manifest
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(manifest: Optional[Dict[str, Any]], settings: Dict[str, Any]) -> bool:
+    """같은 설정으로 처리되었고 생성 파일이 모두 남아 있는지 확인합니다."""
+    if manifest is None or manifest.get("settings") != settings:
+        return False
+    return all(Path(path).exists() for path in manifest.get("files", []))
+
+
+def split_pdf(
+    detector: QuestionDetector,
+    exporter: QuestionExporter,
+    pdf_path: Path,
+    output_dir: Path,
+    args: argparse.Namespace,
+) -> SplitResult:
+    """PDF 한 개를 감지하고 선택한 형식으로 내보냅니다.
+
+    같은 설정으로 이미 처리된 PDF는 (--force가 아니면) 건너뜁니다.
+    """
+    result = SplitResult(pdf_path=pdf_path, output_dir=output_dir)
+    start = time.perf_counter()
+
+    try:
+        import fitz  # PyMuPDF
+
+        with fitz.open(str(pdf_path)) as doc:
+            result.pages = len(doc)
+
+        settings = _manifest_settings(detector, pdf_path, args)
+        manifest = load_manifest(output_dir)
+        if (
+            not args.force
+            and manifest is not None
+            and is_up_to_date(manifest, settings)
+        ):
+            result.questions = manifest.get("questions", 0)
+            result.files = len(manifest.get("files", []))
+            result.skipped_pages = {
+                int(page_num): reason
+                for page_num, reason in manifest.get("skipped_pages", {}).items()
+            }
+            result.skipped = True
+            result.seconds = time.perf_counter() - start
+            return result
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # 명령줄에서는 편집이 없으므로 페이지 PNG를 저장하지 않음
+            questions, page_images = detector.process_pdf(
+                str(pdf_path),
+                temp_dir,
+                args.dpi,
+                args.confidence,
+                save_page_images=False,
+                skip_callback=result.skipped_pages.__setitem__,
+            )
+            created_files = exporter.export(
+                questions,
+                page_images,
+                str(output_dir),
+                args.formats,
+                args.group_size,
+                args.seed,
+                pdf_path=str(pdf_path),
+                vector_pdf=args.vector_pdf,
+            )
+
+        result.questions = len(questions)
+        result.files = len(created_files)
+
+        # 모든 출력을 만든 뒤에 기록하여 중단된 PDF는 다음 실행에서 다시 처리
+        with open(output_dir / MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "pdf": str(pdf_path),
+                    "settings": settings,
+                    "questions": result.questions,
+                    "files": created_files,
+                    "skipped_pages": {
+                        str(page_num): reason
+                        for page_num, reason in sorted(result.skipped_pages.items())
+                    },
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    except Exception as e:
+        result.error = str(e)
+        logger.debug(f"{pdf_path} 처리 실패: {e}", exc_info=True)
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def run_split(args: argparse.Namespace) -> int:
+    """split 명령을 실행합니다."""
+    pdf_files = find_pdf_files(args.input, args.recursive)
+    if not pdf_files:
+        print(f"처리할 PDF 파일이 없습니다: {args.input}")
+        return 1
+
+    print(f"PDF {len(pdf_files)}개 처리 시작 (동시 처리: {max(1, args.workers)})")
+    start = time.perf_counter()
+
+    # 모델은 한 번만 로드하여 모든 PDF에서 공유
+    detector = QuestionDetector(
+        args.model,
+        batch_size=args.batch_size,
+        use_cache=not args.no_cache,
+        detection_dpi=args.detection_dpi,
+        use_text_layer=False if args.no_text_layer else None,
+        cascade=True if args.cascade else None,
+        use_page_filter=False if args.no_page_filter else None,
+    )
+    exporter = QuestionExporter()
+    input_root = args.input if args.input.is_dir() else args.input.parent
+
+    results: List[SplitResult] = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = [
+                executor.submit(
+                    split_pdf,
+                    detector,
+                    exporter,
+                    pdf_path,
+                    args.output / pdf_path.relative_to(input_root).with_suffix(""),
+                    args,
+                )
+                for pdf_path in pdf_files
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                _print_result(result, len(results), len(pdf_files))
+    finally:
+        detector.cleanup()
+
+    print_summary(results, time.perf_counter() - start)
+    return 0 if all(result.error is None for result in results) else 1
+
+
+def _print_result(result: SplitResult, index: int, total: int) -> None:
+    """PDF 한 개의 처리 결과를 출력합니다."""
+    if result.error:
+        print(f"[{index}/{total}] 실패 {result.pdf_path.name}: {result.error}")
+    elif result.skipped:
+        print(f"[{index}/{total}] 건너뜀 {result.pdf_path.name}: 이미 처리됨")
+    else:
+        print(
+            f"[{index}/{total}] {result.pdf_path.name}: "
+            f"{result.pages}페이지, 문제 {result.questions}개, "
+            f"파일 {result.files}개 ({result.seconds:.1f}초)"
+        )
+        if result.skipped_pages:
+            print(
+                "    건너뛴 페이지: "
+                + ", ".join(
+                    f"{page_num}({reason})"
+                    for page_num, reason in sorted(result.skipped_pages.items())
+                )
+            )
+
+
+def print_summary(results: Sequence[SplitResult], elapsed: float) -> None:
+    """전체 처리량 요약을 출력합니다."""
+    succeeded = [
+        result for result in results if result.error is None and not result.skipped
+    ]
+    skipped = [result for result in results if result.skipped]
+    failed = len(results) - len(succeeded) - len(skipped)
+    pages = sum(result.pages for result in succeeded)
+    questions = sum(result.questions for result in succeeded)
+    files = sum(result.files for result in succeeded)
+    skipped_pages = sum(len(result.skipped_pages) for result in succeeded)
+
+    print("\n=== 처리 요약 ===")
+    print(f"PDF: 성공 {len(succeeded)}개 / 건너뜀 {len(skipped)}개 / 실패 {failed}개")
+    print(
+        f"페이지: {pages} (감지 건너뜀 {skipped_pages}), "
+        f"문제: {questions}, 생성 파일: {files}"
+    )
+    if elapsed > 0:
+        print(
+            f"소요 시간: {elapsed:.1f}초 "
+            f"({pages / elapsed:.2f} 페이지/초, "
+            f"{len(succeeded) * 60 / elapsed:.1f} PDF/분)"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    setup_logging(log_level=args.log_level, console_output=True)
+
+    try:
+        exit_code: int = args.handler(args)
+        return exit_code
+    except KeyboardInterrupt:
+        print("사용자에 의해 중단되었습니다.")
+        return 130
+    except Exception as e:
+        print(f"오류: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,10 +23,31 @@ class DefaultSettings:
             "model_directory": project_root / "models",
             "output_directory": project_root / "outputs",
             "temp_directory": project_root / "temp",
+            "cache_directory": project_root / "cache",
             "log_level": "INFO",
             "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             "max_workers": 1,
-            "batch_size": 1,
+            "batch_size": 4,
+            "detection_dpi": 100,
+            "detection_confidence_floor": 0.1,
+            "text_layer_detection_enabled": True,
+            "scanned_page_extraction_enabled": True,
+            "layout_template_enabled": True,
+            "layout_template_similarity": 0.85,
+            "layout_template_max": 500,
+            "page_filter_enabled": True,
+            "native_input_render_enabled": True,
+            "cascade_enabled": False,
+            "cascade_dpi": 200,
+            "cascade_imgsz": 1280,
+            "page_cache_mb": 512,
+            "detection_cache_enabled": True,
+            "onnx_intra_op_threads": 0,
+            "onnx_inter_op_threads": 0,
+            "onnx_graph_optimization": "all",
+            "model_warmup_enabled": True,
+            "model_pool_size": 2,
+            "model_pool_mb": 1024,
         }
 
     @staticmethod
@@ -45,6 +66,7 @@ class DefaultSettings:
                 "셔플 문제집": False,
             },
             "shuffle_seed": None,
+            "vector_pdf": True,
         }
 
     @staticmethod
@@ -59,3 +59,9 @@ class OutputGenerationError(ExamSplitterError):
     """출력 생성 관련 예외"""
 
     pass
+
+
+class JobCancelledError(ExamSplitterError):
+    """작업 취소 예외"""
+
+    pass
@@ -41,6 +41,7 @@ class ProcessingSettings:
     max_file_size_mb: int = 50
     output_formats: Dict[str, bool] = field(default_factory=dict)
     shuffle_seed: Optional[int] = None
+    vector_pdf: bool = True
 
     def __post_init__(self) -> None:
         """데이터 검증"""
@@ -123,10 +124,31 @@ class ApplicationConfig:
     model_directory: Path
     output_directory: Path
     temp_directory: Path
+    cache_directory: Path
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     max_workers: int = 1
-    batch_size: int = 1
+    batch_size: int = 4
+    detection_dpi: int = 100
+    detection_confidence_floor: float = 0.1
+    text_layer_detection_enabled: bool = True
+    scanned_page_extraction_enabled: bool = True
+    layout_template_enabled: bool = True
+    layout_template_similarity: float = 0.85
+    layout_template_max: int = 500
+    page_filter_enabled: bool = True
+    native_input_render_enabled: bool = True
+    cascade_enabled: bool = False
+    cascade_dpi: int = 200
+    cascade_imgsz: int = 1280
+    page_cache_mb: int = 512
+    detection_cache_enabled: bool = True
+    onnx_intra_op_threads: int = 0
+    onnx_inter_op_threads: int = 0
+    onnx_graph_optimization: str = "all"
+    model_warmup_enabled: bool = True
+    model_pool_size: int = 2
+    model_pool_mb: int = 1024
 
     def __post_init__(self) -> None:
         """디렉토리 생성"""
@@ -134,5 +156,6 @@ class ApplicationConfig:
             self.model_directory,
             self.output_directory,
             self.temp_directory,
+            self.cache_directory,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
@@ -2,6 +2,7 @@
 ExamSplitter 메인 애플리케이션
 """
 
+import importlib.util
 import sys
 import tkinter as tk
 from pathlib import Path
@@ -206,29 +207,40 @@ class ExamSplitterApp:
             print(f"다이얼로그 표시 실패: {e}")
 
 
-def check_dependencies() -> bool:
-    """필수 의존성 라이브러리들을 검증합니다."""
-    missing_deps = []
-    print("의존성 검사 중....(최대 1분 걸립니다)")
-    try:
-        import ultralytics
-    except ImportError:
-        missing_deps.append("ultralytics")
+# 필수 라이브러리 (모듈 이름, 설치 패키지 이름)
+REQUIRED_MODULES = [
+    ("fitz", "PyMuPDF"),
+    ("cv2", "opencv-python"),
+    ("numpy", "numpy"),
+    ("PIL", "Pillow"),
+    ("reportlab", "reportlab"),
+]
 
-    try:
-        import torch
-    except ImportError:
-        missing_deps.append("torch")
 
+def is_module_available(module_name: str) -> bool:
+    """모듈을 실제로 불러오지 않고 설치 여부만 확인합니다."""
     try:
-        import cv2
-    except ImportError:
-        missing_deps.append("opencv-python")
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
 
-    try:
-        import fitz
-    except ImportError:
-        missing_deps.append("PyMuPDF")
+
+def check_dependencies() -> bool:
+    """필수 의존성 라이브러리들을 검증합니다.
+
+    무거운 라이브러리(torch 등)를 불러오지 않도록 설치 여부만 확인하며,
+    실제 로드는 처음 사용할 때 이루어집니다.
+    """
+    missing_deps = [
+        package
+        for module_name, package in REQUIRED_MODULES
+        if not is_module_available(module_name)
+    ]
+
+    # 감지 백엔드: ultralytics(.pt, torch 필요) 또는 onnxruntime(.onnx) 중 하나
+    has_ultralytics = all(map(is_module_available, ("ultralytics", "torch")))
+    if not has_ultralytics and not is_module_available("onnxruntime"):
+        missing_deps.append("ultralytics, torch (또는 onnxruntime)")
 
     if missing_deps:
         print("다음 라이브러리들이 누락되었습니다:")
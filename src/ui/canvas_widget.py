@@ -3,11 +3,13 @@
 """
 
 import tkinter as tk
-from pathlib import Path
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
-from PIL import Image, ImageTk
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+    from ..utils.question_store import QuestionStore
 
 
 class ImageCanvas(ttk.Frame):
@@ -16,21 +18,22 @@ class ImageCanvas(ttk.Frame):
         self.callback = callback
         self.page_callback = page_callback
 
-        self.current_image: Optional[Image.Image] = None
-        self.current_photo: Optional[ImageTk.PhotoImage] = None
+        self.current_image: Optional["Image.Image"] = None
+        self.current_photo: Optional["ImageTk.PhotoImage"] = None
         self.current_page = 1
-        self.all_questions: List[Dict] = []  # 전체 문제 목록
+        self.question_store: Optional["QuestionStore"] = None  # 전체 문제 저장소
+        self.confidence = 0.0  # 표시할 문제의 최소 신뢰도
         self.page_images: List[str] = []
         self.scale_factor: Optional[float] = None
         self.original_size = (0, 0)
         self._last_canvas_size: Optional[tuple[int, int]] = None
 
-        self.boxes: List[Dict] = []  # 현재 페이지 박스들
+        self.boxes: List[List[float]] = []  # 현재 페이지 박스들
+        self.box_ids: List[int] = []  # 현재 페이지 박스들의 문제 id
         self.selected_box: Optional[int] = None
         self.drag_start: Optional[tuple[int, int]] = None
         self.resize_mode: Optional[str] = None
         self.resize_handle_size = 8
-        self.edited_boxes: Dict[int, List[Dict]] = {}  # 페이지별 편집된 박스 정보 저장
 
         self.setup_ui()
         self.bind_events()
@@ -83,33 +86,36 @@ class ImageCanvas(ttk.Frame):
         self.canvas.bind("<Configure>", self.on_canvas_resize)
         self.canvas.bind("<Motion>", self.on_mouse_move)
 
-    def load_image(self, image_path: str, page_num: int, questions: List[Dict]) -> None:
+    def load_image(self, image_path: str, page_num: int) -> None:
+        # 시작 시간을 줄이기 위해 이미지 라이브러리는 처음 표시할 때 로드
+        import cv2
+        from PIL import Image
+
+        from ..utils.page_image_store import get_page_image_store
+
         try:
-            if not Path(image_path).exists():
+            # 감지 과정에서 이미 디코딩된 페이지는 공유 저장소에서 가져옴
+            page_image = get_page_image_store().get(image_path)
+            if page_image is None:
                 raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
 
             if self.current_image is not None:
                 self.current_image.close()
                 self.current_image = None
 
-            self.current_image = Image.open(image_path).convert("RGB")
+            self.current_image = Image.fromarray(
+                cv2.cvtColor(page_image, cv2.COLOR_BGR2RGB)
+            )
             self.original_size = self.current_image.size
             self.current_page = page_num
             self.current_page_image_path = image_path
 
-            # 전체 문제 목록 저장
-            self.all_questions = questions
-
-            # 현재 페이지의 박스들만 추출
+            # 현재 페이지의 박스들만 추출 (편집된 박스는 저장소에 반영되어 있음)
             self.boxes = []
-            if page_num in self.edited_boxes:
-                # 편집된 박스 정보가 있으면 사용
-                self.boxes = self.edited_boxes[page_num].copy()
-            else:
-                # 편집된 정보가 없으면 원본 정보 사용
-                for q in self.all_questions:
-                    if q["page"] == page_num:
-                        self.boxes.append(q["box"].copy())
+            self.box_ids = []
+            if self.question_store is not None:
+                self.box_ids = self.question_store.page_ids(page_num, self.confidence)
+                self.boxes = [self.question_store.box(qid) for qid in self.box_ids]
 
             self.scale_factor = None
             self._last_canvas_size = None
@@ -120,10 +126,33 @@ class ImageCanvas(ttk.Frame):
         except Exception as e:
             pass
 
+    def show_pending_page(self, page_num: int) -> None:
+        """아직 감지되지 않은 페이지를 감지 중 상태로 표시합니다."""
+        if self.current_image is not None:
+            self.current_image.close()
+            self.current_image = None
+        self.current_photo = None
+
+        self.current_page = page_num
+        self.boxes = []
+        self.box_ids = []
+        self.selected_box = None
+
+        self.canvas.delete("all")
+        self.canvas.create_text(
+            max(self.canvas.winfo_width(), 2) // 2,
+            max(self.canvas.winfo_height(), 2) // 2,
+            text=f"페이지 {page_num} 감지 중...",
+            fill="gray",
+        )
+        self.page_label.config(text=f"페이지 {page_num}")
+
     def display_image(self) -> None:
         if self.current_image is None:
             return
 
+        from PIL import Image, ImageTk
+
         try:
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
@@ -413,8 +442,13 @@ class ImageCanvas(ttk.Frame):
 
     def on_mouse_up(self, event: Any) -> None:
         if self.selected_box is not None:
-            # 현재 페이지의 편집된 박스 정보 저장
-            self.edited_boxes[self.current_page] = [box.copy() for box in self.boxes]
+            # 편집한 박스를 문제 id로 저장소에 바로 반영
+            if self.question_store is not None and self.selected_box < len(
+                self.box_ids
+            ):
+                self.question_store.set_box(
+                    self.box_ids[self.selected_box], self.boxes[self.selected_box]
+                )
             if self.callback:
                 self.callback()
         self.drag_start = None
@@ -469,38 +503,11 @@ class ImageCanvas(ttk.Frame):
         self.scale_factor = None
         self.display_image()
 
-    def get_modified_questions(self) -> List[Dict]:
-        """편집된 문제 목록을 반환합니다."""
-        # 원본 순서를 유지하면서 편집된 박스 정보만 업데이트
-        updated_questions = []
-
-        for q in self.all_questions:
-            page_num = q["page"]
-            updated_q = q.copy()
-
-            # 편집된 박스 정보가 있는지 확인
-            if page_num in self.edited_boxes:
-                # 현재 페이지의 문제들 중에서 해당 문제의 인덱스 찾기
-                current_page_questions = [
-                    q2 for q2 in self.all_questions if q2["page"] == page_num
-                ]
-                question_index = current_page_questions.index(q)
-
-                # 편집된 박스 정보가 있으면 사용
-                if question_index < len(self.edited_boxes[page_num]):
-                    updated_q["box"] = self.edited_boxes[page_num][
-                        question_index
-                    ].copy()
-
-            updated_questions.append(updated_q)
-
-        return updated_questions
-
     def show_page(self, page_num: int) -> None:
         """특정 페이지를 표시합니다."""
         if hasattr(self, "page_images") and 1 <= page_num <= len(self.page_images):
             page_image_path = self.page_images[page_num - 1]
-            self.load_image(page_image_path, page_num, self.all_questions)
+            self.load_image(page_image_path, page_num)
 
     def cleanup(self) -> None:
         """리소스 정리 작업을 수행합니다."""
@@ -520,13 +527,13 @@ class ImageCanvas(ttk.Frame):
 
             # 변수 초기화
             self.boxes = []
+            self.box_ids = []
             self.selected_box = None
             self.drag_start = None
             self.resize_mode = None
             self.scale_factor = None
             self.original_size = (0, 0)
             self._last_canvas_size = None
-            self.edited_boxes = {}
 
         except Exception as e:
             # 정리 작업 중 오류가 발생해도 무시
@@ -2,20 +2,29 @@
 메인 윈도우 클래스
 """
 
-import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, List, Optional
-
-import cv2
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ..config.settings import get_processing_settings
-from ..utils.pdf_generator import PDFGenerator
-from ..utils.question_detector import QuestionDetector
+from ..utils.job_manager import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_FAILED,
+    Job,
+    JobManager,
+    JobSnapshot,
+)
 from .canvas_widget import ImageCanvas
 from .settings_panel import SettingsPanel
 
+if TYPE_CHECKING:
+    # 감지/내보내기 모듈은 numpy, OpenCV 등을 불러오므로 처음 사용할 때 로드
+    from ..utils.pdf_generator import PDFGenerator
+    from ..utils.question_detector import QuestionDetector
+    from ..utils.question_store import QuestionStore
+
 
 class MainWindow:
     def __init__(self, root: Any, config: Optional[Any] = None) -> None:
@@ -36,13 +45,29 @@ class MainWindow:
         self.root.minsize(800, 600)
 
         self.current_pdf_path: Optional[str] = None
-        self.questions: List[Dict] = []
+        # 신뢰도 하한으로 감지한 전체 결과와 편집 내용 (감지를 시작할 때 생성)
+        self.detections: Optional["QuestionStore"] = None
         self.page_images: List[str] = []
+        # 문제가 없는 페이지로 보고 감지를 건너뛴 페이지 (페이지 번호 → 이유)
+        self.skipped_pages: Dict[int, str] = {}
         self.temp_output = ""
         self.processed = False
 
-        self.detector: Optional[QuestionDetector] = None
-        self.pdf_generator: Optional[PDFGenerator] = None
+        self.detector: Optional["QuestionDetector"] = None
+        self.pdf_generator: Optional["PDFGenerator"] = None
+
+        # 감지/분할 작업 (상태 스냅샷은 Tk 스레드로 전달하여 처리)
+        self.job_manager = JobManager(
+            max_workers=2,
+            listener=lambda snapshot: self.root.after(
+                0, lambda: self._on_job_update(snapshot)
+            ),
+        )
+        self._detect_job: Optional[Job] = None
+        self._split_job: Optional[Job] = None
+        self.split_output_dir = ""
+        # 현재 감지 결과가 의존하는 입력과 설정 (QuestionDetector.detection_signature)
+        self._detection_signature: Optional[Tuple[str, str, int, float]] = None
 
         self.setup_ui()
         self.setup_menu()
@@ -83,9 +108,7 @@ class MainWindow:
         canvas_title = ttk.Label(canvas_title_frame, text="이미지 미리보기 및 편집")
         canvas_title.pack(anchor=tk.W)
 
-        self.image_canvas = ImageCanvas(
-            canvas_frame, self.on_canvas_modified, self.show_page
-        )
+        self.image_canvas = ImageCanvas(canvas_frame, page_callback=self.show_page)
         self.image_canvas.pack(fill=tk.BOTH, expand=True)
 
         # 캔버스에 페이지 이미지 목록 전달
@@ -115,28 +138,35 @@ class MainWindow:
         self.split_btn = ttk.Button(
             button_frame, text="문제 분할", command=self.split_questions
         )
-        self.split_btn.pack(side=tk.LEFT)
+        self.split_btn.pack(side=tk.LEFT, padx=(0, 5))
+
+        self.cancel_btn = ttk.Button(
+            button_frame, text="취소", command=self.cancel_jobs
+        )
+        self.cancel_btn.pack(side=tk.LEFT)
 
-        # 첫 번째 모델 자동 로드
-        self._initialize_first_model()
+        # 첫 번째 모델 자동 로드 (창이 먼저 표시되도록 이벤트 루프 시작 후 실행)
+        self.root.after_idle(self._initialize_first_model)
 
     def _initialize_first_model(self) -> None:
         """첫 번째 모델을 자동으로 로드합니다."""
         try:
-            # models 폴더에서 첫 번째 .pt 파일 찾기
-            from ..utils.model_utils import get_model_directory
+            # models 폴더에서 첫 번째 모델 파일 찾기
+            from ..utils.model_utils import get_model_directory, list_model_files
 
             models_dir = get_model_directory()
 
             if models_dir.exists():
-                pt_files = list(models_dir.glob("*.pt"))
-                if pt_files:
-                    first_model = pt_files[0].name
+                model_files = list_model_files(models_dir)
+                if model_files:
+                    first_model = model_files[0].name
 
-                    # detector 생성
+                    # detector 생성 (모델 로드와 워밍업은 백그라운드에서 진행)
                     from ..utils.question_detector import QuestionDetector
 
-                    self.detector = QuestionDetector(first_model)
+                    self.detector = QuestionDetector(
+                        first_model, load_in_background=True
+                    )
 
                     # settings_panel의 detector 참조 업데이트
                     self.settings_panel.detector = self.detector
@@ -144,10 +174,13 @@ class MainWindow:
                     # 설정 패널의 모델 선택 업데이트
                     self.settings_panel.selected_model_var.set(first_model)
 
-                    # 설정 패널의 모델 정보 즉시 업데이트
+                    # 설정 패널에 로드 중 상태 표시, 완료되면 갱신
                     self.settings_panel.update_model_info()
+                    self.detector.ready.add_done_callback(
+                        lambda _: self.root.after(0, self._on_model_ready)
+                    )
                 else:
-                    print("models 폴더에 .pt 파일이 없습니다.")
+                    print("models 폴더에 모델 파일이 없습니다.")
             else:
                 print("models 폴더를 찾을 수 없습니다.")
         except Exception as e:
@@ -156,6 +189,19 @@ class MainWindow:
 
             traceback.print_exc()
 
+    def _on_model_ready(self) -> None:
+        """백그라운드 모델 로드가 끝나면 설정 패널과 상태 표시를 갱신합니다."""
+        self.settings_panel.update_model_info()
+
+        if self.detector is None or not self.detector.ready.done():
+            return
+
+        error = self.detector.ready.exception()
+        if error is not None:
+            self.progress_var.set(f"모델 로드 실패: {error}")
+        elif not self.detector.ready.result():
+            self.progress_var.set("모델을 변경할 수 없습니다. 이전 모델을 사용합니다.")
+
     def setup_menu(self) -> None:
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -184,6 +230,7 @@ class MainWindow:
         if file_path:
             self.current_pdf_path = file_path
             self.progress_var.set(f"선택된 파일: {Path(file_path).name}")
+            self._invalidate_results(self.settings_panel.get_settings())
             self.update_ui_state()
 
     def on_settings_changed(self) -> None:
@@ -192,119 +239,307 @@ class MainWindow:
         selected_model = settings.get("selected_model")
 
         if selected_model and selected_model != "모델 없음":
-            # detector가 없으면 생성
+            ready = None
+
+            # detector가 없으면 선택된 모델로 생성 (백그라운드에서 로드)
             if not hasattr(self, "detector") or self.detector is None:
                 from ..utils.question_detector import QuestionDetector
 
-                self.detector = QuestionDetector()
+                self.detector = QuestionDetector(
+                    selected_model, load_in_background=True
+                )
                 # settings_panel의 detector 참조 업데이트
                 self.settings_panel.detector = self.detector
+                ready = self.detector.ready
 
-            # 현재 로드된 모델과 다른 경우 모델 변경
-            current_model_info = self.detector.get_model_info()
-            if current_model_info["name"] != selected_model:
-                success = self.detector.change_model(selected_model)
-                if success:
-                    # 설정 패널의 모델 정보 즉시 업데이트
-                    self.settings_panel.update_model_info()
+            # 현재 모델(또는 로드 중인 모델)과 다른 경우 백그라운드에서 모델 변경
+            elif self.detector.get_model_info()["name"] != selected_model:
+                ready = self.detector.change_model_async(selected_model)
 
-        self.processed = False
+            if ready is not None:
+                # 설정 패널에 로드 중 상태 표시, 완료되면 갱신
+                self.settings_panel.update_model_info()
+                ready.add_done_callback(
+                    lambda _: self.root.after(0, self._on_model_ready)
+                )
+
+        self._invalidate_results(settings)
         self.update_ui_state()
 
-    def on_canvas_modified(self) -> None:
-        """캔버스에서 박스가 편집되었을 때 호출됩니다."""
-        if hasattr(self, "image_canvas") and self.image_canvas:
-            modified_questions = self.image_canvas.get_modified_questions()
-            if modified_questions:
-                self.questions = modified_questions
+    def _current_detection_signature(
+        self, settings: Dict[str, Any]
+    ) -> Optional[Tuple[str, str, int, float]]:
+        """현재 PDF와 설정으로 감지하면 얻을 결과의 의존 정보를 반환합니다."""
+        if self.detector is None or not self.current_pdf_path:
+            return None
+        return self.detector.detection_signature(
+            self.current_pdf_path, settings["dpi"], settings["confidence"]
+        )
+
+    def _invalidate_results(self, settings: Dict[str, Any]) -> None:
+        """바뀐 설정에 의존하는 결과만 무효화합니다.
+
+        감지 결과가 의존하는 설정(PDF, 모델, 감지 DPI, 신뢰도 하한)이 그대로면
+        바뀐 신뢰도로 결과를 다시 거르기만 합니다. 출력 형식, 그룹 크기, 셔플 시드는
+        분할할 때 적용되므로 감지 결과에 영향을 주지 않습니다.
+        """
+        if (
+            self._detection_signature is None
+            or self._detection_signature != self._current_detection_signature(settings)
+        ):
+            self.processed = False
+            return
+
+        self._apply_confidence(settings["confidence"])
+        # 다른 설정으로 바꿨다가 되돌린 경우에도 감지를 다시 하지 않음
+        self.processed = (
+            self._detect_job is not None
+            and self._detect_job.snapshot.status == JOB_DONE
+        )
+
+    def _apply_confidence(self, confidence: float) -> None:
+        """저장된 감지 결과를 신뢰도로 다시 걸러 표시합니다 (편집한 박스는 항상 표시)."""
+        if self.detections is None or self.image_canvas.confidence == confidence:
+            return
+
+        self.image_canvas.confidence = confidence
+        self.progress_var.set(
+            f"신뢰도 {confidence:.1f}: {self._question_count()}개 문제"
+        )
+        current_page = self.image_canvas.current_page
+        if 1 <= current_page <= len(self.page_images):
+            self.show_page(current_page)
+
+    def _question_count(self) -> int:
+        """현재 신뢰도로 보이는 문제 수를 반환합니다."""
+        if self.detections is None:
+            return 0
+        return self.detections.count(self.image_canvas.confidence)
+
+    def _current_questions(self) -> List[Dict]:
+        """현재 신뢰도로 보이는 (편집이 반영된) 문제 목록을 반환합니다."""
+        if self.detections is None:
+            return []
+        return self.detections.to_questions(self.image_canvas.confidence)
 
     def detect_questions(self) -> None:
         if not self.current_pdf_path:
             messagebox.showwarning("경고", "PDF 파일을 먼저 선택하세요.")
             return
 
-        thread = threading.Thread(target=self._detect_questions_thread)
-        thread.daemon = True
-        thread.start()
+        # 같은 PDF를 이미 감지 중이면 새로 시작하지 않음
+        pdf_path = self.current_pdf_path
+        key = f"detect:{Path(pdf_path).resolve()}"
+        running = self.job_manager.get(key)
+        if running is not None and not running.snapshot.finished:
+            self.progress_var.set("이미 이 PDF의 문제를 감지하고 있습니다.")
+            return
 
-    def _detect_questions_thread(self) -> None:
-        try:
-            self.root.after(0, self._start_progress)
-            self.root.after(
-                0, lambda: self._update_progress(5, "PDF 파일을 분석 중입니다...")
-            )
+        # 다른 PDF의 감지는 취소 (결과는 더 이상 표시되지 않음)
+        if self._detect_job is not None:
+            self._detect_job.cancel()
+
+        # 이전 결과 초기화 (새 결과는 감지가 끝난 페이지부터 채워짐)
+        self._reset_detection_results()
+
+        # Tk 변수는 Tk 스레드에서 미리 읽어 작업에 전달
+        settings = self.settings_panel.get_settings()
+
+        from ..utils.question_detector import QuestionDetector
 
-            if self.current_pdf_path is None:
-                raise FileNotFoundError("PDF 파일이 선택되지 않았습니다.")
-            
-            if not Path(self.current_pdf_path).exists():
-                raise FileNotFoundError(
-                    f"PDF 파일을 찾을 수 없습니다: {self.current_pdf_path}"
+        if self.detector is None:
+            # 선택된 모델로 초기화 (모델 로드는 감지 작업이 기다림)
+            selected_model = settings.get("selected_model")
+            if selected_model and selected_model != "모델 없음":
+                self.detector = QuestionDetector(
+                    selected_model, load_in_background=True
                 )
+            else:
+                self.detector = QuestionDetector(load_in_background=True)
+            self.settings_panel.detector = self.detector
+
+        # 신뢰도 하한으로 감지하여, 이후 신뢰도 변경은 다시 감지하지 않고 거르기만 함
+        detector = self.detector
+        self._detection_signature = self._current_detection_signature(settings)
+        confidence = detector.inference_confidence(settings["confidence"])
+
+        self._detect_job = self.job_manager.submit(
+            key,
+            lambda job: self._detect_questions_job(
+                job, detector, pdf_path, settings["dpi"], confidence
+            ),
+        )
+        self._start_progress()
+        self.update_ui_state()
 
-            if self.detector is None:
-                # 선택된 모델로 초기화
-                settings = self.settings_panel.get_settings()
-                selected_model = settings.get("selected_model")
+    def _detect_questions_job(
+        self,
+        job: Job,
+        detector: "QuestionDetector",
+        pdf_path: str,
+        dpi: int,
+        confidence: float,
+    ) -> None:
+        """작업 스레드에서 문제를 감지합니다. 결과는 페이지별로 Tk 스레드에 전달합니다."""
+        job.report(5, "PDF 파일을 분석 중입니다...")
 
-                if selected_model and selected_model != "모델 없음":
-                    self.detector = QuestionDetector(selected_model)
-                else:
-                    self.detector = QuestionDetector()
+        if not Path(pdf_path).exists():
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+
+        from ..utils.page_image_store import get_page_image_store
+
+        job.report(10, "모델을 로드 중입니다...")
 
-                model_info = self.detector.get_model_info()
+        import tempfile
+
+        self.temp_output = tempfile.mkdtemp()
+
+        # 페이지별 결과는 Tk 스레드에서 목록에 추가하여 바로 표시/편집 가능하게 함
+        def page_callback(
+            page_num: int, page_questions: List[Dict], page_image: Optional[str]
+        ) -> None:
+            self.root.after(
+                0,
+                lambda: self._on_page_detected(
+                    job.job_id, page_num, page_questions, page_image
+                ),
+            )
 
+        def skip_callback(page_num: int, reason: str) -> None:
             self.root.after(
-                0, lambda: self._update_progress(10, "모델을 로드 중입니다...")
+                0, lambda: self._on_page_skipped(job.job_id, page_num, reason)
             )
 
-            settings = self.settings_panel.get_settings()
+        # 이전 실행의 페이지 이미지 해제
+        get_page_image_store().clear()
+
+        # 감지가 끝나기 전에도 모든 페이지로 이동할 수 있도록 페이지 수를 먼저 전달
+        import fitz  # PyMuPDF
+
+        with fitz.open(pdf_path) as doc:
+            total_pages = len(doc)
+        self.root.after(0, lambda: self._prepare_pages(job.job_id, total_pages))
+
+        # 문제 이미지는 분할할 때 원본 PDF에서 렌더링하므로 감지 중에는 저장하지 않음
+        detector.process_pdf(
+            pdf_path,
+            self.temp_output,
+            dpi,
+            confidence,
+            job.report,
+            page_callback=page_callback,
+            cancel_token=job.token,
+            save_question_images=False,
+            skip_callback=skip_callback,
+        )
+
+    def _reset_detection_results(self) -> None:
+        """이전 감지 결과와 편집 내용을 초기화합니다."""
+        from ..utils.question_store import QuestionStore
 
-            import tempfile
+        self.detections = QuestionStore()
+        self.page_images = []
+        self.skipped_pages = {}
+        self.processed = False
 
-            self.temp_output = tempfile.mkdtemp()
+        self.image_canvas.page_images = self.page_images
+        self.image_canvas.question_store = self.detections
+        self.image_canvas.confidence = self.settings_panel.get_settings()["confidence"]
+        self.update_ui_state()
 
-            def progress_callback(progress: int, message: str) -> None:
-                self.root.after(0, lambda: self._update_progress(progress, message))
+    def _is_current_detect_job(self, job_id: int) -> bool:
+        """취소되거나 대체된 감지 작업의 늦게 도착한 결과인지 확인합니다."""
+        return self._detect_job is not None and self._detect_job.job_id == job_id
 
-            if self.current_pdf_path is not None:
-                self.questions, self.page_images = self.detector.process_pdf(
-                    self.current_pdf_path,
-                    self.temp_output,
-                    settings["dpi"],
-                    settings["confidence"],
-                    progress_callback,
-                )
+    def _prepare_pages(self, job_id: int, total_pages: int) -> None:
+        """감지 전 페이지 자리를 만들고 첫 페이지를 (감지 중 상태로) 표시합니다."""
+        if not self._is_current_detect_job(job_id):
+            return
 
-            # 캔버스에 페이지 이미지 목록 업데이트
-            self.image_canvas.page_images = self.page_images
+        self.page_images = [""] * total_pages
+        self.image_canvas.page_images = self.page_images
+        if total_pages:
+            self.show_page(1)
+
+    def _on_page_skipped(self, job_id: int, page_num: int, reason: str) -> None:
+        """문제가 없는 페이지로 보고 감지를 건너뛴 페이지를 기록합니다."""
+        if self._is_current_detect_job(job_id):
+            self.skipped_pages[page_num] = reason
+
+    def _on_page_detected(
+        self,
+        job_id: int,
+        page_num: int,
+        page_questions: List[Dict],
+        page_image: Optional[str],
+    ) -> None:
+        """한 페이지의 감지가 끝나면 결과를 추가하고, 보고 있는 페이지면 표시합니다."""
+        if not self._is_current_detect_job(job_id) or self.detections is None:
+            return
 
-            self.processed = True
+        # 페이지가 우선순위에 따라 순서 없이 도착해도 저장소는 페이지별로 색인
+        self.detections.add_questions(page_questions)
+        if page_image and page_num <= len(self.page_images):
+            self.page_images[page_num - 1] = page_image
+
+        if page_num == self.image_canvas.current_page:
+            self.show_page(page_num)
+
+    def _on_job_update(self, snapshot: JobSnapshot) -> None:
+        """작업 상태 스냅샷을 진행률과 완료 처리에 반영합니다 (Tk 스레드)."""
+        if self._detect_job is not None and snapshot.job_id == self._detect_job.job_id:
+            action = "문제 감지"
+        elif self._split_job is not None and snapshot.job_id == self._split_job.job_id:
+            action = "문제 분할"
+        else:
+            # 대체된 작업의 스냅샷
+            return
 
-            self.root.after(0, self._stop_progress)
-            self.root.after(
-                0,
-                lambda: self.progress_var.set(
-                    f"문제 감지 완료: {len(self.questions)}개 문제 발견"
-                ),
+        if not snapshot.finished:
+            self._update_progress(snapshot.progress, snapshot.message)
+            return
+
+        self._stop_progress()
+        if snapshot.status == JOB_DONE:
+            if action == "문제 감지":
+                self._on_detection_finished()
+            else:
+                self._on_split_finished(snapshot.result)
+        elif snapshot.status == JOB_CANCELLED:
+            self.progress_var.set(f"{action}이(가) 취소되었습니다.")
+        elif snapshot.status == JOB_FAILED:
+            self.progress_var.set(f"{action} 실패")
+            messagebox.showerror(
+                "오류", f"{action} 중 오류가 발생했습니다:\n{snapshot.error}"
             )
-            self.root.after(0, self.update_ui_state)
+        self.update_ui_state()
 
-            if self.page_images:
-                self.root.after(200, lambda: self.show_page(1))
+    def _on_detection_finished(self) -> None:
+        """모든 페이지의 감지가 끝나면 분할을 활성화합니다."""
+        # 감지 중에 모델이나 DPI를 바꿨으면 다시 감지해야 함
+        settings = self.settings_panel.get_settings()
+        if self._detection_signature != self._current_detection_signature(settings):
+            self.progress_var.set("감지 중에 설정이 바뀌었습니다. 다시 감지하세요.")
+            return
 
-        except Exception as e:
-            error_msg = str(e)
-            self.root.after(0, self._stop_progress)
-            self.root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "오류", f"문제 감지 중 오류가 발생했습니다:\n{error_msg}"
-                ),
+        self.processed = True
+        count = self._question_count()
+        message = f"문제 감지 완료: {count}개 문제 발견"
+        if self.skipped_pages:
+            skipped = ", ".join(
+                f"{page_num}({reason})"
+                for page_num, reason in sorted(self.skipped_pages.items())
             )
+            message += f" / 건너뛴 페이지: {skipped}"
+        self.progress_var.set(message)
+
+    def cancel_jobs(self) -> None:
+        """진행 중인 감지/분할 작업을 취소합니다."""
+        self.job_manager.cancel_all()
+        self.update_ui_state()
 
     def split_questions(self) -> None:
-        if not self.processed or not self.questions:
+        if not self.processed or not self._question_count():
             messagebox.showwarning("경고", "먼저 문제 감지를 실행하세요.")
             return
 
@@ -319,194 +554,77 @@ class MainWindow:
         if not output_dir:
             return
 
-        thread = threading.Thread(
-            target=self._split_questions_thread, args=(output_dir,)
-        )
-        thread.daemon = True
-        thread.start()
-
-    def _split_questions_thread(self, output_dir: str) -> None:
-        try:
-            self.root.after(0, self._start_progress)
-            self.root.after(
-                0, lambda: self._update_progress(10, "문제 분할을 시작합니다...")
-            )
-
-            if self.pdf_generator is None:
-                self.pdf_generator = PDFGenerator()
-
-            settings = self.settings_panel.get_settings()
-            output_formats = settings["output_formats"]
-
-            created_files = []
-
-            # 개별 이미지 생성
-            individual_images = None
-            if any(
-                [
-                    output_formats["개별 이미지"],
-                    output_formats["개별 PDF"],
-                    output_formats["그룹 PDF"],
-                ]
-            ):
-                self.root.after(
-                    0, lambda: self._update_progress(20, "개별 이미지 생성 중...")
-                )
-                # 임시 폴더에 이미지 생성
-                temp_images_dir = Path(output_dir) / "temp_images"
-                temp_images_dir.mkdir(exist_ok=True)
-                individual_images = self._regenerate_question_images(
-                    str(temp_images_dir)
-                )
-
-            self.root.after(
-                0, lambda: self._update_progress(30, "개별 이미지 생성 중...")
-            )
-            if output_formats["개별 이미지"]:
-                # 개별 이미지 폴더 생성
-                images_dir = Path(output_dir) / "개별_이미지"
-                images_dir.mkdir(exist_ok=True)
-                # 임시 이미지들을 개별 이미지 폴더로 복사
-                if individual_images is not None:
-                    for i, img_path in enumerate(individual_images):
-                        import shutil
-
-                        new_path = images_dir / f"문제_{i+1:03d}.png"
-                        shutil.copy2(img_path, new_path)
-                        created_files.append(str(new_path))
-
-            self.root.after(0, lambda: self._update_progress(40, "개별 PDF 생성 중..."))
-            if output_formats["개별 PDF"]:
-                # 개별 PDF 폴더 생성
-                pdfs_dir = Path(output_dir) / "개별_PDF"
-                pdfs_dir.mkdir(exist_ok=True)
-                # 개별 PDF 생성
-                pdf_files = []
-                if individual_images is not None:
-                    pdf_files = self.pdf_generator.create_individual_pdfs(
-                        individual_images, str(pdfs_dir)
-                    )
-                created_files.extend(pdf_files)
-
-            self.root.after(0, lambda: self._update_progress(60, "그룹 PDF 생성 중..."))
-            if output_formats["그룹 PDF"]:
-                # 그룹 PDF 폴더 생성
-                groups_dir = Path(output_dir) / "그룹_PDF"
-                groups_dir.mkdir(exist_ok=True)
-                # 그룹 생성 및 PDF 생성
-                groups = []
-                if individual_images is not None:
-                    groups = self.pdf_generator.group_questions(
-                        individual_images, settings["group_size"]
-                    )
-                group_files = self.pdf_generator.create_grouped_pdfs(
-                    groups, str(groups_dir)
-                )
-                created_files.extend(group_files)
-
-            self.root.after(
-                0, lambda: self._update_progress(80, "전체 문제집 생성 중...")
-            )
-            if output_formats["전체 문제집"]:
-                workbook_path = Path(output_dir) / "전체_문제집.pdf"
-                self.pdf_generator.create_exam_workbook(
-                    self.questions, {}, str(workbook_path)
-                )
-                created_files.append(str(workbook_path))
-
-            self.root.after(
-                0, lambda: self._update_progress(90, "셔플 문제집 생성 중...")
-            )
-            if output_formats.get("셔플 문제집", False):
-                shuffled_path = Path(output_dir) / "셔플_문제집.pdf"
-                self.pdf_generator.create_shuffled_workbook(
-                    self.questions, {}, str(shuffled_path), settings.get("shuffle_seed")
-                )
-                created_files.append(str(shuffled_path))
-
-            # 임시 폴더 정리
-            if individual_images:
-                import shutil
-
-                temp_images_dir = Path(output_dir) / "temp_images"
-                if temp_images_dir.exists():
-                    shutil.rmtree(temp_images_dir)
+        settings = self.settings_panel.get_settings()
 
-            self.root.after(0, self._stop_progress)
-            self.root.after(
-                0,
-                lambda: self.progress_var.set(
-                    f"문제 분할 완료: {len(created_files)}개 파일 생성"
-                ),
-            )
+        # 작업 중에 편집되어도 분할 결과가 바뀌지 않도록 현재 목록을 복사하여 전달
+        questions = self._current_questions()
+        page_images = list(self.page_images)
+        pdf_path = self.current_pdf_path
+        self.split_output_dir = output_dir
+
+        self._split_job = self.job_manager.submit(
+            f"split:{Path(output_dir).resolve()}",
+            lambda job: self._split_questions_job(
+                job, questions, page_images, pdf_path, output_dir, settings
+            ),
+        )
+        self._start_progress()
+        self.update_ui_state()
 
-            messagebox.showinfo(
-                "완료",
-                f"문제 분할이 완료되었습니다!\n생성된 파일: {len(created_files)}개\n저장 위치: {output_dir}",
-            )
+    def _split_questions_job(
+        self,
+        job: Job,
+        questions: List[Dict],
+        page_images: List[str],
+        pdf_path: Optional[str],
+        output_dir: str,
+        settings: Dict[str, Any],
+    ) -> List[str]:
+        """작업 스레드에서 문제를 내보내고 생성된 파일 목록을 반환합니다."""
+        from ..utils.pdf_generator import PDFGenerator
+        from ..utils.question_exporter import QuestionExporter
+
+        if self.pdf_generator is None:
+            self.pdf_generator = PDFGenerator()
+
+        exporter = QuestionExporter(self.pdf_generator)
+        return exporter.export(
+            questions,
+            page_images,
+            output_dir,
+            settings["output_formats"],
+            settings["group_size"],
+            settings.get("shuffle_seed"),
+            job.report,
+            pdf_path=pdf_path,
+            dpi=settings["dpi"],
+            vector_pdf=settings["vector_pdf"],
+            cancel_token=job.token,
+        )
 
-        except Exception as e:
-            error_msg = str(e)
-            self.root.after(0, self._stop_progress)
-            self.root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "오류", f"문제 분할 중 오류가 발생했습니다:\n{error_msg}"
-                ),
-            )
+    def _on_split_finished(self, created_files: List[str]) -> None:
+        """분할이 끝나면 결과를 알립니다."""
+        self.progress_var.set(f"문제 분할 완료: {len(created_files)}개 파일 생성")
+        messagebox.showinfo(
+            "완료",
+            f"문제 분할이 완료되었습니다!\n생성된 파일: {len(created_files)}개\n저장 위치: {self.split_output_dir}",
+        )
 
     def show_page(self, page_num: int) -> None:
         """특정 페이지를 표시합니다."""
         if 1 <= page_num <= len(self.page_images):
-            page_image_path = self.page_images[page_num - 1]
-            # 전체 문제 목록을 전달
-            self.image_canvas.load_image(page_image_path, page_num, self.questions)
-
-    def _regenerate_question_images(self, output_dir: str) -> List[str]:
-        """편집된 박스 정보를 사용하여 개별 문제 이미지를 재생성합니다."""
-        import os
-
-        question_images: List[str] = []
-
-        for i, question in enumerate(self.questions):
-            try:
-                # 원본 페이지 이미지 로드
-                page_image_path = self.page_images[question["page"] - 1]
-                img = cv2.imread(page_image_path)
-                if img is None:
-                    continue
-
-                h, w = img.shape[:2]
-
-                # 편집된 박스 좌표를 픽셀 좌표로 변환
-                x1 = int(question["box"][0] * w)
-                y1 = int(question["box"][1] * h)
-                x2 = int(question["box"][2] * w)
-                y2 = int(question["box"][3] * h)
-
-                # 경계 확인
-                x1 = max(0, x1)
-                y1 = max(0, y1)
-                x2 = min(w, x2)
-                y2 = min(h, y2)
-
-                # 문제 영역 추출
-                question_img = img[y1:y2, x1:x2]
-
-                # 개별 이미지 저장
-                question_img_path = os.path.join(
-                    output_dir, f"question_{question['page']}_{i+1}.png"
-                )
-                cv2.imwrite(question_img_path, question_img)
-
-                question_images.append(question_img_path)
+            # 감지 중이면 보고 있는 페이지와 이웃 페이지를 먼저 처리
+            if not self.processed and self.detector is not None:
+                self.detector.prioritize_pages([page_num, page_num + 1, page_num - 1])
 
-            except Exception as e:
-                # 실패 시 기존 이미지 경로 사용
-                if "image_path" in question:
-                    question_images.append(question["image_path"])
+            page_image_path = self.page_images[page_num - 1]
+            if not page_image_path:
+                # 아직 감지되지 않은 페이지
+                self.image_canvas.show_pending_page(page_num)
+                return
 
-        return question_images
+            # 박스는 캔버스가 문제 저장소에서 현재 신뢰도로 가져옴
+            self.image_canvas.load_image(page_image_path, page_num)
 
     def _start_progress(self) -> None:
         self.progress_bar.start()
@@ -525,8 +643,21 @@ class MainWindow:
 
     def update_ui_state(self) -> None:
         has_file = self.current_pdf_path is not None
-        self.detect_btn["state"] = "normal" if has_file else "disabled"
-        self.split_btn["state"] = "normal" if self.processed else "disabled"
+        detecting = self._is_running(self._detect_job)
+        splitting = self._is_running(self._split_job)
+        self.detect_btn["state"] = (
+            "normal" if has_file and not splitting else "disabled"
+        )
+        self.split_btn["state"] = (
+            "normal"
+            if self.processed and not detecting and not splitting
+            else "disabled"
+        )
+        self.cancel_btn["state"] = "normal" if detecting or splitting else "disabled"
+
+    @staticmethod
+    def _is_running(job: Optional[Job]) -> bool:
+        return job is not None and not job.snapshot.finished
 
     def show_settings(self) -> None:
         """설정 다이얼로그를 표시합니다."""
@@ -571,6 +702,9 @@ PDF 시험지 문제 분할 도구
     def cleanup(self) -> None:
         """리소스 정리 작업을 수행합니다."""
         try:
+            # 진행 중인 작업 취소
+            self.job_manager.shutdown()
+
             # 임시 출력 디렉토리 정리
             if hasattr(self, "temp_output") and self.temp_output:
                 import shutil
@@ -579,11 +713,21 @@ PDF 시험지 문제 분할 도구
                 if temp_path.exists():
                     shutil.rmtree(temp_path)
 
+            # 페이지 이미지 캐시 정리
+            from ..utils.page_image_store import get_page_image_store
+
+            get_page_image_store().clear()
+
             # detector 정리
             if hasattr(self, "detector") and self.detector:
                 if hasattr(self.detector, "cleanup"):
                     self.detector.cleanup()
 
+            # 모델 풀 해제
+            from ..utils.model_pool import get_model_pool
+
+            get_model_pool().clear()
+
             # pdf_generator 정리
             if hasattr(self, "pdf_generator") and self.pdf_generator:
                 if hasattr(self.pdf_generator, "cleanup"):
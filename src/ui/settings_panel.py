@@ -8,6 +8,7 @@ from tkinter import ttk
 from typing import Any, Callable, Dict, Optional
 
 from ..config.settings import get_processing_settings
+from ..utils.model_utils import list_model_files
 
 
 class SettingsPanel(ttk.LabelFrame):
@@ -30,6 +31,8 @@ class SettingsPanel(ttk.LabelFrame):
             "셔플 문제집": tk.BooleanVar(value=False),
         }
 
+        self.vector_pdf_var = tk.BooleanVar(value=default_settings.vector_pdf)
+
         self.shuffle_seed_var = tk.IntVar(value=42)
         self.use_random_seed_var = tk.BooleanVar(value=False)
 
@@ -82,6 +85,20 @@ class SettingsPanel(ttk.LabelFrame):
             )
             cb.pack(anchor=tk.W, pady=1)
 
+        ttk.Checkbutton(
+            output_frame,
+            text="PDF를 원본 벡터로 생성",
+            variable=self.vector_pdf_var,
+            command=self.on_setting_changed,
+        ).pack(anchor=tk.W, pady=(5, 1))
+
+        ttk.Label(
+            output_frame,
+            text="※ 이미지로 변환하지 않아 선명하고 파일이 작습니다",
+            font=("", 8),
+            foreground="gray",
+        ).pack(anchor=tk.W)
+
         group_frame = ttk.LabelFrame(self, text="그룹 설정", padding=3)
         group_frame.pack(fill=tk.X, pady=(0, 5))
 
@@ -182,8 +199,8 @@ class SettingsPanel(ttk.LabelFrame):
             if not models_dir.exists():
                 return
 
-            # .pt 파일들 찾기
-            model_files = list(models_dir.glob("*.pt"))
+            # 모델 파일들 찾기 (.pt, .onnx 등)
+            model_files = list_model_files(models_dir)
             model_names = [f.name for f in model_files]
 
             if not model_names:
@@ -238,7 +255,9 @@ class SettingsPanel(ttk.LabelFrame):
             if self.detector:
                 current_model_info = self.detector.get_model_info()
 
-                if (
+                if current_model_info.get("loading"):
+                    status = "로드 중 ⏳"
+                elif (
                     current_model_info["loaded"]
                     and current_model_info["name"] == selected_model
                 ):
@@ -274,6 +293,7 @@ class SettingsPanel(ttk.LabelFrame):
                 self.shuffle_seed_var.get() if self.use_random_seed_var.get() else None
             ),
             "selected_model": self.selected_model_var.get(),
+            "vector_pdf": self.vector_pdf_var.get(),
         }
 
     def cleanup(self) -> None:
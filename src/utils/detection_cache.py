@@ -0,0 +1,159 @@
+"""
+문제 감지 결과 캐시 모듈
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ..config.settings import get_app_config
+from .logger import get_logger
+
+# 캐시 형식이 바뀌면 값을 올려 이전 캐시를 무효화
+CACHE_VERSION = 1
+
+
+def file_hash(file_path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DetectionCache:
+    """PDF, 모델, DPI, 신뢰도 조합별 감지 결과를 디스크에 저장하는 캐시
+
+    같은 시험지를 다시 열거나 일괄 처리를 다시 실행할 때 렌더링과 추론을
+    건너뛸 수 있도록 정규화된 박스 목록을 JSON 파일로 보관합니다.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.logger = get_logger(__name__)
+        # 파일 경로 → (수정 시각, 크기, 해시)
+        self._hashes: Dict[str, Tuple[float, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        pdf_path: Union[str, Path],
+        model_path: Union[str, Path],
+        dpi: int,
+        confidence: float,
+        text_layer: bool = False,
+        cascade: Optional[Tuple[int, int]] = None,
+        page_filter: bool = False,
+        input_size: Optional[Tuple[int, int]] = None,
+        extract_images: bool = False,
+        layout_templates: bool = False,
+    ) -> str:
+        """감지 결과를 식별하는 캐시 키를 생성합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            model_path: 모델 파일 경로
+            dpi: 이미지 DPI
+            confidence: 감지 신뢰도
+            text_layer: 텍스트 레이어로 먼저 감지했는지 여부
+            cascade: 정밀 감지의 (DPI, 모델 입력 크기) (정밀 감지를 하지 않으면 None)
+            page_filter: 문제가 없는 페이지를 건너뛰었는지 여부
+            input_size: 페이지를 모델 입력 크기에 맞춰 렌더링했으면 그 (높이, 너비)
+            extract_images: 스캔 페이지를 렌더링 대신 내장 이미지로 디코딩했는지 여부
+            layout_templates: 레이아웃 템플릿과 일치하는 페이지에 템플릿 결과를 썼는지 여부
+
+        Returns:
+            캐시 키 (16진수 문자열)
+        """
+        key_data = {
+            "version": CACHE_VERSION,
+            "pdf": self._cached_file_hash(pdf_path),
+            "model": self._cached_file_hash(model_path),
+            "dpi": int(dpi),
+            "confidence": round(float(confidence), 4),
+            "text_layer": bool(text_layer),
+            "cascade": list(cascade) if cascade else None,
+            "page_filter": bool(page_filter),
+            "input_size": list(input_size) if input_size else None,
+            "extract_images": bool(extract_images),
+            "layout_templates": bool(layout_templates),
+        }
+        encoded = json.dumps(key_data, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 감지 결과를 반환합니다. 없거나 손상되었으면 None을 반환합니다."""
+        cache_file = self._cache_file(key)
+        if not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+            if entry.get("version") != CACHE_VERSION:
+                return None
+            return entry
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"감지 캐시를 읽을 수 없습니다 ({cache_file}): {e}")
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """감지 결과를 캐시에 저장합니다."""
+        cache_file = self._cache_file(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data = dict(entry, version=CACHE_VERSION)
+
+            # 동시에 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일 후 교체
+            temp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"감지 캐시를 저장할 수 없습니다 ({cache_file}): {e}")
+
+    def clear(self) -> None:
+        """캐시 파일을 모두 삭제합니다."""
+        if not self.cache_dir.exists():
+            return
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+
+    def _cache_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _cached_file_hash(self, file_path: Union[str, Path]) -> str:
+        """수정 시각과 크기가 같으면 이전에 계산한 해시를 재사용합니다."""
+        path = str(Path(file_path).resolve())
+        stat = os.stat(path)
+
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = file_hash(path)
+        with self._lock:
+            self._hashes[path] = (stat.st_mtime, stat.st_size, digest)
+        return digest
+
+
+# 전역 감지 캐시 인스턴스
+_detection_cache: Optional[DetectionCache] = None
+_detection_cache_lock = threading.Lock()
+
+
+def get_detection_cache() -> DetectionCache:
+    """전역 감지 캐시 인스턴스를 반환합니다."""
+    global _detection_cache
+    with _detection_cache_lock:
+        if _detection_cache is None:
+            _detection_cache = DetectionCache(get_app_config().cache_directory)
+        return _detection_cache
@@ -0,0 +1,216 @@
+"""
+백그라운드 작업 관리 모듈
+"""
+
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.exceptions import JobCancelledError
+from .logger import get_logger
+
+# 작업 상태
+JOB_RUNNING = "running"
+JOB_CANCELLING = "cancelling"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+
+class CancellationToken:
+    """작업 취소 요청을 전달하는 토큰
+
+    작업은 페이지나 항목 사이마다 raise_if_cancelled()를 호출하여 취소 요청을 확인합니다.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """취소를 요청합니다."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소가 요청되었는지 여부"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """취소가 요청되었으면 JobCancelledError를 발생시킵니다."""
+        if self._event.is_set():
+            raise JobCancelledError("작업이 취소되었습니다.")
+
+
+@dataclass(frozen=True)
+class JobSnapshot:
+    """작업 상태의 변경 불가능한 스냅샷
+
+    작업 스레드가 상태를 바꿀 때마다 새 스냅샷을 만들어 게시하므로,
+    UI 스레드는 잠금 없이 스냅샷을 읽을 수 있습니다.
+    """
+
+    job_id: int
+    key: str
+    status: str
+    progress: int = 0
+    message: str = ""
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """작업이 끝났는지(완료, 실패, 취소) 여부"""
+        return self.status in FINISHED_STATES
+
+
+class Job:
+    """JobManager가 실행하는 작업 하나"""
+
+    def __init__(
+        self,
+        job_id: int,
+        key: str,
+        listener: Optional[Callable[[JobSnapshot], None]] = None,
+    ) -> None:
+        self.token = CancellationToken()
+        self.future: "Future[Any]" = Future()
+        self._snapshot = JobSnapshot(job_id, key, JOB_RUNNING)
+        self._listener = listener
+        self._lock = threading.Lock()
+
+    @property
+    def job_id(self) -> int:
+        return self._snapshot.job_id
+
+    @property
+    def key(self) -> str:
+        return self._snapshot.key
+
+    @property
+    def snapshot(self) -> JobSnapshot:
+        """현재 상태 스냅샷"""
+        return self._snapshot
+
+    def report(self, progress: int, message: str) -> None:
+        """진행률을 게시합니다. 취소가 요청되었으면 JobCancelledError를 발생시킵니다.
+
+        progress_callback으로 그대로 넘길 수 있습니다.
+        """
+        self.token.raise_if_cancelled()
+        self._publish(progress=progress, message=message)
+
+    def cancel(self) -> None:
+        """작업 취소를 요청합니다."""
+        if self.token.cancelled or self._snapshot.finished:
+            return
+        self.token.cancel()
+        self._publish(status=JOB_CANCELLING, message="작업을 취소하는 중입니다...")
+
+    def _publish(self, **changes: Any) -> None:
+        """상태를 바꾼 새 스냅샷을 게시합니다."""
+        with self._lock:
+            if self._snapshot.finished:
+                return
+            self._snapshot = replace(self._snapshot, **changes)
+            snapshot = self._snapshot
+
+        if self._listener:
+            self._listener(snapshot)
+
+
+class JobManager:
+    """백그라운드 작업을 실행하고 취소, 중복 실행 방지를 담당하는 관리자
+
+    같은 키(예: 입력 파일)의 작업이 이미 실행 중이면 새로 실행하지 않고 기존 작업을
+    반환합니다. 작업 함수는 Job을 인자로 받아 job.token으로 취소를 확인하고
+    job.report()로 진행률을 게시합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        listener: Optional[Callable[[JobSnapshot], None]] = None,
+    ) -> None:
+        """작업 관리자를 생성합니다.
+
+        Args:
+            max_workers: 동시에 실행할 작업 수
+            listener: 스냅샷이 게시될 때마다 작업 스레드에서 호출되는 함수
+        """
+        self.listener = listener
+        self.logger = get_logger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn: Callable[[Job], Any]) -> Job:
+        """작업을 실행합니다. 같은 키의 작업이 실행 중이면 그 작업을 반환합니다.
+
+        Args:
+            key: 중복 실행을 막기 위한 작업 키
+            fn: Job을 받아 결과를 반환하는 작업 함수
+
+        Returns:
+            실행 중인(또는 새로 시작한) 작업
+        """
+        with self._lock:
+            running = self._jobs.get(key)
+            if running is not None and not running.snapshot.finished:
+                return running
+
+            job = Job(next(self._ids), key, self.listener)
+            self._jobs[key] = job
+
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, key: str) -> Optional[Job]:
+        """키에 해당하는 가장 최근 작업을 반환합니다."""
+        with self._lock:
+            return self._jobs.get(key)
+
+    def running_jobs(self) -> List[Job]:
+        """실행 중인 작업 목록을 반환합니다."""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.snapshot.finished]
+
+    def cancel(self, key: str) -> None:
+        """키에 해당하는 작업의 취소를 요청합니다."""
+        job = self.get(key)
+        if job is not None:
+            job.cancel()
+
+    def cancel_all(self) -> None:
+        """실행 중인 모든 작업의 취소를 요청합니다."""
+        for job in self.running_jobs():
+            job.cancel()
+
+    def shutdown(self) -> None:
+        """모든 작업을 취소하고 작업 스레드를 정리합니다 (끝날 때까지 기다리지 않음)."""
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> None:
+        """작업 스레드에서 작업을 실행하고 최종 스냅샷을 게시합니다."""
+        try:
+            job.token.raise_if_cancelled()
+            result = fn(job)
+            job.token.raise_if_cancelled()
+        except JobCancelledError:
+            self.logger.info(f"작업 취소됨: {job.key}")
+            job._publish(status=JOB_CANCELLED, message="작업이 취소되었습니다.")
+            job.future.set_exception(JobCancelledError("작업이 취소되었습니다."))
+        except Exception as e:
+            self.logger.error(f"작업 실패 ({job.key}): {e}")
+            job._publish(status=JOB_FAILED, error=str(e))
+            job.future.set_exception(e)
+        else:
+            job._publish(status=JOB_DONE, progress=100, result=result)
+            job.future.set_result(result)
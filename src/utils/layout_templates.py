@@ -0,0 +1,400 @@
+"""
+페이지 레이아웃 템플릿 모듈
+
+같은 양식의 시험지(예: 해마다 같은 단 구성과 여백을 쓰는 평가원 시험지, 같은 시험지의
+재출력본)는 페이지 레이아웃이 거의 같습니다. 페이지 이미지의 단 구분(세로 방향 잉크
+투영의 빈 구간)과 글 덩어리 영역으로 레이아웃 지문을 만들고, 모델로 감지한 페이지의
+지문과 감지 결과를 템플릿으로 보관합니다. 지문이 비슷한 템플릿의 문제 영역이 페이지의
+잉크와 맞으면 모델 추론 없이 템플릿의 결과를 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import cv2
+import numpy as np
+
+from ..config.settings import get_app_config
+from .logger import get_logger
+from .text_layer_detector import FOOTER_RATIO
+
+# 템플릿 파일 형식이 바뀌면 값을 올려 이전 템플릿을 무효화
+TEMPLATE_VERSION = 2
+
+# 레이아웃 분석에 쓰는 썸네일 너비 (픽셀)
+THUMBNAIL_WIDTH = 256
+
+# 종이(밝은 쪽 10% 밝기)보다 이만큼 어두운 픽셀을 잉크로 봄
+INK_CONTRAST = 40
+
+# 단 구분선, 머리글 밑줄처럼 페이지를 가로지르는 선 (페이지 크기 대비 길이)
+RULE_HEIGHT = 0.5
+RULE_WIDTH = 0.8
+
+# 글자와 줄을 글 덩어리로 합칠 때 메우는 빈 칸 (페이지 너비 대비)
+BLOCK_GAP = 0.02
+
+# 레이아웃 지문 격자 크기 (A4 세로 비율에 맞춤)
+GRID_ROWS = 48
+GRID_COLS = 34
+
+# 단 구분 지문: 이 비율 이상의 줄에 잉크가 있는 세로 칸을 본문 단으로 봄
+COLUMN_INK_RATIO = 0.02
+
+# 지문 길이 (단 구분 GRID_COLS칸 + 글 덩어리 격자)
+FINGERPRINT_SIZE = GRID_COLS + GRID_ROWS * GRID_COLS
+
+# 템플릿 문제 영역 검사 기준
+HEADER_RATIO = 0.15  # 첫 문제 영역 위라도 이 아래의 잉크는 문제 영역 밖의 본문으로 봄
+BOX_INK_RATIO = 0.005  # 각 문제 영역의 최소 잉크 비율
+UNCOVERED_INK_RATIO = 0.02  # 본문 잉크 중 문제 영역 밖에 있어도 되는 비율
+
+
+@dataclass
+class PageLayout:
+    """페이지 이미지의 레이아웃 분석 결과"""
+
+    # 단 구분과 글 덩어리로 만든 (FINGERPRINT_SIZE,) 불리언 지문
+    fingerprint: np.ndarray
+    # 선을 뺀 잉크 마스크 (썸네일 크기)
+    ink: np.ndarray
+
+    def fits(self, boxes: Sequence[Sequence[float]]) -> bool:
+        """정규화된 문제 영역들이 이 페이지의 잉크와 맞는지 확인합니다.
+
+        text_layer_detector처럼 각 문제 영역에 잉크가 있고, 본문(머리글과 하단
+        영역 제외)의 잉크가 거의 모두 문제 영역 안에 있어야 합니다.
+        """
+        h, w = self.ink.shape
+        covered = np.zeros_like(self.ink)
+        for x1, y1, x2, y2 in boxes:
+            left, right = max(0, int(x1 * w)), min(w, int(np.ceil(x2 * w)))
+            top, bottom = max(0, int(y1 * h)), min(h, int(np.ceil(y2 * h)))
+            region = self.ink[top:bottom, left:right]
+            if region.size == 0 or region.mean() < BOX_INK_RATIO:
+                return False
+            covered[top:bottom, left:right] = True
+
+        body_top = min([y1 for _, y1, _, _ in boxes] + [HEADER_RATIO])
+        body = slice(int(body_top * h), int((1 - FOOTER_RATIO) * h))
+        body_ink = np.count_nonzero(self.ink[body])
+        uncovered = np.count_nonzero(self.ink[body] & ~covered[body])
+        return bool(uncovered <= body_ink * UNCOVERED_INK_RATIO)
+
+
+def page_layout(image: np.ndarray) -> PageLayout:
+    """페이지 이미지의 레이아웃을 분석합니다.
+
+    페이지를 작은 썸네일로 줄여 단 구분선 같은 긴 선을 뺀 잉크를 구하고,
+    세로 방향 잉크 투영에서 잉크가 있는 세로 칸(단 구분)과, 글자와 줄을 합친
+    글 덩어리의 영역을 GRID_ROWS×GRID_COLS 격자에 표시하여 지문을 만듭니다.
+    본문 글자가 달라도 단 구성과 문제 배치가 같으면 비슷한 지문이 나옵니다.
+
+    Args:
+        image: 페이지 이미지 (BGR 또는 그레이스케일 배열)
+
+    Returns:
+        페이지 레이아웃 (지문과 잉크 마스크)
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    h, w = gray.shape[:2]
+    width = min(THUMBNAIL_WIDTH, w)
+    height = max(1, round(h * width / w))
+    thumbnail = cv2.resize(gray, (width, height), interpolation=cv2.INTER_AREA)
+
+    # 스캔본은 종이가 흰색이 아니므로 종이 밝기를 기준으로 잉크를 판단
+    paper = np.percentile(thumbnail, 90)
+    ink = (thumbnail < paper - INK_CONTRAST).astype(np.uint8)
+
+    # 페이지를 가로지르는 선은 레이아웃이 같아도 문제 영역 밖에 있으므로 제외
+    vertical = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (1, max(1, int(height * RULE_HEIGHT)))
+    )
+    horizontal = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (max(1, int(width * RULE_WIDTH)), 1)
+    )
+    rules = cv2.bitwise_or(
+        cv2.morphologyEx(ink, cv2.MORPH_OPEN, vertical),
+        cv2.morphologyEx(ink, cv2.MORPH_OPEN, horizontal),
+    )
+    ink[cv2.dilate(rules, np.ones((3, 3), np.uint8)) > 0] = 0
+
+    # 단 구분: 잉크가 있는 세로 칸 (여백과 단 사이의 빈 구간은 False)
+    profile = cv2.resize(
+        ink.mean(axis=0, dtype=np.float32)[None, :],
+        (GRID_COLS, 1),
+        interpolation=cv2.INTER_AREA,
+    )[0]
+    columns = profile > COLUMN_INK_RATIO
+
+    # 글 덩어리: 가까운 글자와 줄을 합친 영역의 외접 사각형
+    gap = max(1, round(width * BLOCK_GAP))
+    merged = cv2.morphologyEx(
+        ink, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (gap, gap))
+    )
+    count, _, stats, _ = cv2.connectedComponentsWithStats(merged)
+    blocks = np.zeros_like(ink)
+    for x, y, bw, bh, _ in stats[1:count]:
+        blocks[y : y + bh, x : x + bw] = 1
+    cells = cv2.resize(
+        blocks.astype(np.float32), (GRID_COLS, GRID_ROWS), interpolation=cv2.INTER_AREA
+    )
+
+    fingerprint = np.concatenate([columns, (cells > 0.5).reshape(-1)])
+    return PageLayout(fingerprint, ink.astype(bool))
+
+
+def layout_similarity(grids: np.ndarray, fingerprint: np.ndarray) -> np.ndarray:
+    """지문 배열(grids)의 각 지문과 fingerprint의 유사도를 반환합니다.
+
+    단 구분과 글 덩어리 격자의 자카드 유사도를 각각 구해 작은 쪽을 사용하므로,
+    단 구성이 다르면 글 덩어리가 비슷해도 일치로 보지 않습니다.
+    """
+    scores = []
+    for part in (slice(0, GRID_COLS), slice(GRID_COLS, FINGERPRINT_SIZE)):
+        intersection = (grids[:, part] & fingerprint[part]).sum(axis=1)
+        union = (grids[:, part] | fingerprint[part]).sum(axis=1)
+        scores.append(np.where(union > 0, intersection / np.maximum(union, 1), 1.0))
+    similarity: np.ndarray = np.minimum(scores[0], scores[1])
+    return similarity
+
+
+@dataclass
+class _TemplateSet:
+    """한 모델의 템플릿 목록 (지문은 한 배열로 모아 한 번에 비교)"""
+
+    grids: np.ndarray
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    dirty: bool = False
+
+
+class LayoutTemplateStore:
+    """모델별 레이아웃 템플릿을 메모리에 보관하고 디스크에 저장하는 저장소
+
+    템플릿은 모델 파일별로 하나의 JSON 파일에 저장되며, 처음 사용할 때 읽고
+    save()를 호출할 때 변경된 모델의 파일만 다시 씁니다. 지문의 유사도
+    (layout_similarity())가 similarity 이상이고 문제 영역이 페이지의 잉크와 맞는
+    (PageLayout.fits()) 템플릿이 있으면 일치로 봅니다.
+    """
+
+    def __init__(
+        self,
+        template_dir: Union[str, Path],
+        similarity: float = 0.85,
+        max_templates: int = 500,
+    ) -> None:
+        self.template_dir = Path(template_dir)
+        self.similarity = similarity
+        self.max_templates = max(1, max_templates)
+        self.logger = get_logger(__name__)
+        # 모델 키 → 템플릿 목록
+        self._sets: Dict[str, _TemplateSet] = {}
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def match(
+        self, model_path: Union[str, Path], layout: PageLayout, confidence: float
+    ) -> Optional[List[Dict[str, Any]]]:
+        """페이지 레이아웃과 일치하는 템플릿의 감지 결과를 반환합니다.
+
+        템플릿은 confidence 이하의 신뢰도로 감지한 것만 사용하며, 결과는
+        confidence 이상인 항목만 반환합니다. 같은 레이아웃의 템플릿이 여럿이면
+        유사도가 높은 순서로, 문제 영역이 페이지의 잉크와 맞는 첫 템플릿을 씁니다.
+
+        Args:
+            model_path: 모델 파일 경로
+            layout: page_layout()으로 분석한 페이지 레이아웃
+            confidence: 모델을 실행할 신뢰도
+
+        Returns:
+            [{"box": [...], "confidence": ...}, ...] 목록, 일치하는 템플릿이 없으면 None
+        """
+        with self._lock:
+            templates = self._get_set(model_path)
+            if not templates.entries:
+                return None
+
+            usable = np.array(
+                [entry["confidence"] <= confidence for entry in templates.entries]
+            )
+            scores = layout_similarity(templates.grids, layout.fingerprint)
+            scores[~usable] = -1.0
+
+            for index in np.argsort(-scores, kind="stable"):
+                if scores[index] < self.similarity:
+                    return None
+
+                entry = templates.entries[index]
+                detections = [
+                    {"box": list(item["box"]), "confidence": item["confidence"]}
+                    for item in entry["detections"]
+                    if item["confidence"] >= confidence
+                ]
+                if not layout.fits([item["box"] for item in detections]):
+                    continue
+
+                self._clock += 1
+                entry["used"] = self._clock
+                entry["hits"] = entry.get("hits", 0) + 1
+                templates.dirty = True
+                return detections
+            return None
+
+    def add(
+        self,
+        model_path: Union[str, Path],
+        layout: PageLayout,
+        detections: List[Dict[str, Any]],
+        confidence: float,
+    ) -> None:
+        """모델로 감지한 페이지를 템플릿으로 추가합니다.
+
+        템플릿 수가 max_templates를 넘으면 가장 오래 사용하지 않은 템플릿을 제거합니다.
+
+        Args:
+            model_path: 모델 파일 경로
+            layout: page_layout()으로 분석한 페이지 레이아웃
+            detections: 감지 결과 (box, confidence)
+            confidence: 모델을 실행한 신뢰도
+        """
+        with self._lock:
+            templates = self._get_set(model_path)
+            self._clock += 1
+            templates.entries.append(
+                {
+                    "confidence": float(confidence),
+                    "detections": [
+                        {
+                            "box": [float(v) for v in item["box"]],
+                            "confidence": float(item["confidence"]),
+                        }
+                        for item in detections
+                    ],
+                    "hits": 0,
+                    "used": self._clock,
+                }
+            )
+            templates.grids = np.vstack([templates.grids, layout.fingerprint[None, :]])
+
+            if len(templates.entries) > self.max_templates:
+                oldest = min(
+                    range(len(templates.entries)),
+                    key=lambda i: templates.entries[i]["used"],
+                )
+                del templates.entries[oldest]
+                templates.grids = np.delete(templates.grids, oldest, axis=0)
+            templates.dirty = True
+
+    def save(self) -> None:
+        """변경된 템플릿을 디스크에 저장합니다."""
+        with self._lock:
+            for key, templates in self._sets.items():
+                if templates.dirty:
+                    self._write_set(key, templates)
+                    templates.dirty = False
+
+    def clear(self) -> None:
+        """템플릿을 모두 삭제합니다."""
+        with self._lock:
+            self._sets.clear()
+            if not self.template_dir.exists():
+                return
+            for template_file in self.template_dir.glob("*.json"):
+                try:
+                    template_file.unlink()
+                except OSError:
+                    pass
+
+    def _model_key(self, model_path: Union[str, Path]) -> str:
+        """모델 파일이 교체되면 다른 템플릿을 쓰도록 수정 시각과 크기를 키에 포함합니다."""
+        path = Path(model_path).resolve()
+        stat = path.stat()
+        key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+    def _get_set(self, model_path: Union[str, Path]) -> _TemplateSet:
+        """모델의 템플릿 목록을 반환합니다 (처음이면 파일에서 읽음). 잠금 안에서 호출합니다."""
+        key = self._model_key(model_path)
+        templates = self._sets.get(key)
+        if templates is None:
+            templates = self._read_set(key)
+            self._sets[key] = templates
+        return templates
+
+    def _read_set(self, key: str) -> _TemplateSet:
+        empty = _TemplateSet(np.zeros((0, FINGERPRINT_SIZE), dtype=bool))
+        template_file = self.template_dir / f"{key}.json"
+        if not template_file.exists():
+            return empty
+
+        try:
+            with open(template_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != TEMPLATE_VERSION:
+                return empty
+
+            entries = data["templates"]
+            grids = np.array(
+                [
+                    np.unpackbits(
+                        np.frombuffer(bytes.fromhex(entry.pop("grid")), dtype=np.uint8),
+                        count=FINGERPRINT_SIZE,
+                    ).astype(bool)
+                    for entry in entries
+                ],
+                dtype=bool,
+            ).reshape(-1, FINGERPRINT_SIZE)
+            for entry in entries:
+                self._clock = max(self._clock, entry.get("used", 0))
+            return _TemplateSet(grids, entries)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(
+                f"레이아웃 템플릿을 읽을 수 없습니다 ({template_file}): {e}"
+            )
+            return empty
+
+    def _write_set(self, key: str, templates: _TemplateSet) -> None:
+        template_file = self.template_dir / f"{key}.json"
+        try:
+            self.template_dir.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": TEMPLATE_VERSION,
+                "templates": [
+                    dict(entry, grid=np.packbits(grid).tobytes().hex())
+                    for entry, grid in zip(templates.entries, templates.grids)
+                ],
+            }
+
+            # 동시에 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일 후 교체
+            temp_file = template_file.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, template_file)
+        except OSError as e:
+            self.logger.warning(
+                f"레이아웃 템플릿을 저장할 수 없습니다 ({template_file}): {e}"
+            )
+
+
+# 전역 레이아웃 템플릿 저장소 인스턴스
+_template_store: Optional[LayoutTemplateStore] = None
+_template_store_lock = threading.Lock()
+
+
+def get_layout_template_store() -> LayoutTemplateStore:
+    """전역 레이아웃 템플릿 저장소 인스턴스를 반환합니다."""
+    global _template_store
+    with _template_store_lock:
+        if _template_store is None:
+            config = get_app_config()
+            _template_store = LayoutTemplateStore(
+                config.cache_directory / "layout_templates",
+                config.layout_template_similarity,
+                config.layout_template_max,
+            )
+        return _template_store
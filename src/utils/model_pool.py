@@ -0,0 +1,125 @@
+"""
+로드된 모델 풀 모듈
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Union
+
+from ..config.settings import get_app_config
+from .logger import get_logger
+
+
+@dataclass
+class PooledModel:
+    """풀에 보관된 모델
+
+    같은 모델을 여러 감지기가 공유할 수 있으므로 추론 잠금도 모델과 함께 보관합니다.
+    """
+
+    model: Any
+    path: str
+    size_bytes: int
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    warmed: bool = False
+
+
+class ModelPool:
+    """최근 사용한 모델을 개수와 메모리 예산 안에서 보관하는 LRU 풀
+
+    모델을 바꿨다가 다시 돌아올 때 디스크에서 다시 로드하지 않도록 합니다.
+    모델이 차지하는 메모리는 모델 파일 크기로 추정합니다.
+    """
+
+    def __init__(self, max_models: int, max_bytes: int) -> None:
+        self.max_models = max(1, max_models)
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.logger = get_logger(__name__)
+        self._models: "OrderedDict[Tuple[str, int], PooledModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 같은 모델을 동시에 두 번 로드하지 않도록 로드는 하나씩 수행
+        self._load_lock = threading.Lock()
+
+    def contains(self, model_path: Union[str, Path]) -> bool:
+        """모델이 풀에 있는지 확인합니다."""
+        with self._lock:
+            return self._key(model_path) in self._models
+
+    def get(
+        self, model_path: Union[str, Path], loader: Callable[[str], Any]
+    ) -> PooledModel:
+        """모델을 반환합니다. 풀에 없으면 loader로 로드하여 추가합니다.
+
+        Args:
+            model_path: 모델 파일 경로
+            loader: 모델 파일 경로를 받아 모델을 로드하는 함수
+
+        Returns:
+            풀에 보관된 모델
+        """
+        key = self._key(model_path)
+        with self._lock:
+            pooled = self._models.get(key)
+            if pooled is not None:
+                self._models.move_to_end(key)
+                return pooled
+
+        with self._load_lock:
+            # 기다리는 동안 다른 스레드가 로드했을 수 있음
+            with self._lock:
+                pooled = self._models.get(key)
+                if pooled is not None:
+                    self._models.move_to_end(key)
+                    return pooled
+
+            pooled = PooledModel(loader(key[0]), key[0], Path(key[0]).stat().st_size)
+            self.logger.info(f"모델 로드: {Path(key[0]).name}")
+
+            with self._lock:
+                self._models[key] = pooled
+                self.current_bytes += pooled.size_bytes
+                self._evict()
+            return pooled
+
+    def clear(self) -> None:
+        """풀을 비웁니다."""
+        with self._lock:
+            self._models.clear()
+            self.current_bytes = 0
+
+    def _key(self, model_path: Union[str, Path]) -> Tuple[str, int]:
+        """모델 파일이 교체되면 다시 로드하도록 수정 시각을 키에 포함합니다."""
+        path = Path(model_path).resolve()
+        return str(path), path.stat().st_mtime_ns
+
+    def _evict(self) -> None:
+        """개수나 예산을 초과하면 가장 오래 사용하지 않은 모델부터 제거합니다.
+
+        가장 최근에 사용한 모델은 예산보다 크더라도 남겨 둡니다.
+        """
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_models or self.current_bytes > self.max_bytes
+        ):
+            _, pooled = self._models.popitem(last=False)
+            self.current_bytes -= pooled.size_bytes
+            self.logger.info(f"모델 풀에서 제거: {Path(pooled.path).name}")
+
+
+# 전역 모델 풀 인스턴스
+_model_pool: Optional[ModelPool] = None
+_model_pool_lock = threading.Lock()
+
+
+def get_model_pool() -> ModelPool:
+    """전역 모델 풀 인스턴스를 반환합니다."""
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            config = get_app_config()
+            _model_pool = ModelPool(
+                config.model_pool_size, config.model_pool_mb * 1024 * 1024
+            )
+        return _model_pool
@@ -5,7 +5,7 @@
 import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 
 def get_model_directory() -> Path:
@@ -42,6 +42,31 @@ def get_model_path(model_name: str) -> Path:
     return model_dir / model_name
 
 
+def list_model_files(model_dir: Path) -> List[Path]:
+    """모델 폴더에서 지원하는 확장자의 모델 파일 목록을 반환합니다.
+
+    설정의 supported_extensions 순서(.pt 우선)로, 같은 확장자는 이름순으로 정렬합니다.
+    """
+    from ..config.settings import get_model_config
+
+    extensions = [ext.lower() for ext in get_model_config().supported_extensions]
+
+    model_files = [
+        path
+        for path in model_dir.glob("*")
+        if path.is_file() and path.suffix.lower() in extensions
+    ]
+    return sorted(
+        model_files,
+        key=lambda path: (extensions.index(path.suffix.lower()), path.name),
+    )
+
+
+def is_onnx_model(model_path: Union[str, Path]) -> bool:
+    """ONNX Runtime으로 실행할 모델 파일인지 확인합니다."""
+    return Path(model_path).suffix.lower() == ".onnx"
+
+
 def get_available_models() -> List[str]:
     """사용 가능한 모델 목록을 반환합니다."""
     model_dir = get_model_directory()
@@ -49,11 +74,7 @@ def get_available_models() -> List[str]:
     if not model_dir.exists():
         return []
 
-    models = []
-    for model_file in model_dir.glob("*.pt"):
-        models.append(model_file.name)
-
-    return models
+    return [model_file.name for model_file in list_model_files(model_dir)]
 
 
 def get_model_info(model_name: str) -> Optional[dict]:
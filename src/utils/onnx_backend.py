@@ -0,0 +1,330 @@
+"""
+ONNX Runtime 추론 백엔드 모듈
+
+ultralytics(및 torch) 없이 YOLO ONNX 모델을 CPU에서 실행합니다.
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+
+from .logger import get_logger
+
+# ONNX Runtime 그래프 최적화 수준 이름
+GRAPH_OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+
+
+@dataclass
+class DetectionResult:
+    """이미지 한 장의 감지 결과
+
+    data는 (N, 6) 배열(x1, y1, x2, y2, conf, cls)이며 좌표는 원본 이미지 픽셀 기준입니다.
+    """
+
+    data: np.ndarray
+    orig_shape: Tuple[int, int]
+
+
+# letterbox로 채우는 영역의 색 (ultralytics와 같음)
+LETTERBOX_COLOR = 114
+
+
+def letterbox_geometry(
+    shape: Tuple[int, int], new_shape: Tuple[int, int]
+) -> Tuple[float, Tuple[int, int], Tuple[int, int]]:
+    """비율을 유지하며 shape(높이, 너비)를 new_shape에 맞출 때의 배치를 계산합니다.
+
+    Returns:
+        (배율, (줄인 너비, 줄인 높이), (왼쪽 여백, 위쪽 여백))
+    """
+    h, w = shape
+    new_h, new_w = new_shape
+    gain = min(new_h / h, new_w / w)
+
+    resized_w, resized_h = int(round(w * gain)), int(round(h * gain))
+    left = int(round((new_w - resized_w) / 2 - 0.1))
+    top = int(round((new_h - resized_h) / 2 - 0.1))
+    return gain, (resized_w, resized_h), (left, top)
+
+
+def letterbox(
+    image: np.ndarray,
+    new_shape: Tuple[int, int],
+    color: Tuple[int, int, int] = (LETTERBOX_COLOR,) * 3,
+) -> Tuple[np.ndarray, float, Tuple[float, float]]:
+    """비율을 유지하며 이미지를 new_shape(높이, 너비)에 맞추고 남는 영역을 채웁니다.
+
+    Returns:
+        (letterbox 이미지, 배율, (왼쪽 여백, 위쪽 여백))
+    """
+    h, w = image.shape[:2]
+    new_h, new_w = new_shape
+    gain, (resized_w, resized_h), (left, top) = letterbox_geometry((h, w), new_shape)
+    if (resized_w, resized_h) != (w, h):
+        image = cv2.resize(
+            image, (resized_w, resized_h), interpolation=cv2.INTER_LINEAR
+        )
+
+    bottom = new_h - resized_h - top
+    right = new_w - resized_w - left
+    image = cv2.copyMakeBorder(
+        image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=color
+    )
+    return image, gain, (left, top)
+
+
+def non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    classes: np.ndarray,
+    iou_threshold: float,
+    max_det: int,
+) -> np.ndarray:
+    """클래스별 NMS를 수행하여 남길 박스의 인덱스를 반환합니다.
+
+    Args:
+        boxes: (N, 4) xyxy 박스
+        scores: (N,) 신뢰도
+        classes: (N,) 클래스 번호
+        iou_threshold: 같은 객체로 볼 IoU 기준
+        max_det: 최대 감지 수
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # 클래스마다 좌표를 멀리 떨어뜨려 한 번의 NMS로 클래스별 NMS를 수행
+    offsets = classes.astype(boxes.dtype)[:, None] * (boxes.max() + 1)
+    shifted = boxes + offsets
+    x1, y1, x2, y2 = shifted.T
+    areas = (x2 - x1).clip(0) * (y2 - y1).clip(0)
+
+    order = scores.argsort()[::-1]
+    keep: List[int] = []
+    while order.size and len(keep) < max_det:
+        i = order[0]
+        keep.append(int(i))
+        rest = order[1:]
+
+        inter_w = (np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest])).clip(0)
+        inter_h = (np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest])).clip(0)
+        inter = inter_w * inter_h
+        iou = inter / (areas[i] + areas[rest] - inter + 1e-7)
+        order = rest[iou <= iou_threshold]
+
+    return np.asarray(keep, dtype=np.int64)
+
+
+class OnnxYoloModel:
+    """YOLO(ultralytics 내보내기 형식) ONNX 모델을 ONNX Runtime으로 실행하는 모델
+
+    전처리(letterbox), 후처리(좌표 복원, NMS)를 직접 수행하며,
+    ultralytics YOLO 모델처럼 이미지 목록과 신뢰도를 받아 호출합니다.
+
+    지원하는 출력 형식:
+        - (B, 4 + 클래스 수, 후보 수): 기본 내보내기 (cx, cy, w, h, 클래스 점수...)
+        - (B, 최대 감지 수, 6): NMS 포함 내보내기 (x1, y1, x2, y2, conf, cls)
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        graph_optimization: str = "all",
+        iou_threshold: float = 0.7,
+        max_det: int = 300,
+    ) -> None:
+        """ONNX 모델을 로드합니다.
+
+        Args:
+            model_path: .onnx 모델 파일 경로
+            intra_op_threads: 연산 내부 병렬 스레드 수 (0이면 ONNX Runtime 기본값)
+            inter_op_threads: 연산 간 병렬 스레드 수 (0이면 ONNX Runtime 기본값)
+            graph_optimization: 그래프 최적화 수준 (disable, basic, extended, all)
+            iou_threshold: NMS IoU 기준
+            max_det: 이미지당 최대 감지 수
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError(
+                "onnxruntime 라이브러리가 설치되지 않았습니다. 'pip install onnxruntime'를 실행하세요."
+            )
+
+        if graph_optimization not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"지원하지 않는 그래프 최적화 수준입니다: {graph_optimization} "
+                f"(사용 가능: {', '.join(GRAPH_OPTIMIZATION_LEVELS)})"
+            )
+
+        self.logger = get_logger(__name__)
+        self.model_path = model_path
+        self.iou_threshold = iou_threshold
+        self.max_det = max_det
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = max(0, intra_op_threads)
+        options.inter_op_num_threads = max(0, inter_op_threads)
+        options.graph_optimization_level = {
+            "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        }[graph_optimization]
+        if inter_op_threads > 1:
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name: str = model_input.name
+        self.input_shape = self._resolve_input_shape(model_input.shape)
+        # 입력 높이/너비가 고정되지 않았으면 호출할 때 입력 크기(imgsz)를 바꿀 수 있음
+        self.dynamic_input = not (
+            len(model_input.shape) == 4
+            and isinstance(model_input.shape[2], int)
+            and isinstance(model_input.shape[3], int)
+        )
+        # 배치 차원이 고정(1)이면 이미지를 한 장씩 실행
+        self.dynamic_batch = not isinstance(model_input.shape[0], int)
+
+    def __call__(
+        self,
+        images: Union[np.ndarray, Sequence[np.ndarray]],
+        conf: float = 0.25,
+        verbose: bool = False,
+        imgsz: Optional[int] = None,
+    ) -> List[DetectionResult]:
+        """이미지(BGR 배열) 목록에서 객체를 감지합니다.
+
+        Args:
+            images: BGR 이미지 배열 또는 그 목록
+            conf: 감지 신뢰도
+            verbose: ultralytics 호환용 (사용하지 않음)
+            imgsz: 모델 입력 크기 (입력 크기가 동적인 모델에서만 적용, 32의 배수로 올림)
+
+        Returns:
+            이미지별 감지 결과 목록
+        """
+        if isinstance(images, np.ndarray):
+            images = [images]
+
+        input_shape = self.input_shape
+        if imgsz and self.dynamic_input:
+            size = -(-imgsz // 32) * 32
+            input_shape = (size, size)
+
+        results: List[DetectionResult] = []
+        step = len(images) if self.dynamic_batch else 1
+        for start in range(0, len(images), max(1, step)):
+            chunk = images[start : start + step]
+            inputs, transforms = self._preprocess(chunk, input_shape)
+            outputs = self.session.run(None, {self.input_name: inputs})[0]
+
+            for output, image, transform in zip(outputs, chunk, transforms):
+                data = self._postprocess(output, conf, transform, image.shape[:2])
+                results.append(DetectionResult(data, (image.shape[0], image.shape[1])))
+
+        return results
+
+    def _resolve_input_shape(self, shape: Sequence[Any]) -> Tuple[int, int]:
+        """모델 입력 크기(높이, 너비)를 확인합니다.
+
+        입력 크기가 동적이면 ultralytics가 기록한 메타데이터(imgsz)를, 없으면 640을 사용합니다.
+        """
+        if len(shape) == 4 and isinstance(shape[2], int) and isinstance(shape[3], int):
+            return shape[2], shape[3]
+
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        try:
+            imgsz = ast.literal_eval(metadata.get("imgsz", "[640, 640]"))
+            if isinstance(imgsz, int):
+                return imgsz, imgsz
+            return int(imgsz[0]), int(imgsz[1])
+        except (ValueError, SyntaxError, TypeError, IndexError):
+            return 640, 640
+
+    def _preprocess(
+        self,
+        images: Sequence[np.ndarray],
+        input_shape: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[np.ndarray, List[Tuple[float, Tuple[float, float]]]]:
+        """letterbox, BGR→RGB, HWC→CHW, 0-1 정규화를 한 번에 수행합니다.
+
+        여백을 채운 letterbox 이미지를 따로 만들지 않고 입력 배열의 해당 위치에
+        바로 기록합니다. 이미지가 이미 입력 크기에 맞게 렌더링되었으면
+        (render_page()의 fit) 크기 조정도 하지 않습니다.
+        """
+        input_shape = input_shape or self.input_shape
+        batch = np.full(
+            (len(images), 3, *input_shape), LETTERBOX_COLOR / 255.0, dtype=np.float32
+        )
+        transforms: List[Tuple[float, Tuple[float, float]]] = []
+
+        for i, image in enumerate(images):
+            h, w = image.shape[:2]
+            gain, (resized_w, resized_h), (left, top) = letterbox_geometry(
+                (h, w), input_shape
+            )
+            if (resized_w, resized_h) != (w, h):
+                image = cv2.resize(
+                    image, (resized_w, resized_h), interpolation=cv2.INTER_LINEAR
+                )
+
+            # BGR → RGB 채널 순서로 CHW 배열의 letterbox 위치에 기록
+            np.multiply(
+                image[:, :, ::-1].transpose(2, 0, 1),
+                1 / 255.0,
+                out=batch[i, :, top : top + resized_h, left : left + resized_w],
+            )
+            transforms.append((gain, (left, top)))
+
+        return batch, transforms
+
+    def _postprocess(
+        self,
+        output: np.ndarray,
+        conf: float,
+        transform: Tuple[float, Tuple[float, float]],
+        orig_shape: Tuple[int, int],
+    ) -> np.ndarray:
+        """모델 출력 하나를 원본 이미지 좌표의 (N, 6) 배열로 변환합니다."""
+        if output.shape[0] > output.shape[1] and output.shape[1] == 6:
+            # NMS 포함 내보내기: 이미 xyxy, conf, cls
+            detections = output[output[:, 4] >= conf]
+            boxes = detections[:, :4].copy()
+            scores = detections[:, 4]
+            classes = detections[:, 5]
+            keep = np.arange(len(detections))
+        else:
+            # (4 + 클래스 수, 후보 수) → (후보 수, 4 + 클래스 수)
+            candidates = output.T
+            class_scores = candidates[:, 4:]
+            classes = class_scores.argmax(axis=1)
+            scores = class_scores[np.arange(len(candidates)), classes]
+
+            mask = scores >= conf
+            candidates, scores, classes = candidates[mask], scores[mask], classes[mask]
+
+            # cx, cy, w, h → x1, y1, x2, y2
+            cx, cy, w, h = candidates[:, :4].T
+            boxes = np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+            keep = non_max_suppression(
+                boxes, scores, classes, self.iou_threshold, self.max_det
+            )
+
+        # letterbox 좌표 → 원본 이미지 좌표
+        gain, (pad_x, pad_y) = transform
+        boxes = boxes[keep]
+        boxes[:, [0, 2]] = ((boxes[:, [0, 2]] - pad_x) / gain).clip(0, orig_shape[1])
+        boxes[:, [1, 3]] = ((boxes[:, [1, 3]] - pad_y) / gain).clip(0, orig_shape[0])
+
+        return np.concatenate(
+            [boxes, scores[keep, None], classes[keep, None].astype(boxes.dtype)],
+            axis=1,
+        ).astype(np.float32)
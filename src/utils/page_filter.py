@@ -0,0 +1,116 @@
+"""
+문제가 없는 페이지 판별 모듈
+
+시험지 PDF에는 표지, "이 면은 여백입니다" 페이지, OMR 답안지처럼 문제가 있을 수
+없는 페이지가 섞여 있습니다. 텍스트 레이어의 키워드와 작은 썸네일의 잉크 분포만으로
+이런 페이지를 골라내어 모델 추론을 건너뜁니다.
+"""
+
+import re
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .text_layer_detector import find_question_anchors
+
+# 건너뛴 이유
+SKIP_BLANK = "빈 페이지"
+SKIP_BLANK_NOTICE = "여백 페이지"
+SKIP_COVER = "표지"
+SKIP_ANSWER_SHEET = "답안지(OMR)"
+
+# 텍스트 레이어 키워드 (공백을 지운 텍스트에서 찾음) → 건너뛴 이유
+# 문제 페이지의 안내 문구에도 나올 수 있으므로 문제가 없는 페이지에만 적용
+_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ("이면은여백입니다", SKIP_BLANK_NOTICE),
+    ("답안지", SKIP_ANSWER_SHEET),
+    ("OMR", SKIP_ANSWER_SHEET),
+    ("유의사항", SKIP_COVER),
+)
+
+# 객관식 선택지 기호 (문제 페이지에만 있음)
+_CHOICE_MARKS = "①②③④⑤"
+
+# 썸네일 너비 (픽셀)
+THUMBNAIL_WIDTH = 128
+
+# 종이(밝은 쪽 10% 밝기)보다 이만큼 어두운 픽셀을 잉크로 봄
+# (썸네일로 줄이면 가는 글자는 옅은 회색이 되므로 밝기 차이를 작게 잡음)
+INK_CONTRAST = 25
+
+# 잉크 비율이 이보다 낮으면 빈 페이지
+BLANK_INK_RATIO = 0.002
+
+# 잉크 비율이 이 이상이고 잉크의 대부분이 붉은색이면 OMR 답안지
+ANSWER_SHEET_INK_RATIO = 0.05
+ANSWER_SHEET_RED_RATIO = 0.6
+RED_CONTRAST = 30  # 빨강 채널이 초록, 파랑 채널보다 이만큼 밝으면 붉은색
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def page_skip_reason(page: Any, image: Optional[np.ndarray]) -> Optional[str]:
+    """문제가 있을 수 없는 페이지이면 그 이유를 반환합니다.
+
+    텍스트 레이어에 키워드(여백 안내, 답안지, 수험생 유의사항)가 있고 선택지 기호나
+    문제 번호가 없으면 해당 페이지로 보고, 그 밖에는 페이지 이미지를 작은 썸네일로 줄여
+    잉크가 거의 없거나(빈 페이지) 대부분 붉은 잉크인(OMR 답안지) 페이지를 찾습니다.
+
+    Args:
+        page: PyMuPDF 페이지 (None이면 텍스트 레이어를 확인하지 않음)
+        image: 렌더링된 페이지 이미지 (BGR 배열, None이면 잉크 분포를 확인하지 않음)
+
+    Returns:
+        건너뛴 이유, 문제가 있을 수 있는 페이지이면 None
+    """
+    if page is not None:
+        reason = _text_skip_reason(page)
+        if reason is not None:
+            return reason
+
+    if image is not None:
+        return _ink_skip_reason(image)
+
+    return None
+
+
+def _text_skip_reason(page: Any) -> Optional[str]:
+    """텍스트 레이어의 키워드로 건너뛸 이유를 찾습니다."""
+    text = _WHITESPACE.sub("", page.get_text("text"))
+    reason = next((reason for keyword, reason in _KEYWORDS if keyword in text), None)
+    if reason is None or any(mark in text for mark in _CHOICE_MARKS):
+        return None
+
+    # 표지의 유의사항은 번호를 매긴 목록이므로 문제 번호는 표지가 아닐 때만 확인
+    if reason != SKIP_COVER and find_question_anchors(page):
+        return None
+    return reason
+
+
+def _ink_skip_reason(image: np.ndarray) -> Optional[str]:
+    """썸네일의 잉크 분포로 건너뛸 이유를 찾습니다."""
+    h, w = image.shape[:2]
+    if w == 0 or h == 0:
+        return None
+
+    width = min(THUMBNAIL_WIDTH, w)
+    height = max(1, round(h * width / w))
+    thumbnail = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+
+    # 스캔본은 종이가 흰색이 아니므로 종이 밝기를 기준으로 잉크를 판단
+    paper = np.percentile(gray, 90)
+    ink = gray < paper - INK_CONTRAST
+    ink_count = np.count_nonzero(ink)
+    if ink_count < gray.size * BLANK_INK_RATIO:
+        return SKIP_BLANK
+
+    # OMR 답안지는 대부분 붉은 잉크로 인쇄됨
+    if ink_count >= gray.size * ANSWER_SHEET_INK_RATIO:
+        b, g, r = (thumbnail[..., i].astype(np.int16) for i in range(3))
+        red = (r - np.maximum(g, b) > RED_CONTRAST) & ink
+        if np.count_nonzero(red) >= ink_count * ANSWER_SHEET_RED_RATIO:
+            return SKIP_ANSWER_SHEET
+
+    return None
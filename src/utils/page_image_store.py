@@ -0,0 +1,104 @@
+"""
+페이지 이미지 저장소 모듈
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+from ..config.settings import get_app_config
+from .logger import get_logger
+
+
+class PageImageStore:
+    """디코딩된 페이지 이미지를 바이트 예산 안에서 보관하는 LRU 캐시
+
+    감지기, 캔버스, 내보내기가 같은 페이지 PNG를 각자 다시 디코딩하지 않도록
+    페이지 경로를 키로 BGR 배열을 공유합니다. 여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.logger = get_logger(__name__)
+        self._images: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, image_path: Union[str, Path]) -> Optional[np.ndarray]:
+        """페이지 이미지를 반환합니다. 캐시에 없으면 디스크에서 디코딩합니다.
+
+        Args:
+            image_path: 페이지 이미지 파일 경로
+
+        Returns:
+            BGR 이미지 배열 (파일을 읽을 수 없으면 None)
+        """
+        key = str(image_path)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                return image
+
+        # 디코딩은 잠금 밖에서 수행
+        image = cv2.imread(key)
+        if image is None:
+            return None
+
+        self.put(key, image)
+        return image
+
+    def put(self, image_path: Union[str, Path], image: np.ndarray) -> None:
+        """페이지 이미지를 저장소에 추가합니다."""
+        key = str(image_path)
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+
+            # 예산보다 큰 이미지는 보관하지 않음
+            if image.nbytes > self.max_bytes:
+                return
+
+            self._images[key] = image
+            self.current_bytes += image.nbytes
+            self._evict()
+
+    def discard(self, image_path: Union[str, Path]) -> None:
+        """페이지 이미지를 저장소에서 제거합니다."""
+        with self._lock:
+            old = self._images.pop(str(image_path), None)
+            if old is not None:
+                self.current_bytes -= old.nbytes
+
+    def clear(self) -> None:
+        """저장소를 비웁니다."""
+        with self._lock:
+            self._images.clear()
+            self.current_bytes = 0
+
+    def _evict(self) -> None:
+        """예산을 초과하면 가장 오래 사용하지 않은 이미지부터 제거합니다."""
+        while self.current_bytes > self.max_bytes and self._images:
+            key, image = self._images.popitem(last=False)
+            self.current_bytes -= image.nbytes
+            self.logger.debug(f"페이지 이미지 캐시에서 제거: {key}")
+
+
+# 전역 페이지 이미지 저장소 인스턴스
+_page_image_store: Optional[PageImageStore] = None
+_page_image_store_lock = threading.Lock()
+
+
+def get_page_image_store() -> PageImageStore:
+    """전역 페이지 이미지 저장소 인스턴스를 반환합니다."""
+    global _page_image_store
+    with _page_image_store_lock:
+        if _page_image_store is None:
+            max_bytes = get_app_config().page_cache_mb * 1024 * 1024
+            _page_image_store = PageImageStore(max_bytes)
+        return _page_image_store
@@ -0,0 +1,462 @@
+"""
+PDF 페이지 렌더링 모듈
+"""
+
+import threading
+from collections import deque
+from itertools import islice
+from multiprocessing import get_context, shared_memory
+from typing import Any, Deque, Generator, Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# 스캔 페이지로 보는 이미지 배치의 허용 오차 (페이지 크기 대비)
+SCAN_EDGE_TOLERANCE = 0.01
+
+# bboxlog 항목 중 화면에 보이는 내용 (투명 OCR 텍스트인 ignore-text는 제외)
+_VISIBLE_CONTENT_TYPES = (
+    "fill-text",
+    "stroke-text",
+    "fill-path",
+    "stroke-path",
+    "fill-image",
+    "fill-shade",
+)
+
+
+class PageArray(np.ndarray):
+    """PyMuPDF Pixmap 메모리를 그대로 참조하는 페이지 이미지 배열
+
+    Pixmap.samples 버퍼를 복사 없이 감싸기 때문에, 배열(또는 이 배열에서 잘라낸 뷰)이
+    살아 있는 동안 원본 Pixmap도 함께 유지되어야 합니다.
+    """
+
+    pixmap: Any = None
+
+    def __array_finalize__(self, obj: Any) -> None:
+        self.pixmap = getattr(obj, "pixmap", None)
+
+
+def pixmap_to_array(pix: Any) -> np.ndarray:
+    """Pixmap을 복사 없이 BGR 순서의 NumPy 배열로 변환합니다.
+
+    Args:
+        pix: 알파 채널이 없는 RGB Pixmap
+
+    Returns:
+        (높이, 너비, 3) 형태의 BGR 이미지 배열 (Pixmap 메모리 공유)
+    """
+    image: PageArray = np.ndarray(
+        shape=(pix.height, pix.width, pix.n),
+        dtype=np.uint8,
+        buffer=pix.samples_mv,
+        strides=(pix.stride, pix.n, 1),
+    ).view(PageArray)
+    image.pixmap = pix
+
+    # OpenCV/YOLO 입력과 같은 BGR 순서로 제자리 변환
+    cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=image)
+    return image
+
+
+def page_matrix(page: Any, dpi: int, fit: Optional[Tuple[int, int]] = None) -> Any:
+    """페이지 렌더링 변환 행렬을 반환합니다.
+
+    fit(높이, 너비)이 주어지면 dpi 대신 페이지가 비율을 유지한 채 fit 안에 꼭
+    맞는 배율을 페이지 크기에서 구합니다 (긴 쪽이 fit과 같아짐).
+    """
+    import fitz  # PyMuPDF
+
+    if fit is None:
+        zoom = dpi / 72  # DPI 변환
+    else:
+        rect = page.rect
+        zoom = min(fit[0] / rect.height, fit[1] / rect.width)
+    return fitz.Matrix(zoom, zoom)
+
+
+def render_page(
+    page: Any, dpi: int, fit: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
+    """PDF 페이지를 지정한 DPI(또는 fit 크기)의 BGR 이미지 배열로 렌더링합니다."""
+    pix = page.get_pixmap(matrix=page_matrix(page, dpi, fit), alpha=False)
+    return pixmap_to_array(pix)
+
+
+def embedded_page_image(page: Any) -> Optional[Tuple[int, int, int]]:
+    """페이지가 전체를 덮는 이미지 한 장으로만 이루어진 스캔 페이지인지 확인합니다.
+
+    회전, 마스크, 주석, 다른 보이는 내용(글자, 도형, 다른 이미지)이 없고 이미지가
+    뒤집히거나 돌아가지 않은 채 페이지 전체에 배치된 경우만 해당합니다.
+    투명 OCR 텍스트는 화면에 보이지 않으므로 허용합니다.
+
+    Args:
+        page: PyMuPDF 페이지
+
+    Returns:
+        (이미지 xref, 원본 너비, 원본 높이), 스캔 페이지가 아니면 None
+    """
+    import fitz  # PyMuPDF
+
+    if page.rotation or page.first_annot is not None:
+        return None
+
+    images = page.get_images(full=True)
+    if len(images) != 1:
+        return None
+    xref, smask, width, height, _, colorspace = images[0][:6]
+    if smask or not colorspace:
+        return None
+
+    # get_image_rects()는 이미지를 디코딩하여 해시를 구하므로, 배치 정보만 읽음
+    placements = page.get_image_info()
+    if len(placements) != 1:
+        return None
+    placement = placements[0]
+    if (placement["width"], placement["height"]) != (width, height):
+        return None
+    a, b, c, d = placement["transform"][:4]
+    if b or c or a <= 0 or d <= 0:
+        return None
+
+    rect = fitz.Rect(placement["bbox"])
+    page_rect = page.rect
+    tolerance_x = page_rect.width * SCAN_EDGE_TOLERANCE
+    tolerance_y = page_rect.height * SCAN_EDGE_TOLERANCE
+    if (
+        abs(rect.x0 - page_rect.x0) > tolerance_x
+        or abs(rect.x1 - page_rect.x1) > tolerance_x
+        or abs(rect.y0 - page_rect.y0) > tolerance_y
+        or abs(rect.y1 - page_rect.y1) > tolerance_y
+    ):
+        return None
+
+    visible = [kind for kind, _ in page.get_bboxlog() if kind in _VISIBLE_CONTENT_TYPES]
+    if visible != ["fill-image"]:
+        return None
+
+    return xref, width, height
+
+
+def extract_page_image(page: Any) -> Optional[np.ndarray]:
+    """스캔 페이지의 내장 이미지를 렌더링 없이 원본 해상도로 디코딩합니다.
+
+    JPEG는 extract_image()로 꺼낸 원본 스트림을 OpenCV로 바로 디코딩하고,
+    그 밖의 형식(JBIG2, CCITT, JPX, Flate, CMYK 등)은 MuPDF로 xref의 이미지를
+    디코딩합니다. 어느 경우든 페이지를 다시 래스터화하거나 리샘플링하지 않습니다.
+
+    Args:
+        page: PyMuPDF 페이지
+
+    Returns:
+        (높이, 너비, 3) 형태의 BGR 이미지 배열, 스캔 페이지가 아니면 None
+    """
+    import fitz  # PyMuPDF
+
+    embedded = embedded_page_image(page)
+    if embedded is None:
+        return None
+    xref = embedded[0]
+    doc = page.parent
+
+    # Decode 배열(색 반전 등)이 있으면 MuPDF에 디코딩을 맡김
+    if doc.xref_get_key(xref, "Decode")[0] == "null":
+        info = doc.extract_image(xref)
+        if info and info["ext"] == "jpeg" and info["colorspace"] in (1, 3):
+            # PDF는 JPEG의 EXIF 회전 정보를 따르지 않음
+            image = cv2.imdecode(
+                np.frombuffer(info["image"], dtype=np.uint8),
+                cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION,
+            )
+            if image is not None and image.shape[:2] == (info["height"], info["width"]):
+                return image
+
+    pix = fitz.Pixmap(doc, xref)
+    if pix.alpha or pix.colorspace is None:
+        return None
+    if pix.colorspace.n != 3:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return pixmap_to_array(pix)
+
+
+def crop_image(image: np.ndarray, box: Sequence[float]) -> np.ndarray:
+    """이미지 배열에서 정규화된 (x1, y1, x2, y2) 박스 영역을 잘라냅니다 (뷰 반환)."""
+    h, w = image.shape[:2]
+    x1 = max(0, int(box[0] * w))
+    y1 = max(0, int(box[1] * h))
+    x2 = min(w, int(box[2] * w))
+    y2 = min(h, int(box[3] * h))
+    return image[y1:y2, x1:x2]
+
+
+def covers_dpi(image: np.ndarray, page: Any, dpi: int) -> bool:
+    """페이지 이미지 배열의 해상도가 dpi 이상인지 확인합니다."""
+    return bool(image.shape[1] * 72 >= page.rect.width * dpi)
+
+
+def load_page_image(
+    page: Any,
+    dpi: int,
+    extract_images: bool = True,
+    fit: Optional[Tuple[int, int]] = None,
+) -> np.ndarray:
+    """페이지 이미지를 반환합니다.
+
+    fit(높이, 너비)이 주어지면 페이지를 fit 크기에 맞춰 렌더링합니다 (스캔 페이지도
+    MuPDF가 디코딩하면서 줄이므로 원본 해상도로 디코딩하지 않음). 그렇지 않고
+    extract_images가 True이고 스캔 페이지이면 내장 이미지를 원본 해상도로
+    디코딩하며, 나머지는 dpi로 렌더링합니다.
+    """
+    if fit is not None:
+        return render_page(page, dpi, fit)
+    image = extract_page_image(page) if extract_images else None
+    return image if image is not None else render_page(page, dpi)
+
+
+def render_region(page: Any, box: Sequence[float], dpi: int) -> np.ndarray:
+    """페이지의 정규화된 박스 영역만 지정한 DPI의 BGR 이미지 배열로 렌더링합니다.
+
+    Args:
+        page: PyMuPDF 페이지
+        box: 페이지 크기 기준으로 정규화된 (x1, y1, x2, y2) 좌표
+        dpi: 렌더링 DPI
+
+    Returns:
+        박스 영역의 BGR 이미지 배열
+    """
+    import fitz  # PyMuPDF
+
+    # 회전된 페이지도 화면에 보이는 좌표(page.rect) 기준으로 잘라냄
+    rect = page.rect
+    clip = (
+        fitz.Rect(
+            rect.x0 + box[0] * rect.width,
+            rect.y0 + box[1] * rect.height,
+            rect.x0 + box[2] * rect.width,
+            rect.y0 + box[3] * rect.height,
+        )
+        & rect
+    )
+
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    pix = page.get_pixmap(matrix=mat, clip=clip, alpha=False)
+    return pixmap_to_array(pix)
+
+
+def iter_pages(
+    pdf_path: str,
+    dpi: int,
+    page_indices: Optional[Iterable[int]] = None,
+    extract_images: bool = False,
+    fit: Optional[Tuple[int, int]] = None,
+) -> Generator[Tuple[int, np.ndarray], None, None]:
+    """PDF 페이지를 현재 프로세스에서 순서대로 렌더링합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        dpi: 렌더링 DPI
+        page_indices: 렌더링할 페이지 인덱스 목록 (None이면 모든 페이지)
+        extract_images: 스캔 페이지는 내장 이미지를 원본 해상도로 디코딩할지 여부
+        fit: 페이지를 맞출 (높이, 너비) (주어지면 dpi 대신 페이지별 배율 사용)
+
+    Yields:
+        (페이지 인덱스(0부터), BGR 이미지 배열)
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    try:
+        if page_indices is None:
+            page_indices = range(len(doc))
+        for page_index in page_indices:
+            page = doc.load_page(page_index)
+            yield page_index, load_page_image(page, dpi, extract_images, fit)
+    finally:
+        doc.close()
+
+
+def _render_to_shared_memory(
+    pdf_path: str,
+    dpi: int,
+    jobs: List[Tuple[int, str]],
+    extract_images: bool = False,
+    fit: Optional[Tuple[int, int]] = None,
+) -> List[Tuple[int, int]]:
+    """작업 프로세스에서 페이지를 렌더링하여 공유 메모리에 기록합니다.
+
+    문서 핸들은 프로세스 사이에 공유할 수 없으므로 작업마다 문서를 직접 엽니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        dpi: 렌더링 DPI
+        jobs: (페이지 인덱스, 공유 메모리 이름) 목록
+        extract_images: 스캔 페이지는 내장 이미지를 원본 해상도로 디코딩할지 여부
+        fit: 페이지를 맞출 (높이, 너비)
+
+    Returns:
+        페이지별 (높이, 너비) 목록
+    """
+    import fitz  # PyMuPDF
+
+    shapes: List[Tuple[int, int]] = []
+    with fitz.open(pdf_path) as doc:
+        for page_index, shm_name in jobs:
+            image = load_page_image(doc.load_page(page_index), dpi, extract_images, fit)
+            h, w = image.shape[:2]
+
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                if h * w * 3 > shm.size:
+                    raise ValueError(
+                        f"공유 메모리 크기 부족 (페이지 {page_index + 1}): "
+                        f"{h}x{w} > {shm.size} bytes"
+                    )
+                target: np.ndarray = np.ndarray(
+                    (h, w, 3), dtype=np.uint8, buffer=shm.buf
+                )
+                target[:] = image
+                del target
+            finally:
+                shm.close()
+            shapes.append((h, w))
+    return shapes
+
+
+class ProcessPoolPageRenderer:
+    """페이지 구간을 여러 프로세스에 나누어 렌더링하는 렌더러
+
+    MuPDF 렌더링은 한 코어에서만 실행되므로, 고해상도(300-600 DPI) 스캔 문서에서는
+    페이지 구간을 작업 프로세스들에 나누어 렌더링합니다. 픽셀 데이터는 pickle 대신
+    부모 프로세스가 미리 만든 공유 메모리로 전달됩니다.
+    """
+
+    def __init__(self, max_workers: int, pages_per_task: int = 2) -> None:
+        self.max_workers = max(1, max_workers)
+        self.pages_per_task = max(1, pages_per_task)
+        self._pool: Optional[Any] = None
+        self._pool_lock = threading.Lock()
+
+    def iter_pages(
+        self,
+        pdf_path: str,
+        dpi: int,
+        page_indices: Optional[Iterable[int]] = None,
+        extract_images: bool = False,
+        fit: Optional[Tuple[int, int]] = None,
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """PDF 페이지를 병렬로 렌더링하여 작업을 보낸 순서대로 반환합니다.
+
+        page_indices는 작업을 보낼 때마다 필요한 만큼만 읽으므로,
+        PageScheduler처럼 처리 중에 순서가 바뀌는 대기열도 사용할 수 있습니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            dpi: 렌더링 DPI
+            page_indices: 렌더링할 페이지 인덱스 목록 (None이면 모든 페이지)
+            extract_images: 스캔 페이지는 내장 이미지를 원본 해상도로 디코딩할지 여부
+            fit: 페이지를 맞출 (높이, 너비) (주어지면 dpi 대신 페이지별 배율 사용)
+
+        Yields:
+            (페이지 인덱스(0부터), BGR 이미지 배열)
+        """
+        import fitz  # PyMuPDF
+
+        # 페이지별 공유 메모리 크기 계산을 위해 부모에서 페이지 크기만 확인
+        doc = fitz.open(pdf_path)
+        if page_indices is None:
+            page_indices = range(len(doc))
+        remaining = iter(page_indices)
+
+        pool = self._get_pool()
+        pending: Deque[Tuple[Any, List[Tuple[int, shared_memory.SharedMemory]]]] = (
+            deque()
+        )
+        exhausted = False
+
+        try:
+            while not exhausted or pending:
+                # 진행 중인 작업 수를 제한하여 메모리 사용량을 억제
+                while not exhausted and len(pending) < self.max_workers * 2:
+                    task = list(islice(remaining, self.pages_per_task))
+                    if not task:
+                        exhausted = True
+                        break
+
+                    blocks = []
+                    for page_index in task:
+                        page = doc.load_page(page_index)
+                        irect = (page.rect * page_matrix(page, dpi, fit)).irect
+                        size = (irect.height + 1) * (irect.width + 1) * 3
+                        # 스캔 페이지는 내장 이미지의 원본 크기로 디코딩됨
+                        embedded = (
+                            embedded_page_image(page)
+                            if extract_images and fit is None
+                            else None
+                        )
+                        if embedded is not None:
+                            size = max(size, embedded[1] * embedded[2] * 3)
+                        blocks.append(
+                            (
+                                page_index,
+                                shared_memory.SharedMemory(create=True, size=size),
+                            )
+                        )
+                    async_result = pool.apply_async(
+                        _render_to_shared_memory,
+                        (
+                            pdf_path,
+                            dpi,
+                            [(i, shm.name) for i, shm in blocks],
+                            extract_images,
+                            fit,
+                        ),
+                    )
+                    pending.append((async_result, blocks))
+
+                if not pending:
+                    break
+
+                async_result, blocks = pending.popleft()
+                try:
+                    shapes = async_result.get()
+                    for (page_index, shm), (h, w) in zip(blocks, shapes):
+                        view: np.ndarray = np.ndarray(
+                            (h, w, 3), dtype=np.uint8, buffer=shm.buf
+                        )
+                        # 공유 메모리는 바로 해제하고 이후 단계는 자체 배열을 사용
+                        image = view.copy()
+                        del view
+                        yield page_index, image
+                finally:
+                    _release_blocks(blocks)
+        finally:
+            for _, blocks in pending:
+                _release_blocks(blocks)
+            doc.close()
+
+    def close(self) -> None:
+        """작업 프로세스 풀을 종료합니다."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
+
+    def _get_pool(self) -> Any:
+        """작업 프로세스 풀을 필요할 때 생성합니다."""
+        with self._pool_lock:
+            if self._pool is None:
+                # fork는 모델 추론 스레드와 함께 쓰기에 안전하지 않으므로 spawn 사용
+                self._pool = get_context("spawn").Pool(processes=self.max_workers)
+            return self._pool
+
+
+def _release_blocks(blocks: List[Tuple[int, shared_memory.SharedMemory]]) -> None:
+    """공유 메모리 블록을 닫고 제거합니다."""
+    for _, shm in blocks:
+        try:
+            shm.close()
+            shm.unlink()
+        except (FileNotFoundError, BufferError):
+            pass
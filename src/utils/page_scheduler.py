@@ -0,0 +1,48 @@
+"""
+페이지 처리 순서 스케줄러 모듈
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Iterable, Iterator, Optional
+
+
+class PageScheduler:
+    """렌더링/추론할 페이지 순서를 정하는 대기열
+
+    기본적으로 앞 페이지부터 내보내며, prioritize()로 요청한 페이지(예: 사용자가
+    보고 있는 페이지와 이웃 페이지)가 아직 처리되지 않았다면 대기열 맨 앞으로
+    옮깁니다. 렌더링 스레드가 페이지를 꺼내는 동안 다른 스레드에서 순서를 바꿀 수 있습니다.
+    """
+
+    def __init__(self, page_indices: Iterable[int]) -> None:
+        self._pending: Deque[int] = deque(page_indices)
+        self._lock = threading.Lock()
+
+    def prioritize(self, page_indices: Iterable[int]) -> None:
+        """대기 중인 페이지를 주어진 순서대로 대기열 맨 앞으로 옮깁니다.
+
+        Args:
+            page_indices: 먼저 처리할 페이지 인덱스(0부터) 목록 (앞쪽이 우선)
+        """
+        with self._lock:
+            front = [i for i in dict.fromkeys(page_indices) if i in self._pending]
+            for page_index in front:
+                self._pending.remove(page_index)
+            self._pending.extendleft(reversed(front))
+
+    def pop(self) -> Optional[int]:
+        """다음에 처리할 페이지 인덱스를 꺼냅니다. 남은 페이지가 없으면 None을 반환합니다."""
+        with self._lock:
+            return self._pending.popleft() if self._pending else None
+
+    def __iter__(self) -> Iterator[int]:
+        while True:
+            page_index = self.pop()
+            if page_index is None:
+                return
+            yield page_index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
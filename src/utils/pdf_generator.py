@@ -4,14 +4,21 @@ PDF 생성 모듈
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar
 
+import cv2
 from PIL import Image
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 
 from ..utils.logger import get_logger
+from ..utils.page_renderer import crop_image, embedded_page_image, extract_page_image
+
+T = TypeVar("T")
+
+# 스캔 페이지의 문제 영역을 JPEG로 저장할 때의 품질
+SCAN_JPEG_QUALITY = 90
 
 
 class PDFGenerator:
@@ -41,13 +48,32 @@ class PDFGenerator:
 
         return created_files
 
+    def create_individual_vector_pdfs(
+        self, source_pdf: str, questions: List[Dict], output_dir: str
+    ) -> List[str]:
+        """원본 PDF의 문제 영역을 래스터화 없이 개별 PDF 파일로 복사합니다."""
+        import fitz  # PyMuPDF
+
+        created_files = []
+
+        with fitz.open(source_pdf) as source_doc:
+            for i, question in enumerate(questions):
+                try:
+                    output_path = os.path.join(output_dir, f"문제_{i+1:03d}.pdf")
+                    self._create_vector_pdf(source_doc, [question], output_path)
+                    created_files.append(output_path)
+                except Exception as e:
+                    self.logger.error(f"PDF 생성 중 오류 발생 (문제 {i+1}): {e}")
+
+        return created_files
+
     def group_questions(
-        self, question_images: List[str], group_size: int
-    ) -> List[List[str]]:
+        self, question_images: Sequence[T], group_size: int
+    ) -> List[List[T]]:
         """문제들을 그룹으로 나눕니다."""
         groups = []
         for i in range(0, len(question_images), group_size):
-            group = question_images[i : i + group_size]
+            group = list(question_images[i : i + group_size])
             groups.append(group)
         return groups
 
@@ -67,11 +93,39 @@ class PDFGenerator:
 
         return created_files
 
+    def create_grouped_vector_pdfs(
+        self, source_pdf: str, groups: List[List[Dict]], output_dir: str
+    ) -> List[str]:
+        """원본 PDF의 문제 영역을 래스터화 없이 그룹 PDF 파일로 복사합니다."""
+        import fitz  # PyMuPDF
+
+        created_files = []
+
+        with fitz.open(source_pdf) as source_doc:
+            for i, group in enumerate(groups):
+                try:
+                    output_path = os.path.join(output_dir, f"그룹_{i+1:03d}.pdf")
+                    self._create_vector_pdf(source_doc, group, output_path)
+                    created_files.append(output_path)
+                except Exception as e:
+                    self.logger.error(f"그룹 PDF 생성 중 오류 발생 (그룹 {i+1}): {e}")
+
+        return created_files
+
     def create_exam_workbook(
         self, questions: List[Dict], metadata: Dict, output_path: str
     ) -> None:
-        """전체 문제집 PDF를 생성합니다."""
+        """전체 문제집 PDF를 생성합니다.
+
+        metadata에 원본 PDF 경로("source_pdf")가 있으면 문제 영역을 벡터 그대로 복사합니다.
+        """
         try:
+            if metadata.get("source_pdf"):
+                self._create_vector_pdf_from_path(
+                    metadata["source_pdf"], questions, output_path
+                )
+                return
+
             question_images = [q["image_path"] for q in questions]
             self._create_group_pdf(question_images, output_path)
         except Exception as e:
@@ -84,17 +138,27 @@ class PDFGenerator:
         output_path: str,
         seed: Optional[int] = None,
     ) -> None:
-        """셔플된 문제집 PDF를 생성합니다."""
+        """셔플된 문제집 PDF를 생성합니다.
+
+        metadata에 원본 PDF 경로("source_pdf")가 있으면 문제 영역을 벡터 그대로 복사합니다.
+        """
         try:
             import random
 
             if seed is not None:
                 random.seed(seed)
 
-            question_images = [q["image_path"] for q in questions]
-            shuffled_images = question_images.copy()
-            random.shuffle(shuffled_images)
+            # 같은 시드면 이미지/벡터 방식 모두 같은 순서가 되도록 문제 목록을 섞음
+            shuffled_questions = questions.copy()
+            random.shuffle(shuffled_questions)
+
+            if metadata.get("source_pdf"):
+                self._create_vector_pdf_from_path(
+                    metadata["source_pdf"], shuffled_questions, output_path
+                )
+                return
 
+            shuffled_images = [q["image_path"] for q in shuffled_questions]
             self._create_group_pdf(shuffled_images, output_path)
         except Exception as e:
             raise Exception(f"셔플 문제집 생성 실패: {e}")
@@ -105,19 +169,10 @@ class PDFGenerator:
             img = Image.open(image_path)
             img_width, img_height = img.size
 
-            # A4 크기
-            a4_width, a4_height = A4
-
             # 이미지 비율 유지하면서 A4에 맞게 조정
-            scale_x = (a4_width - 60 * mm) / img_width
-            scale_y = (a4_height - 100 * mm) / img_height
-            scale = min(scale_x, scale_y) * 0.8
-
-            new_width = img_width * scale
-            new_height = img_height * scale
-
-            x_offset = (a4_width - new_width) / 2
-            y_offset = a4_height - new_height - 10 * mm
+            x_offset, y_offset, new_width, new_height = self._fit_to_a4(
+                img_width, img_height
+            )
 
             c = canvas.Canvas(output_path, pagesize=A4)
             c.drawImage(image_path, x_offset, y_offset, new_width, new_height)
@@ -135,17 +190,9 @@ class PDFGenerator:
                 img = Image.open(img_path)
                 img_width, img_height = img.size
 
-                a4_width, a4_height = A4
-
-                scale_x = (a4_width - 60 * mm) / img_width
-                scale_y = (a4_height - 100 * mm) / img_height
-                scale = min(scale_x, scale_y) * 0.8
-
-                new_width = img_width * scale
-                new_height = img_height * scale
-
-                x_offset = (a4_width - new_width) / 2
-                y_offset = a4_height - new_height - 10 * mm
+                x_offset, y_offset, new_width, new_height = self._fit_to_a4(
+                    img_width, img_height
+                )
 
                 c.setPageSize(A4)
                 c.drawImage(img_path, x_offset, y_offset, new_width, new_height)
@@ -156,6 +203,195 @@ class PDFGenerator:
         except Exception as e:
             raise Exception(f"그룹 PDF 생성 실패: {e}")
 
+    def _create_vector_pdf_from_path(
+        self, source_pdf: str, questions: List[Dict], output_path: str
+    ) -> None:
+        """원본 PDF 경로에서 문제 영역들을 하나의 PDF로 복사합니다."""
+        import fitz  # PyMuPDF
+
+        with fitz.open(source_pdf) as source_doc:
+            self._create_vector_pdf(source_doc, questions, output_path)
+
+    def _create_vector_pdf(
+        self, source_doc: Any, questions: List[Dict], output_path: str
+    ) -> None:
+        """원본 PDF의 문제 영역을 문제당 한 페이지씩 새 PDF로 복사합니다.
+
+        이미지 방식과 같은 A4 배치를 사용하되, 픽셀로 변환하지 않고
+        show_pdf_page로 페이지 내용을 잘라 넣으므로 텍스트와 도형이 벡터로 유지됩니다.
+        스캔 페이지(embedded_page_image())는 벡터 내용이 없으므로 내장 이미지에서
+        문제 영역만 잘라 넣습니다.
+        """
+        import fitz  # PyMuPDF
+
+        try:
+            doc = fitz.open()
+            try:
+                for question in questions:
+                    page_index = question["page"] - 1
+                    source_page = source_doc.load_page(page_index)
+                    embedded = embedded_page_image(source_page)
+                    if embedded is not None:
+                        self._insert_scanned_region(
+                            doc, source_doc, source_page, embedded[0], question["box"]
+                        )
+                    else:
+                        self._insert_vector_region(
+                            doc, source_doc, page_index, question["box"]
+                        )
+
+                doc.save(output_path, garbage=3, deflate=True)
+            finally:
+                doc.close()
+
+        except Exception as e:
+            raise Exception(f"벡터 PDF 생성 실패: {e}")
+
+    def _insert_vector_region(
+        self, doc: Any, source_doc: Any, page_index: int, box: Sequence[float]
+    ) -> None:
+        """원본 페이지의 문제 영역을 벡터 그대로 새 페이지에 넣습니다.
+
+        show_pdf_page는 페이지 전체를 복사하므로, 원본 페이지의 임시 사본에서
+        문제 영역 밖의 내용을 지운 뒤 복사합니다.
+        """
+        import fitz  # PyMuPDF
+
+        page_doc = fitz.open()
+        try:
+            page_doc.insert_pdf(source_doc, from_page=page_index, to_page=page_index)
+            page_copy = page_doc[0]
+            if page_copy.rotation:
+                # 회전을 내용에 반영하여 화면 좌표 = 페이지 좌표
+                page_copy.remove_rotation()
+
+            clip = self._box_rect(page_copy, box)
+            self._remove_outside(page_copy, clip)
+
+            page, target = self._new_a4_page(doc, clip)
+            page.show_pdf_page(target, page_doc, 0, clip=clip)
+        finally:
+            page_doc.close()
+
+    def _insert_scanned_region(
+        self,
+        doc: Any,
+        source_doc: Any,
+        source_page: Any,
+        xref: int,
+        box: Sequence[float],
+    ) -> None:
+        """스캔 페이지의 내장 이미지에서 문제 영역만 잘라 새 페이지에 넣습니다.
+
+        내장 이미지가 JPEG(JPX)이면 잘라낸 영역도 JPEG로, 그 밖에는 PNG로 저장합니다.
+        """
+        image = extract_page_image(source_page)
+        if image is None:
+            raise ValueError("스캔 페이지 이미지를 읽을 수 없습니다")
+
+        _, image_filter = source_doc.xref_get_key(xref, "Filter")
+        lossy = "DCTDecode" in image_filter or "JPXDecode" in image_filter
+        ok, encoded = cv2.imencode(
+            ".jpg" if lossy else ".png",
+            crop_image(image, box),
+            [cv2.IMWRITE_JPEG_QUALITY, SCAN_JPEG_QUALITY] if lossy else [],
+        )
+        if not ok:
+            raise ValueError("문제 영역 이미지 인코딩 실패")
+
+        page, target = self._new_a4_page(doc, self._box_rect(source_page, box))
+        page.insert_image(target, stream=encoded.tobytes())
+
+    def _box_rect(self, page: Any, box: Sequence[float]) -> Any:
+        """정규화된 (x1, y1, x2, y2) 박스를 페이지 좌표의 영역으로 변환합니다."""
+        import fitz  # PyMuPDF
+
+        rect = page.rect
+        x1, y1, x2, y2 = box
+        return (
+            fitz.Rect(
+                rect.x0 + x1 * rect.width,
+                rect.y0 + y1 * rect.height,
+                rect.x0 + x2 * rect.width,
+                rect.y0 + y2 * rect.height,
+            )
+            & rect
+        )
+
+    def _new_a4_page(self, doc: Any, clip: Any) -> Tuple[Any, Any]:
+        """새 A4 페이지와 clip 영역을 이미지 방식과 같이 배치할 영역을 반환합니다."""
+        import fitz  # PyMuPDF
+
+        a4_width, a4_height = A4
+        x_offset, y_offset, new_width, new_height = self._fit_to_a4(
+            clip.width, clip.height
+        )
+
+        # ReportLab(왼쪽 아래 원점) 배치를 PyMuPDF(왼쪽 위 원점) 좌표로 변환
+        page = doc.new_page(width=a4_width, height=a4_height)
+        target = fitz.Rect(
+            x_offset,
+            a4_height - y_offset - new_height,
+            x_offset + new_width,
+            a4_height - y_offset,
+        )
+        return page, target
+
+    def _remove_outside(self, page: Any, clip: Any) -> None:
+        """페이지에서 clip 밖의 글자, 도형, 이미지 영역을 지웁니다.
+
+        clip 밖의 네 영역을 가림 주석으로 지정한 뒤 적용하며, clip에 걸친
+        이미지는 밖으로 나온 부분의 픽셀만 지우고 도형은 가림 영역에 완전히
+        들어간 것만 지웁니다. 가림 영역에 조금이라도 걸친 글자는 지워지므로,
+        clip에 걸친 단어는 남도록 가림 영역을 그 단어 밖으로 줄입니다
+        (남은 부분은 show_pdf_page의 clip으로 가려짐).
+        """
+        import fitz  # PyMuPDF
+
+        keep = fitz.Rect(clip)
+        for word in page.get_text("words"):
+            word_rect = fitz.Rect(word[:4])
+            if word_rect.intersects(clip):
+                keep |= word_rect
+
+        rect = page.rect
+        outside = [
+            fitz.Rect(rect.x0, rect.y0, rect.x1, keep.y0),
+            fitz.Rect(rect.x0, keep.y1, rect.x1, rect.y1),
+            fitz.Rect(rect.x0, keep.y0, keep.x0, keep.y1),
+            fitz.Rect(keep.x1, keep.y0, rect.x1, keep.y1),
+        ]
+        areas = [area for area in outside if not area.is_empty]
+        if not areas:
+            return
+
+        for area in areas:
+            page.add_redact_annot(area, fill=False)
+        page.apply_redactions()
+
+    def _fit_to_a4(
+        self, width: float, height: float
+    ) -> Tuple[float, float, float, float]:
+        """문제 영역을 비율을 유지하며 A4 상단 중앙에 배치합니다.
+
+        Returns:
+            (x_offset, y_offset, new_width, new_height): ReportLab 좌표(왼쪽 아래 원점)
+        """
+        # A4 크기
+        a4_width, a4_height = A4
+
+        scale_x = (a4_width - 60 * mm) / width
+        scale_y = (a4_height - 100 * mm) / height
+        scale = min(scale_x, scale_y) * 0.8
+
+        new_width = width * scale
+        new_height = height * scale
+
+        x_offset = (a4_width - new_width) / 2
+        y_offset = a4_height - new_height - 10 * mm
+
+        return x_offset, y_offset, new_width, new_height
+
     def cleanup(self) -> None:
         """리소스 정리 작업을 수행합니다."""
         try:
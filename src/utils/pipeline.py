@@ -0,0 +1,161 @@
+"""
+단계별 처리 파이프라인 모듈
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
+
+from .logger import get_logger
+
+# 단계가 끝났음을 알리는 표식
+_DONE = object()
+
+
+class _StageFailure:
+    """단계에서 발생한 예외를 다음 단계로 전달하기 위한 래퍼"""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class StagedPipeline:
+    """여러 처리 단계를 동시에 실행하는 제한된 생산자/소비자 파이프라인
+
+    source 반복은 첫 번째 작업 스레드에서, 각 단계는 자신의 작업 스레드에서 실행되며
+    단계 사이는 크기가 제한된 큐로 연결되어 뒤 단계가 느리면 앞 단계가 대기합니다.
+    결과는 입력 순서대로 반복(iterate)하는 스레드에 전달됩니다.
+
+    예:
+        pipeline = StagedPipeline(render_pages(), [detect, crop], queue_size=1)
+        for result in pipeline:
+            ...
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        stages: Sequence[Callable[[Any], Any]],
+        queue_size: int = 1,
+        name: str = "pipeline",
+    ) -> None:
+        self.source = source
+        self.stages = list(stages)
+        self.queue_size = max(1, queue_size)
+        self.name = name
+        self.logger = get_logger(__name__)
+
+        self._stop = threading.Event()
+        self._queues: List["queue.Queue[Any]"] = []
+        self._threads: List[threading.Thread] = []
+
+    def __iter__(self) -> Iterator[Any]:
+        self._start()
+        try:
+            output = self._queues[-1]
+            while True:
+                item = self._get(output)
+                if item is _DONE:
+                    break
+                if isinstance(item, _StageFailure):
+                    raise item.error
+                yield item
+        finally:
+            # 정상 종료, 예외, 소비 중단 모두 작업 스레드를 정리
+            self.close()
+
+    def close(self) -> None:
+        """파이프라인을 중지하고 작업 스레드가 끝날 때까지 기다립니다."""
+        self._stop.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads = []
+
+    def _start(self) -> None:
+        """작업 스레드들을 시작합니다."""
+        self._stop.clear()
+        self._queues = [
+            queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+
+        self._threads = [
+            threading.Thread(
+                target=self._run_source,
+                name=f"{self.name}-source",
+                daemon=True,
+            )
+        ]
+        for index, stage in enumerate(self.stages):
+            self._threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(stage, self._queues[index], self._queues[index + 1]),
+                    name=f"{self.name}-stage-{index + 1}",
+                    daemon=True,
+                )
+            )
+
+        for thread in self._threads:
+            thread.start()
+
+    def _run_source(self) -> None:
+        """source를 반복하며 첫 번째 큐를 채웁니다."""
+        output = self._queues[0]
+        try:
+            for item in self.source:
+                if not self._put(output, item):
+                    return
+        except BaseException as e:
+            self._put(output, _StageFailure(e))
+            return
+        finally:
+            # 생성기라면 열어 둔 리소스(PDF 문서 등)를 이 스레드에서 정리
+            close = getattr(self.source, "close", None)
+            if callable(close):
+                close()
+        self._put(output, _DONE)
+
+    def _run_stage(
+        self,
+        stage: Callable[[Any], Any],
+        input_queue: "queue.Queue[Any]",
+        output_queue: "queue.Queue[Any]",
+    ) -> None:
+        """입력 큐의 항목을 처리하여 출력 큐로 넘깁니다."""
+        while True:
+            item = self._get(input_queue)
+            if item is _DONE or isinstance(item, _StageFailure):
+                self._put(output_queue, item)
+                return
+            if self._stop.is_set():
+                return
+
+            try:
+                result = stage(item)
+            except BaseException as e:
+                self.logger.debug(f"{self.name} 단계 오류: {e}")
+                self._put(output_queue, _StageFailure(e))
+                return
+
+            if not self._put(output_queue, result):
+                return
+
+    def _put(self, target: "queue.Queue[Any]", item: Any) -> bool:
+        """중지 요청을 확인하며 큐에 항목을 넣습니다."""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue[Any]") -> Any:
+        """중지 요청을 확인하며 큐에서 항목을 꺼냅니다."""
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
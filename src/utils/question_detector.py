@@ -2,65 +2,374 @@
 문제 감지 모듈
 """
 
+import json
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import cv2
+import numpy as np
 
+from ..config.settings import get_app_config
+from ..core.exceptions import JobCancelledError
+from .detection_cache import get_detection_cache
+from .job_manager import CancellationToken
+from .layout_templates import PageLayout, get_layout_template_store, page_layout
 from .logger import get_logger
-from .model_utils import get_model_path
+from .model_pool import PooledModel, get_model_pool
+from .model_utils import get_model_path, is_onnx_model
+from .onnx_backend import DetectionResult
+from .page_filter import page_skip_reason
+from .page_image_store import get_page_image_store
+from .page_renderer import (
+    ProcessPoolPageRenderer,
+    covers_dpi,
+    crop_image,
+    iter_pages,
+    load_page_image,
+    render_region,
+)
+from .page_scheduler import PageScheduler
+from .pipeline import StagedPipeline
+from .text_layer_detector import detect_question_regions
+
+
+@dataclass
+class _PageWork:
+    """파이프라인 단계 사이를 이동하는 페이지 작업 단위"""
+
+    page_num: int
+    image: Optional[np.ndarray]
+    image_path: Optional[str] = None
+    questions: List[Dict] = field(default_factory=list)
+    # 신뢰도 하한으로 감지한 전체 결과 (questions는 요청한 신뢰도 이상만)
+    detections: List[Dict] = field(default_factory=list)
+    # 문제가 없는 페이지로 보고 감지를 건너뛴 이유 (감지한 페이지는 None)
+    skip_reason: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _ActiveModel:
+    """한 번의 감지에서 사용하는 모델 (감지 중에 모델을 바꿔도 그대로 유지)"""
+
+    model: Any
+    lock: Any
+    path: str
+
+
+# 출력 디렉토리의 파일이 어떤 감지에서 나왔는지 기록하는 파일
+# (캐시 적중 시 같은 감지에서 나온 파일만 다시 사용)
+OUTPUT_RECORD_FILENAME = "detection_outputs.json"
+
+# 페이지별 결과 콜백 (페이지 번호, 문제 목록, 페이지 이미지 경로)
+PageCallback = Callable[[int, List[Dict], Optional[str]], None]
+
+# 건너뛴 페이지 콜백 (페이지 번호, 건너뛴 이유)
+SkipCallback = Callable[[int, str], None]
+
+
+def _reading_order_key(question: Dict) -> Tuple[int, int, float]:
+    """문제를 페이지, 단(왼쪽/오른쪽), 세로 위치 순으로 정렬하는 키"""
+    x1, y1, x2, y2 = question["box"]
+    center_x = (x1 + x2) / 2
+    center_y = (y1 + y2) / 2
+
+    if center_x < 0.5:
+        return (question["page"], 0, center_y)
+    else:
+        return (question["page"], 1, center_y)
+
+
+def filter_questions(questions: Iterable[Dict], confidence: float) -> List[Dict]:
+    """신뢰도가 confidence 이상인 문제만 순서를 유지하여 반환합니다.
+
+    감지 결과는 신뢰도 하한으로 저장되므로, 신뢰도를 높일 때는 다시 감지하지
+    않고 이 함수로 거르면 됩니다.
+    """
+    return [q for q in questions if q["confidence"] >= confidence]
+
+
+# 정밀 감지(cascade)가 필요한 페이지의 판단 기준
+CASCADE_UNCERTAINTY = 0.15  # 요청 신뢰도와 이만큼 가까운 결과가 있으면 불확실
+CASCADE_OVERLAP = 0.3  # 두 박스가 작은 박스 면적 대비 이 비율 이상 겹치면 의심
+CASCADE_GUTTER = 0.02  # 페이지 가운데에서 양쪽으로 이만큼 넘어가면 단을 가로지름
+CASCADE_MAX_QUESTIONS = 12  # 한 페이지의 문제 수가 이보다 많으면 의심
+
+
+def refinement_reasons(detections: Sequence[Dict], confidence: float) -> List[str]:
+    """저해상도 감지 결과를 고해상도로 다시 감지해야 하는 이유를 반환합니다.
+
+    다음 경우를 의심스러운 결과로 봅니다 (빈 목록이면 다시 감지하지 않아도 됨).
+
+    - 신뢰도가 요청한 신뢰도에 가까워 포함 여부가 불확실한 결과가 있음
+    - 남은 문제 박스끼리 크게 겹침
+    - 양쪽 단에 문제가 있는데 가운데 단 구분선을 가로지르는 박스가 있음
+    - 문제 수가 비정상적으로 많음
+
+    Args:
+        detections: 신뢰도 하한으로 감지한 결과
+        confidence: 요청한 신뢰도
+    """
+    reasons = []
+    if any(abs(d["confidence"] - confidence) < CASCADE_UNCERTAINTY for d in detections):
+        reasons.append("불확실한 신뢰도")
+
+    boxes = [q["box"] for q in filter_questions(detections, confidence)]
+    if any(
+        _overlap_ratio(a, b) > CASCADE_OVERLAP
+        for i, a in enumerate(boxes)
+        for b in boxes[i + 1 :]
+    ):
+        reasons.append("겹치는 박스")
+
+    two_columns = any(x2 <= 0.5 for _, _, x2, _ in boxes) and any(
+        x1 >= 0.5 for x1, _, _, _ in boxes
+    )
+    if two_columns and any(
+        x1 < 0.5 - CASCADE_GUTTER and x2 > 0.5 + CASCADE_GUTTER
+        for x1, _, x2, _ in boxes
+    ):
+        reasons.append("단을 가로지르는 박스")
+
+    if len(boxes) > CASCADE_MAX_QUESTIONS:
+        reasons.append("비정상적인 문제 수")
+
+    return reasons
+
+
+def _overlap_ratio(a: Sequence[float], b: Sequence[float]) -> float:
+    """두 박스가 겹치는 면적을 작은 박스의 면적에 대한 비율로 반환합니다."""
+    overlap = max(0.0, min(a[2], b[2]) - max(a[0], b[0])) * max(
+        0.0, min(a[3], b[3]) - max(a[1], b[1])
+    )
+    smaller = min((a[2] - a[0]) * (a[3] - a[1]), (b[2] - b[0]) * (b[3] - b[1]))
+    return overlap / smaller if smaller > 0 else 0.0
+
+
+def _completed_future(result: bool) -> "Future[bool]":
+    """이미 완료된 future를 반환합니다."""
+    future: "Future[bool]" = Future()
+    future.set_result(result)
+    return future
 
 
 class QuestionDetector:
     """문제 감지 클래스"""
 
-    def __init__(self, model_name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        detection_dpi: Optional[int] = None,
+        load_in_background: bool = False,
+        use_text_layer: Optional[bool] = None,
+        cascade: Optional[bool] = None,
+        use_page_filter: Optional[bool] = None,
+    ) -> None:
+        """문제 감지기를 생성하고 모델을 로드합니다.
+
+        load_in_background가 True이면 모델 로드와 워밍업을 백그라운드 스레드에서
+        수행하고 바로 반환합니다. 로드 완료는 ready 또는 wait_until_ready()로
+        확인하며, process_pdf()는 로드가 끝날 때까지 기다립니다.
+        """
         self.model: Any = None
         self.initialized: bool = False
         self.model_path: Optional[str] = None
         self.logger = get_logger(__name__)
 
+        # 여러 스레드(예: 여러 PDF 동시 처리)가 하나의 모델을 공유할 때 추론을 직렬화
+        # (모델을 로드하면 모델 풀에 보관된 모델의 잠금으로 바뀜)
+        self._inference_lock = threading.Lock()
+        # 모델 변경과 진행 중인 감지의 모델 확인(_active_model())이 섞이지 않도록 보호
+        self._model_lock = threading.Lock()
+
+        # 한 번에 모델로 보낼 페이지 수 (기본값: 애플리케이션 설정)
+        if batch_size is None:
+            batch_size = get_app_config().batch_size
+        self.batch_size: int = max(1, batch_size)
+
+        # 페이지 렌더링 프로세스 수 (1이면 현재 프로세스에서 렌더링)
+        if max_workers is None:
+            max_workers = get_app_config().max_workers
+        self.max_workers: int = max(1, max_workers)
+        self._page_renderer: Optional[ProcessPoolPageRenderer] = None
+        # 진행 중인 감지의 페이지 처리 순서 (감지 중이 아니면 None)
+        self._scheduler: Optional[PageScheduler] = None
+
+        # 감지 결과 디스크 캐시 사용 여부 (기본값: 애플리케이션 설정)
+        if use_cache is None:
+            use_cache = get_app_config().detection_cache_enabled
+        self.use_cache: bool = use_cache
+
+        # 감지(및 페이지 이미지)용 렌더링 DPI 상한 (기본값: 애플리케이션 설정)
+        if detection_dpi is None:
+            detection_dpi = get_app_config().detection_dpi
+        self.detection_dpi: int = max(1, detection_dpi)
+
+        # 감지 결과를 저장하는 신뢰도 하한 (이보다 높은 신뢰도는 결과를 걸러서 적용)
+        self.confidence_floor: float = get_app_config().detection_confidence_floor
+
+        # 텍스트 레이어의 문제 번호로 먼저 감지할지 여부 (기본값: 애플리케이션 설정)
+        if use_text_layer is None:
+            use_text_layer = get_app_config().text_layer_detection_enabled
+        self.use_text_layer: bool = use_text_layer
+
+        # 스캔 페이지는 렌더링 대신 내장 이미지를 원본 해상도로 디코딩
+        self.extract_page_images: bool = (
+            get_app_config().scanned_page_extraction_enabled
+        )
+
+        # 같은 레이아웃으로 감지한 적이 있는 페이지는 템플릿의 결과를 사용
+        self.use_layout_templates: bool = get_app_config().layout_template_enabled
+
+        # 페이지 이미지를 저장하지 않으면 페이지를 모델 입력 크기로 바로 렌더링
+        self.native_input_render: bool = get_app_config().native_input_render_enabled
+
+        # 표지, 여백 페이지, OMR 답안지처럼 문제가 없는 페이지는 감지하지 않음
+        # (기본값: 애플리케이션 설정)
+        if use_page_filter is None:
+            use_page_filter = get_app_config().page_filter_enabled
+        self.use_page_filter: bool = use_page_filter
+
+        # 저해상도 감지 결과가 의심스러운 페이지만 고해상도로 다시 감지
+        # (기본값: 애플리케이션 설정)
+        if cascade is None:
+            cascade = get_app_config().cascade_enabled
+        self.cascade_enabled: bool = cascade
+        self.cascade_dpi: int = max(1, get_app_config().cascade_dpi)
+        self.cascade_imgsz: int = max(32, get_app_config().cascade_imgsz)
+
+        # 모델 로드와 변경을 요청 순서대로 수행하는 백그라운드 스레드
+        self._loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="model-loader"
+        )
+        self._pooled_model: Optional[PooledModel] = None
+
+        # 가장 최근 모델 로드(또는 변경) 요청의 완료를 알리는 future
+        model_path = str(self._get_model_path(model_name)) if model_name else None
+        self._requested_model_path = model_path
+        self._ready: "Future[bool]"
+
         # 초기화 시 모델 자동 로드
-        if model_name:
-            self._load_model(str(self._get_model_path(model_name)))
+        if load_in_background:
+            self._ready = self._loader.submit(self._load_and_warm_up, model_path)
         else:
-            self._load_model()
+            self._load_model(model_path)
+            self._ready = _completed_future(True)
 
-    def change_model(self, model_name: str) -> bool:
-        """모델을 변경합니다.
+    @property
+    def ready(self) -> "Future[bool]":
+        """최근 모델 로드(또는 변경) 요청의 완료 future
 
-        Args:
-            model_name: 모델 파일명 (예: "best.pt", "model2.pt")
+        모델 변경 성공 여부로 완료되며, 초기 모델 로드가 실패하면 예외가 설정됩니다.
+        """
+        return self._ready
 
-        Returns:
-            bool: 모델 변경 성공 여부
+    def wait_until_ready(self, timeout: Optional[float] = None) -> None:
+        """백그라운드 모델 로드가 끝날 때까지 기다립니다.
+
+        Raises:
+            Exception: 백그라운드 모델 로드가 실패한 경우 그 예외
         """
+        self._ready.result(timeout)
+
+    def warm_up(self) -> None:
+        """빈 페이지로 한 번 추론하여 첫 감지의 초기화 비용을 미리 치릅니다."""
+        if not self.initialized or self.model is None:
+            return
+
+        # 감지 DPI로 렌더링한 A4 페이지와 같은 크기의 빈 페이지
+        dpi = self.detection_dpi
+        blank_page = np.full(
+            (int(11.69 * dpi), int(8.27 * dpi), 3), 255, dtype=np.uint8
+        )
+
+        start = time.perf_counter()
+        with self._inference_lock:
+            self.model([blank_page], conf=0.25, verbose=False)
+        if self._pooled_model is not None:
+            self._pooled_model.warmed = True
+        self.logger.info(f"모델 워밍업 완료 ({time.perf_counter() - start:.2f}초)")
+
+    def _load_and_warm_up(self, model_path: Optional[str]) -> bool:
+        """모델을 로드하고, 처음 로드한 모델이면 워밍업합니다."""
         try:
-            # 모델 경로 설정
-            model_path = self._get_model_path(model_name)
+            self._load_model(model_path)
+        except Exception as e:
+            self.logger.error(f"모델 로드 실패: {e}")
+            raise
 
-            if not model_path.exists():
-                return False
+        if get_app_config().model_warmup_enabled and not (
+            self._pooled_model and self._pooled_model.warmed
+        ):
+            try:
+                self.warm_up()
+            except Exception as e:
+                # 워밍업 실패는 감지에 영향을 주지 않음
+                self.logger.warning(f"모델 워밍업 실패: {e}")
+        return True
 
-            # 기존 모델 해제
-            if self.model is not None:
-                del self.model
-                self.model = None
+    def change_model_async(self, model_name: str) -> "Future[bool]":
+        """모델을 백그라운드에서 변경합니다.
 
-            # 초기화 상태 리셋
-            self.initialized = False
-            self.model_path = None
+        모델 풀에 이미 로드된 모델이고 진행 중인 로드가 없으면 바로 변경합니다.
+        변경에 실패하면 기존 모델을 유지합니다.
 
-            # 새 모델 로드
-            self._load_model(str(model_path))
+        Args:
+            model_name: 모델 파일명 (예: "best.pt", "model2.onnx")
 
-            if self.initialized:
-                return True
-            else:
-                return False
+        Returns:
+            변경 성공 여부로 완료되는 future (ready와 같음)
+        """
+        model_path = self._get_model_path(model_name)
+        self._requested_model_path = str(model_path)
+
+        if (
+            self._ready.done()
+            and model_path.exists()
+            and get_model_pool().contains(model_path)
+        ):
+            self._ready = _completed_future(self._switch_model(model_path))
+        else:
+            self._ready = self._loader.submit(self._switch_model, model_path)
+        return self._ready
 
-        except Exception as e:
+    def change_model(self, model_name: str) -> bool:
+        """모델을 변경합니다. 변경이 끝날 때까지 기다립니다.
+
+        Args:
+            model_name: 모델 파일명 (예: "best.pt", "model2.onnx")
+
+        Returns:
+            bool: 모델 변경 성공 여부
+        """
+        return self.change_model_async(model_name).result()
+
+    def _switch_model(self, model_path: Path) -> bool:
+        """모델을 변경하고 성공 여부를 반환합니다."""
+        if not model_path.exists():
+            return False
+
+        try:
+            return self._load_and_warm_up(str(model_path))
+        except Exception:
             return False
 
     def _get_model_path(self, model_name: str) -> Path:
@@ -68,23 +377,26 @@ class QuestionDetector:
         return get_model_path(model_name)
 
     def _load_model(self, model_path: Optional[str] = None) -> None:
-        """YOLO 모델을 로드합니다."""
-        try:
-            from ultralytics import YOLO
+        """YOLO 모델을 로드합니다.
 
+        모델 풀에 있으면 재사용하고, 없으면 로드하여 풀에 추가합니다.
+        로드에 실패하면 기존 모델을 그대로 유지합니다.
+        """
+        backend_package = "ultralytics"
+        try:
             if model_path is None:
-                # 기본 모델 경로 설정 - models 폴더에서 첫 번째 .pt 파일 찾기
-                from .model_utils import get_model_directory
+                # 기본 모델 경로 설정 - models 폴더에서 첫 번째 모델 파일 찾기
+                from .model_utils import get_model_directory, list_model_files
 
                 models_dir = get_model_directory()
 
                 if models_dir.exists():
-                    pt_files = list(models_dir.glob("*.pt"))
-                    if pt_files:
-                        model_path = str(pt_files[0])  # 첫 번째 .pt 파일 사용
+                    model_files = list_model_files(models_dir)
+                    if model_files:
+                        model_path = str(model_files[0])  # 첫 번째 모델 파일 사용
                     else:
                         raise FileNotFoundError(
-                            f"models 폴더에 .pt 파일이 없습니다: {models_dir}"
+                            f"models 폴더에 모델 파일이 없습니다: {models_dir}"
                         )
                 else:
                     raise FileNotFoundError(
@@ -94,22 +406,50 @@ class QuestionDetector:
             if not Path(model_path).exists():
                 raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
 
-            self.model = YOLO(str(model_path))
-            self.model_path = str(model_path)
-            self.initialized = True
+            if is_onnx_model(model_path):
+                backend_package = "onnxruntime"
+
+            pooled = get_model_pool().get(model_path, self._create_model)
+
+            # 같은 모델을 공유하는 감지기끼리 추론을 직렬화하도록 모델의 잠금 사용
+            with self._model_lock:
+                self._pooled_model = pooled
+                self._inference_lock = pooled.lock
+                self.model = pooled.model
+                self.model_path = str(model_path)
+                self.initialized = True
 
         except ImportError as e:
-            self.initialized = False
             raise ImportError(
-                "ultralytics 라이브러리가 설치되지 않았습니다. 'pip install ultralytics'를 실행하세요."
+                f"{backend_package} 라이브러리가 설치되지 않았습니다. 'pip install {backend_package}'를 실행하세요."
             )
         except FileNotFoundError as e:
-            self.initialized = False
             raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {str(e)}")
         except Exception as e:
-            self.initialized = False
             raise Exception(f"모델 로드 중 오류 발생: {str(e)}")
 
+    @staticmethod
+    def _create_model(model_path: str) -> Any:
+        """모델 파일을 로드합니다.
+
+        .onnx 파일은 ONNX Runtime 백엔드로, 그 외 파일은 ultralytics로 로드합니다.
+        """
+        if is_onnx_model(model_path):
+            # torch 없이 CPU에서 실행
+            from .onnx_backend import OnnxYoloModel
+
+            config = get_app_config()
+            return OnnxYoloModel(
+                model_path,
+                intra_op_threads=config.onnx_intra_op_threads,
+                inter_op_threads=config.onnx_inter_op_threads,
+                graph_optimization=config.onnx_graph_optimization,
+            )
+
+        from ultralytics import YOLO
+
+        return YOLO(model_path)
+
     def process_pdf(
         self,
         pdf_path: str,
@@ -117,169 +457,1034 @@ class QuestionDetector:
         dpi: int,
         confidence: float,
         progress_callback: Optional[Callable] = None,
+        save_page_images: bool = True,
+        page_callback: Optional[PageCallback] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        save_question_images: bool = True,
+        skip_callback: Optional[SkipCallback] = None,
     ) -> tuple[List[Dict], List[str]]:
         """PDF를 처리하여 문제를 감지합니다.
 
+        use_page_filter가 켜져 있으면 먼저 표지, 여백 페이지, OMR 답안지처럼
+        문제가 있을 수 없는 페이지(page_skip_reason())를 골라 감지를 건너뛰고,
+        skip_callback이 주어지면 건너뛴 페이지와 이유를 전달합니다.
+
+        use_text_layer가 켜져 있으면 각 페이지는 먼저 텍스트 레이어의 문제 번호로
+        감지하고(신뢰도 1.0), 텍스트 레이어가 없거나 결과가 검사를 통과하지 못한
+        페이지만 모델로 감지합니다. use_layout_templates가 켜져 있으면 모델로
+        감지할 페이지 중 레이아웃 템플릿과 일치하는 페이지는 템플릿의 결과를
+        사용하고, 모델로 감지한 페이지는 새 템플릿으로 보관합니다.
+
+        cascade_enabled가 켜져 있으면 모델로 감지한 페이지 중 결과가 의심스러운
+        페이지(refinement_reasons())만 cascade_dpi로 다시 렌더링하여 더 큰 모델
+        입력 크기(cascade_imgsz)로 다시 감지합니다.
+
+        native_input_render가 켜져 있고 페이지 이미지를 저장하지 않으면, 페이지는
+        감지 DPI 대신 페이지 크기에서 구한 배율로 모델 입력 크기에 꼭 맞게
+        렌더링되므로(get_render_fit()) 모델 전처리에서 크기를 조정하지 않습니다.
+
+        페이지는 메모리 상의 배열로 렌더링되어 그대로 모델과 문제 추출에 사용되며,
+        PNG 파일은 디스크에 필요한 경우에만 저장됩니다. 렌더링, 모델 추론,
+        문제 이미지 저장은 파이프라인 단계로 동시에 실행됩니다.
+
+        감지와 페이지 이미지는 모델 입력 크기에 가까운 낮은 해상도
+        (detection_dpi 이하)로 렌더링하고, 개별 문제 이미지는 해당 영역만
+        PDF에서 dpi로 다시 렌더링합니다. 페이지 전체가 이미지 한 장인 스캔
+        페이지는 렌더링하지 않고 내장 이미지를 원본 해상도로 디코딩하며, 원본
+        해상도가 dpi 이상이면 문제 이미지도 원본에서 그대로 잘라냅니다.
+
+        모델은 신뢰도 하한(confidence_floor)으로 실행하고 결과를 confidence로
+        거르므로, 하한 이상의 신뢰도는 모두 같은 감지 결과(와 캐시)를 사용합니다.
+        같은 PDF·모델·감지 DPI의 감지 결과가 캐시에 있으면 추론을 건너뛰고,
+        출력 디렉토리에 없는 페이지 이미지와 문제 이미지만 다시 렌더링합니다.
+        기존 파일은 출력 디렉토리의 기록(OUTPUT_RECORD_FILENAME)에 같은 감지와
+        출력 DPI로 저장되었다고 남은 경우에만 다시 사용합니다.
+
+        page_callback이 주어지면 전체 처리가 끝나기를 기다리지 않고 처리가 끝난
+        페이지의 결과를 바로 전달합니다. 이 경우 첫 페이지는 배치를 채우지 않고
+        단독으로 처리하여 첫 결과가 최대한 빨리 나오도록 합니다.
+
+        페이지는 앞에서부터 처리하지만, 처리 중에 prioritize_pages()로 요청한
+        페이지를 먼저 처리하므로 page_callback은 페이지 순서와 다르게 호출될 수
+        있습니다. 반환값은 항상 페이지 순서입니다. 개별 문제 이미지의 파일명
+        번호는 처리 순서와 관계없이 읽는 순서로 매기므로, 캐시 없이 문제 이미지를
+        저장할 때 먼저 처리한 페이지는 앞 페이지가 모두 끝난 뒤에 저장되고 전달됩니다.
+
+        감지에 사용할 모델은 시작할 때 한 번 정하므로, 감지 중에 모델을 바꿔도
+        (change_model_async()) 이번 감지의 추론, 캐시 키, 레이아웃 템플릿에는
+        처음 모델이 그대로 사용되고 다음 감지부터 새 모델이 사용됩니다.
+
+        cancel_token이 주어지면 페이지마다 취소 여부를 확인하고, 취소되면 진행 중인
+        파이프라인을 정리한 뒤 JobCancelledError를 발생시킵니다. 취소된 감지 결과는
+        캐시에 저장하지 않습니다.
+
         Args:
             pdf_path: PDF 파일 경로
             output_dir: 출력 디렉토리
-            dpi: 이미지 DPI
+            dpi: 개별 문제 이미지 DPI
             confidence: 감지 신뢰도
             progress_callback: 진행률 콜백 함수
+            save_page_images: 페이지 이미지를 PNG 파일로 저장할지 여부
+            page_callback: 페이지별 결과 콜백 함수
+                (페이지 번호, 읽는 순서로 정렬된 문제 목록, 페이지 이미지 경로)
+            cancel_token: 취소 토큰
+            save_question_images: 개별 문제 이미지를 저장할지 여부 (내보낼 때
+                원본 PDF에서 다시 렌더링한다면 False로 감지 시간을 줄일 수 있음)
+            skip_callback: 건너뛴 페이지 콜백 함수 (페이지 번호, 건너뛴 이유)
 
         Returns:
             (questions, page_images): 감지된 문제 목록과 페이지 이미지 경로 목록
+            (save_page_images가 False이면 페이지 이미지 경로 목록은 비어 있음)
         """
+
+        def check_cancelled() -> None:
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+
         try:
             if progress_callback:
                 progress_callback(10, "모델을 로드 중입니다...")
 
-            # 모델 로드
-            if not self.initialized:
-                try:
+            # 모델 로드 (백그라운드에서 로드 중이면 완료될 때까지 대기)
+            try:
+                self.wait_until_ready()
+                if not self.initialized:
                     self._load_model()
-                except Exception as e:
-                    raise Exception(f"모델 로드 실패: {str(e)}")
+                active = self._active_model()
+            except Exception as e:
+                raise Exception(f"모델 로드 실패: {str(e)}")
 
+            check_cancelled()
             if progress_callback:
                 progress_callback(20, "PDF 파일을 분석 중입니다...")
 
-            questions = []
-            page_images = []
+            questions: List[Dict] = []
 
             # PDF를 이미지로 변환
             import fitz  # PyMuPDF
 
-            doc = fitz.open(pdf_path)
+            with fitz.open(pdf_path) as doc:
+                total_pages = len(doc)
 
-            total_pages = len(doc)
+            render_dpi = self.get_detection_dpi(dpi)
+            render_fit = self._render_fit(active, save_page_images)
 
-            for page_num in range(total_pages):
-                if progress_callback:
-                    progress = 20 + (page_num * 60 // total_pages)
-                    progress_callback(
-                        progress, f"페이지 {page_num + 1}/{total_pages} 처리 중..."
-                    )
+            # 캐시된 감지 결과 확인
+            cache_key: Optional[str] = None
+            cached_pages: Optional[List[List[Dict]]] = None
+            skipped_pages: Dict[int, str] = {}
+            if self.use_cache:
+                cache_key = self._detection_cache_key(
+                    active, pdf_path, dpi, confidence, save_page_images
+                )
+                cached = self._load_cached_pages(cache_key, total_pages)
+                if cached is not None:
+                    cached_pages, skipped_pages = cached
+
+            # 이번 실행이 출력 파일을 덮어쓰므로 기록은 읽은 뒤 지우고 끝날 때 다시 씀
+            output_record = self._pop_output_record(output_dir, cache_key, dpi)
+
+            # 페이지별 첫 문제 번호 (캐시 적중 시 건너뛴 페이지가 있어도 파일명 유지)
+            start_indices: Optional[List[int]] = None
+            if cached_pages is not None:
+                start_indices = []
+                question_count = 0
+                for page_detections in cached_pages:
+                    start_indices.append(question_count)
+                    question_count += len(filter_questions(page_detections, confidence))
+
+            # 감지 해상도가 출력 해상도보다 낮으면 문제 영역을 PDF에서 다시 렌더링
+            crop_doc = (
+                fitz.open(pdf_path)
+                if save_question_images and (render_fit is not None or render_dpi < dpi)
+                else None
+            )
+            # 페이지 거르기, 텍스트 레이어 감지, 정밀 감지용 문서
+            # (추론 단계 스레드에서만 사용)
+            detect_doc = (
+                fitz.open(pdf_path)
+                if (self.use_page_filter or self.use_text_layer or self.cascade_enabled)
+                and cached_pages is None
+                else None
+            )
+            # 캐시가 없으면 앞 페이지의 문제 수를 알아야 첫 문제 번호가 정해지므로,
+            # 우선 처리로 먼저 도착한 페이지는 앞 페이지가 모두 끝날 때까지 보관
+            # (문제 이미지를 저장하지 않으면 번호가 필요 없으므로 바로 처리)
+            next_page_num = 1
+            saved_count = 0
+            waiting: Dict[int, _PageWork] = {}
+
+            def save_page(page: _PageWork, start_index: int) -> None:
+                self._save_page_batch(
+                    [page],
+                    output_dir,
+                    save_page_images,
+                    start_index,
+                    crop_doc,
+                    dpi,
+                    save_question_images,
+                )
 
-                page = doc.load_page(page_num)
-                mat = fitz.Matrix(dpi / 72, dpi / 72)  # DPI 변환
-                pix = page.get_pixmap(matrix=mat)
+            def save_stage(batch: List[_PageWork]) -> List[_PageWork]:
+                nonlocal next_page_num, saved_count
+                saved: List[_PageWork] = []
+                for page in batch:
+                    check_cancelled()
+                    if start_indices is not None or not save_question_images:
+                        save_page(
+                            page,
+                            start_indices[page.page_num - 1] if start_indices else 0,
+                        )
+                        saved.append(page)
+                        continue
+
+                    waiting[page.page_num] = page
+                    while next_page_num in waiting:
+                        ready = waiting.pop(next_page_num)
+                        save_page(ready, saved_count)
+                        saved_count += len(ready.questions)
+                        saved.append(ready)
+                        next_page_num += 1
+                return saved
+
+            # 처리 중에 prioritize_pages()로 페이지 순서를 바꿀 수 있는 대기열
+            scheduler = PageScheduler(range(total_pages))
+            self._scheduler = scheduler
+
+            if cached_pages is None:
+                # 렌더링 → 추론 → 문제 이미지 저장을 겹쳐서 실행
+                pipeline = StagedPipeline(
+                    self._render_page_batches(
+                        pdf_path,
+                        render_dpi,
+                        1 if page_callback else None,
+                        scheduler,
+                        render_fit,
+                    ),
+                    [
+                        lambda batch: self._detect_page_batch(
+                            batch, confidence, active, detect_doc
+                        ),
+                        save_stage,
+                    ],
+                    name="detection",
+                )
+            else:
+                # 캐시 적중: 출력이 없는 페이지만 렌더링 → 문제 이미지 저장
+                pipeline = StagedPipeline(
+                    self._cached_page_batches(
+                        pdf_path,
+                        render_dpi,
+                        cached_pages,
+                        skipped_pages,
+                        confidence,
+                        start_indices or [],
+                        output_dir,
+                        save_page_images,
+                        save_question_images,
+                        render_fit,
+                        output_record,
+                    ),
+                    [save_stage],
+                    name="detection-cached",
+                )
 
-                # 이미지 저장
-                img_path = os.path.join(output_dir, f"page_{page_num + 1}.png")
-                pix.save(img_path)
-                page_images.append(img_path)
+            detected_pages: List[List[Dict]] = [[] for _ in range(total_pages)]
+            page_image_paths: Dict[int, str] = {}
+            done_pages = 0
+            try:
+                for batch in pipeline:
+                    check_cancelled()
+                    for page in batch:
+                        page.questions.sort(key=_reading_order_key)
+                        if page.image_path:
+                            page_image_paths[page.page_num] = page.image_path
+                        questions.extend(page.questions)
+                        detected_pages[page.page_num - 1] = [
+                            {"box": q["box"], "confidence": q["confidence"]}
+                            for q in page.detections
+                        ]
+                        if page.skip_reason:
+                            skipped_pages[page.page_num] = page.skip_reason
+                            if skip_callback:
+                                skip_callback(page.page_num, page.skip_reason)
+
+                        if page_callback:
+                            page_callback(
+                                page.page_num, list(page.questions), page.image_path
+                            )
+
+                        done_pages += 1
+                        if progress_callback:
+                            progress = 20 + (done_pages * 60 // total_pages)
+                            progress_callback(
+                                progress,
+                                f"페이지 {done_pages}/{total_pages} 처리 중...",
+                            )
+            finally:
+                # 취소된 이전 감지가 새 감지의 대기열을 지우지 않도록 확인
+                if self._scheduler is scheduler:
+                    self._scheduler = None
+                if crop_doc is not None:
+                    crop_doc.close()
+                if detect_doc is not None:
+                    detect_doc.close()
+                if self.use_layout_templates:
+                    get_layout_template_store().save()
+
+            # 우선 처리한 페이지가 있어도 페이지 순서로 정리
+            page_images = [page_image_paths[n] for n in sorted(page_image_paths)]
+
+            if cache_key is not None and cached_pages is None:
+                get_detection_cache().put(
+                    cache_key,
+                    {
+                        "pdf_path": str(pdf_path),
+                        "page_count": total_pages,
+                        "pages": detected_pages,
+                        "skipped": {
+                            str(page_num): reason
+                            for page_num, reason in sorted(skipped_pages.items())
+                        },
+                    },
+                )
 
-                # 문제 감지
-                page_questions = self._detect_questions_on_page(
-                    img_path, page_num + 1, confidence
+            if cache_key is not None:
+                self._write_output_record(
+                    output_dir, cache_key, dpi, questions, page_images
                 )
-                questions.extend(page_questions)
 
-            doc.close()
+            if skipped_pages:
+                self.logger.info(
+                    "건너뛴 페이지: "
+                    + ", ".join(
+                        f"{page_num}({reason})"
+                        for page_num, reason in sorted(skipped_pages.items())
+                    )
+                )
 
             if progress_callback:
                 progress_callback(90, "결과를 정리 중입니다...")
 
-            # 개별 문제 이미지 생성
-            questions = self._create_individual_question_images(questions, output_dir)
-
-            def sort_key(q: Dict) -> tuple[int, int, float]:
-                x1, y1, x2, y2 = q["box"]
-                center_x = (x1 + x2) / 2
-                center_y = (y1 + y2) / 2
-
-                if center_x < 0.5:
-                    return (q["page"], 0, center_y)
-                else:
-                    return (q["page"], 1, center_y)
-
-            questions.sort(key=sort_key)
+            questions.sort(key=_reading_order_key)
 
             if progress_callback:
                 progress_callback(100, f"문제 감지 완료: {len(questions)}개 문제 발견")
 
             return questions, page_images
 
+        except JobCancelledError:
+            raise
         except Exception as e:
             raise Exception(f"PDF 처리 중 오류 발생: {str(e)}")
 
+    def prioritize_pages(self, page_numbers: Sequence[int]) -> None:
+        """진행 중인 감지에서 주어진 페이지를 먼저 처리하도록 요청합니다.
+
+        이미 렌더링했거나 처리한 페이지는 무시합니다.
+
+        Args:
+            page_numbers: 먼저 처리할 페이지 번호(1부터) 목록 (앞쪽이 우선)
+        """
+        scheduler = self._scheduler
+        if scheduler is not None:
+            scheduler.prioritize(n - 1 for n in page_numbers)
+
+    def get_detection_dpi(self, dpi: int) -> int:
+        """출력 DPI에 대해 감지(및 페이지 이미지)에 사용할 렌더링 DPI를 반환합니다."""
+        return min(dpi, self.detection_dpi)
+
+    def get_render_fit(self, save_page_images: bool) -> Optional[Tuple[int, int]]:
+        """페이지를 모델 입력 크기에 맞춰 렌더링할 (높이, 너비)를 반환합니다.
+
+        페이지 이미지를 저장하면(GUI 표시용) 감지 DPI로 렌더링해야 하므로 None을
+        반환합니다. 모델 입력 크기를 알 수 없는 경우에도 None입니다.
+        """
+        return self._render_fit(self._active_model(), save_page_images)
+
+    def _render_fit(
+        self, active: _ActiveModel, save_page_images: bool
+    ) -> Optional[Tuple[int, int]]:
+        """get_render_fit()과 같으며, 주어진 모델을 기준으로 합니다."""
+        if save_page_images or not self.native_input_render:
+            return None
+        return self._model_input_shape(active.model)
+
+    @staticmethod
+    def _model_input_shape(model: Any) -> Optional[Tuple[int, int]]:
+        """모델 입력 크기(높이, 너비)를 반환합니다. 알 수 없으면 None을 반환합니다."""
+        # ONNX Runtime 백엔드
+        input_shape = getattr(model, "input_shape", None)
+        if input_shape is not None:
+            return int(input_shape[0]), int(input_shape[1])
+
+        # ultralytics 모델은 학습할 때의 입력 크기(imgsz)를 기록함
+        imgsz = getattr(model, "overrides", {}).get("imgsz")
+        if isinstance(imgsz, int):
+            return imgsz, imgsz
+        if isinstance(imgsz, (list, tuple)) and len(imgsz) == 2:
+            return int(imgsz[0]), int(imgsz[1])
+        return None
+
+    def inference_confidence(self, confidence: float) -> float:
+        """요청한 신뢰도에 대해 모델을 실행할 신뢰도(하한 이하)를 반환합니다."""
+        return min(confidence, self.confidence_floor)
+
+    def detection_signature(
+        self, pdf_path: str, dpi: int, confidence: float
+    ) -> Tuple[str, str, int, float]:
+        """감지 결과가 의존하는 입력과 설정을 반환합니다.
+
+        값이 같으면 렌더링과 추론을 다시 하지 않아도 됩니다. 출력 DPI는 감지
+        해상도(detection_dpi 이하)가 바뀔 때만, 신뢰도는 하한 아래로 내려갈 때만
+        감지 결과에 영향을 주며, 신뢰도를 하한 위에서 바꾸면 filter_questions()로
+        거르기만 하면 됩니다. 출력 형식, 그룹 크기, 셔플 시드는 내보내기에만
+        영향을 줍니다. 모델을 로드(변경)하는 중이면 요청한 모델을 기준으로 합니다.
+        """
+        return (
+            str(Path(pdf_path).resolve()),
+            self.get_model_info()["path"],
+            self.get_detection_dpi(dpi),
+            self.inference_confidence(confidence),
+        )
+
+    def detection_cache_key(
+        self,
+        pdf_path: str,
+        dpi: int,
+        confidence: float,
+        save_page_images: bool = True,
+    ) -> str:
+        """현재 모델 기준으로 PDF 감지 결과의 캐시 키를 반환합니다.
+
+        페이지 이미지 저장 여부에 따라 렌더링 크기(get_render_fit())가 달라지므로
+        process_pdf()에 넘기는 save_page_images와 같은 값을 사용합니다.
+        """
+        return self._detection_cache_key(
+            self._active_model(), pdf_path, dpi, confidence, save_page_images
+        )
+
+    def _detection_cache_key(
+        self,
+        active: _ActiveModel,
+        pdf_path: str,
+        dpi: int,
+        confidence: float,
+        save_page_images: bool,
+    ) -> str:
+        """detection_cache_key()와 같으며, 주어진 모델을 기준으로 합니다."""
+        return get_detection_cache().make_key(
+            pdf_path,
+            active.path,
+            self.get_detection_dpi(dpi),
+            self.inference_confidence(confidence),
+            text_layer=self.use_text_layer,
+            cascade=(
+                (self.cascade_dpi, self.cascade_imgsz) if self.cascade_enabled else None
+            ),
+            page_filter=self.use_page_filter,
+            input_size=self._render_fit(active, save_page_images),
+            extract_images=self.extract_page_images,
+            layout_templates=self.use_layout_templates,
+        )
+
+    def _active_model(self) -> _ActiveModel:
+        """현재 모델과 그 추론 잠금, 경로를 한꺼번에 반환합니다."""
+        with self._model_lock:
+            if not self.initialized or self.model is None or not self.model_path:
+                raise Exception("모델이 로드되지 않았습니다.")
+            return _ActiveModel(self.model, self._inference_lock, self.model_path)
+
+    def _load_cached_pages(
+        self, cache_key: str, total_pages: int
+    ) -> Optional[Tuple[List[List[Dict]], Dict[int, str]]]:
+        """캐시에서 페이지별 문제 목록과 건너뛴 페이지를 복원합니다.
+
+        캐시된 결과가 없으면 None을 반환합니다.
+        """
+        entry = get_detection_cache().get(cache_key)
+        if entry is None or entry.get("page_count") != total_pages:
+            return None
+
+        try:
+            pages = [
+                [
+                    {
+                        "id": f"page_{page_index + 1}_q_{i + 1}",
+                        "page": page_index + 1,
+                        "box": [float(v) for v in item["box"]],
+                        "confidence": float(item["confidence"]),
+                    }
+                    for i, item in enumerate(page_items)
+                ]
+                for page_index, page_items in enumerate(entry["pages"])
+            ]
+            skipped = {
+                int(page_num): str(reason)
+                for page_num, reason in entry.get("skipped", {}).items()
+            }
+            return pages, skipped
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            self.logger.warning(f"감지 캐시 형식이 올바르지 않습니다: {e}")
+            return None
+
+    def _iter_rendered_pages(
+        self,
+        pdf_path: str,
+        dpi: int,
+        page_indices: Optional[Iterable[int]] = None,
+        fit: Optional[Tuple[int, int]] = None,
+    ) -> Generator[Tuple[int, np.ndarray], None, None]:
+        """설정에 맞는 렌더러로 페이지를 렌더링합니다.
+
+        fit(높이, 너비)이 주어지면 dpi 대신 페이지가 fit에 꼭 맞는 배율로 렌더링합니다.
+        """
+        if self.max_workers > 1:
+            if self._page_renderer is None:
+                self._page_renderer = ProcessPoolPageRenderer(self.max_workers)
+            return self._page_renderer.iter_pages(
+                pdf_path, dpi, page_indices, self.extract_page_images, fit
+            )
+        return iter_pages(pdf_path, dpi, page_indices, self.extract_page_images, fit)
+
+    def _cached_page_batches(
+        self,
+        pdf_path: str,
+        dpi: int,
+        cached_pages: List[List[Dict]],
+        skipped_pages: Dict[int, str],
+        confidence: float,
+        start_indices: List[int],
+        output_dir: str,
+        save_page_images: bool,
+        save_question_images: bool = True,
+        fit: Optional[Tuple[int, int]] = None,
+        output_record: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[List[_PageWork]]:
+        """캐시된 감지 결과로 페이지 배치를 만듭니다 (렌더링 단계).
+
+        같은 감지에서 나온 출력 파일(output_record)이 모두 남아 있는 페이지는
+        렌더링하지 않고 기존 경로를 사용합니다.
+        """
+        pages = [
+            _PageWork(
+                page_index + 1,
+                None,
+                questions=filter_questions(page_detections, confidence),
+                detections=page_detections,
+                skip_reason=skipped_pages.get(page_index + 1),
+            )
+            for page_index, page_detections in enumerate(cached_pages)
+        ]
+        missing = [
+            page.page_num - 1
+            for page in pages
+            if not self._restore_page_outputs(
+                page,
+                output_dir,
+                save_page_images,
+                start_indices[page.page_num - 1],
+                save_question_images,
+                output_record or {},
+            )
+        ]
+
+        rendered = self._iter_rendered_pages(pdf_path, dpi, missing, fit)
+        try:
+            missing_pages = set(missing)
+            batch: List[_PageWork] = []
+            for page in pages:
+                if page.page_num - 1 in missing_pages:
+                    _, page.image = next(rendered)
+                batch.append(page)
+
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+        finally:
+            rendered.close()
+
+    def _restore_page_outputs(
+        self,
+        page: _PageWork,
+        output_dir: str,
+        save_page_images: bool,
+        start_index: int,
+        save_question_images: bool = True,
+        output_record: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """이전 실행의 페이지/문제 이미지가 남아 있으면 경로를 복원합니다.
+
+        output_record(파일 이름 → 문제 박스)에 같은 박스로 기록된 파일만 사용합니다.
+        신뢰도가 다르면 같은 파일 이름이 다른 문제를 가리킬 수 있기 때문입니다.
+        """
+        record = output_record or {}
+        image_path = os.path.join(output_dir, f"page_{page.page_num}.png")
+        question_paths = (
+            [
+                os.path.join(output_dir, f"question_{page.page_num}_{i + 1}.png")
+                for i in range(start_index, start_index + len(page.questions))
+            ]
+            if save_question_images
+            else []
+        )
+
+        if any(
+            record.get(os.path.basename(path), False) != question["box"]
+            for question, path in zip(page.questions, question_paths)
+        ):
+            return False
+        if save_page_images and os.path.basename(image_path) not in record:
+            return False
+
+        required = question_paths + ([image_path] if save_page_images else [])
+        if not all(os.path.exists(path) for path in required):
+            return False
+
+        if save_page_images:
+            page.image_path = image_path
+        for question, question_path in zip(page.questions, question_paths):
+            question["image_path"] = question_path
+        return True
+
+    def _pop_output_record(
+        self, output_dir: str, cache_key: Optional[str], dpi: int
+    ) -> Dict[str, Any]:
+        """출력 디렉토리의 기록을 읽고 지웁니다.
+
+        같은 감지(캐시 키와 출력 DPI)의 기록이면 파일 이름 → 문제 박스(페이지
+        이미지는 None)를 반환하고, 그렇지 않으면 빈 딕셔너리를 반환합니다.
+        """
+        record_path = os.path.join(output_dir, OUTPUT_RECORD_FILENAME)
+        if not os.path.exists(record_path):
+            return {}
+
+        try:
+            with open(record_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            os.remove(record_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"출력 기록을 읽지 못했습니다: {e}")
+            return {}
+
+        if (
+            cache_key is None
+            or not isinstance(record, dict)
+            or record.get("cache_key") != cache_key
+            or record.get("dpi") != dpi
+        ):
+            return {}
+        files = record.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write_output_record(
+        self,
+        output_dir: str,
+        cache_key: str,
+        dpi: int,
+        questions: List[Dict],
+        page_images: List[str],
+    ) -> None:
+        """이번 감지에서 저장한 파일을 출력 디렉토리에 기록합니다."""
+        files: Dict[str, Any] = {os.path.basename(path): None for path in page_images}
+        for question in questions:
+            if question.get("image_path"):
+                files[os.path.basename(question["image_path"])] = question["box"]
+
+        try:
+            with open(
+                os.path.join(output_dir, OUTPUT_RECORD_FILENAME), "w", encoding="utf-8"
+            ) as f:
+                json.dump({"cache_key": cache_key, "dpi": dpi, "files": files}, f)
+        except OSError as e:
+            self.logger.warning(f"출력 기록을 저장하지 못했습니다: {e}")
+
+    def _render_page_batches(
+        self,
+        pdf_path: str,
+        dpi: int,
+        first_batch_size: Optional[int] = None,
+        page_indices: Optional[Iterable[int]] = None,
+        fit: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[List[_PageWork]]:
+        """PDF 페이지를 렌더링하여 batch_size 단위로 내보냅니다 (렌더링 단계).
+
+        first_batch_size가 주어지면 첫 배치만 그 크기로 내보냅니다.
+        page_indices가 PageScheduler이면 렌더링할 때마다 다음 페이지를 꺼내므로
+        우선순위 변경이 바로 반영됩니다. fit이 주어지면 페이지를 그 크기(모델 입력
+        크기)에 맞춰 렌더링합니다.
+        """
+        pages = self._iter_rendered_pages(pdf_path, dpi, page_indices, fit)
+
+        try:
+            batch: List[_PageWork] = []
+            batch_size = first_batch_size or self.batch_size
+            for page_index, image in pages:
+                batch.append(_PageWork(page_index + 1, image))
+
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                    batch_size = self.batch_size
+
+            if batch:
+                yield batch
+        finally:
+            pages.close()
+
+    def _detect_page_batch(
+        self,
+        batch: List[_PageWork],
+        confidence: float,
+        active: _ActiveModel,
+        doc: Any = None,
+    ) -> List[_PageWork]:
+        """페이지 배치를 active 모델의 한 번의 호출로 감지합니다 (추론 단계).
+
+        모델은 신뢰도 하한으로 실행하여 전체 결과는 detections에 보관하고,
+        confidence 이상인 결과만 questions로 사용합니다.
+        페이지 거르기가 켜져 있으면 문제가 없는 페이지는 감지하지 않습니다.
+        doc(PDF 문서)이 주어지면 텍스트 레이어로 감지한 페이지는 모델에 보내지 않고,
+        정밀 감지가 켜져 있으면 결과가 의심스러운 페이지를 다시 감지합니다.
+        레이아웃이 비슷한 템플릿의 문제 영역이 페이지의 잉크와 맞으면 그 페이지도
+        모델에 보내지 않으며, 모델로 감지한 페이지는 (정밀 감지 후의 결과로) 새
+        템플릿으로 보관합니다.
+        """
+        inference_confidence = self.inference_confidence(confidence)
+        template_store = get_layout_template_store()
+        pages = []
+        layouts: List[Optional[PageLayout]] = []
+        for page in batch:
+            if page.image is None:
+                continue
+            if self.use_page_filter:
+                page.skip_reason = page_skip_reason(
+                    doc.load_page(page.page_num - 1) if doc is not None else None,
+                    page.image,
+                )
+                if page.skip_reason:
+                    continue
+
+            detections = (
+                self._detect_questions_from_text(doc, page.page_num)
+                if doc is not None and self.use_text_layer
+                else None
+            )
+
+            layout = None
+            if detections is None and self.use_layout_templates:
+                layout = page_layout(page.image)
+                matched = template_store.match(
+                    active.path, layout, inference_confidence
+                )
+                if matched is not None:
+                    detections = self._questions_from_boxes(
+                        page.page_num,
+                        [item["box"] for item in matched],
+                        [item["confidence"] for item in matched],
+                    )
+
+            if detections is None:
+                pages.append(page)
+                layouts.append(layout)
+            else:
+                page.detections = detections
+                page.questions = filter_questions(detections, confidence)
+
+        if not pages:
+            return batch
+
+        images = [page.image for page in pages if page.image is not None]
+        page_nums = [page.page_num for page in pages]
+
+        results = self._detect_questions_on_pages(
+            images, page_nums, inference_confidence, active=active
+        )
+        if doc is not None and self.cascade_enabled and self._supports_imgsz(active):
+            results = self._refine_detections(
+                doc, page_nums, results, confidence, active
+            )
+
+        for page, layout, detections in zip(pages, layouts, results):
+            page.detections = detections
+            page.questions = filter_questions(detections, confidence)
+            if layout is not None:
+                template_store.add(
+                    active.path, layout, detections, inference_confidence
+                )
+        return batch
+
+    def _refine_detections(
+        self,
+        doc: Any,
+        page_nums: List[int],
+        results: List[List[Dict]],
+        confidence: float,
+        active: _ActiveModel,
+    ) -> List[List[Dict]]:
+        """의심스러운 페이지만 고해상도로 다시 렌더링하여 다시 감지합니다 (정밀 감지).
+
+        Args:
+            doc: PDF 문서
+            page_nums: 페이지 번호 목록
+            results: 저해상도 감지 결과 (page_nums와 같은 순서)
+            confidence: 요청한 신뢰도
+            active: 감지에 사용하는 모델
+
+        Returns:
+            의심스러운 페이지의 결과를 정밀 감지 결과로 바꾼 목록
+        """
+        hard = []
+        for i, (page_num, detections) in enumerate(zip(page_nums, results)):
+            reasons = refinement_reasons(detections, confidence)
+            if reasons:
+                self.logger.debug(
+                    f"정밀 감지 대상 (페이지 {page_num}): {', '.join(reasons)}"
+                )
+                hard.append(i)
+        if not hard:
+            return results
+
+        images = [
+            load_page_image(
+                doc.load_page(page_nums[i] - 1),
+                self.cascade_dpi,
+                self.extract_page_images,
+            )
+            for i in hard
+        ]
+        refined = self._detect_questions_on_pages(
+            images,
+            [page_nums[i] for i in hard],
+            self.inference_confidence(confidence),
+            imgsz=self.cascade_imgsz,
+            active=active,
+        )
+
+        results = list(results)
+        for i, detections in zip(hard, refined):
+            results[i] = detections
+        return results
+
+    @staticmethod
+    def _supports_imgsz(active: _ActiveModel) -> bool:
+        """모델 입력 크기를 호출할 때 바꿀 수 있는지 확인합니다.
+
+        입력 크기가 고정된 ONNX 모델은 고해상도로 렌더링해도 같은 크기로 줄여
+        감지하므로 정밀 감지의 의미가 없습니다.
+        """
+        return bool(getattr(active.model, "dynamic_input", True))
+
+    def _save_page_batch(
+        self,
+        batch: List[_PageWork],
+        output_dir: str,
+        save_page_images: bool,
+        start_index: int,
+        crop_doc: Any = None,
+        crop_dpi: Optional[int] = None,
+        save_question_images: bool = True,
+    ) -> None:
+        """페이지와 개별 문제 이미지를 저장합니다 (저장 단계).
+
+        crop_doc이 주어지면 개별 문제 이미지는 페이지 배열 대신 해당 PDF 문서에서
+        crop_dpi로 문제 영역만 렌더링합니다. 단, 페이지 배열이 이미 crop_dpi
+        이상의 해상도이면(스캔 페이지의 원본 이미지) 배열에서 잘라냅니다.
+        """
+        page_store = get_page_image_store()
+
+        for page in batch:
+            if page.image is None:
+                continue
+
+            # 페이지 이미지 저장 (필요한 경우에만)
+            if save_page_images:
+                img_path = os.path.join(output_dir, f"page_{page.page_num}.png")
+                cv2.imwrite(img_path, page.image)
+                page.image_path = img_path
+                # 캔버스와 내보내기가 다시 디코딩하지 않도록 공유
+                page_store.put(img_path, page.image)
+
+            # 개별 문제 이미지 생성 (페이지가 메모리에 있는 동안)
+            if save_question_images:
+                source_page = (
+                    crop_doc.load_page(page.page_num - 1) if crop_doc else None
+                )
+                if (
+                    source_page is not None
+                    and crop_dpi
+                    and covers_dpi(page.image, source_page, crop_dpi)
+                ):
+                    source_page = None
+                page.questions = self._create_individual_question_images(
+                    page.questions,
+                    page.image,
+                    output_dir,
+                    start_index,
+                    source_page,
+                    crop_dpi,
+                )
+            start_index += len(page.questions)
+
+            # 이후 단계에서는 페이지 배열이 필요 없음
+            page.image = None
+
+    def _detect_questions_from_text(
+        self, doc: Any, page_num: int
+    ) -> Optional[List[Dict]]:
+        """텍스트 레이어로 페이지의 문제를 감지합니다.
+
+        텍스트 레이어가 없거나 결과가 검사를 통과하지 못하면 None을 반환합니다.
+        문제 번호로 찾은 영역이므로 신뢰도는 1.0입니다.
+        """
+        try:
+            boxes = detect_question_regions(doc.load_page(page_num - 1))
+        except Exception as e:
+            self.logger.warning(f"텍스트 레이어 감지 실패 (페이지 {page_num}): {e}")
+            return None
+
+        if boxes is None:
+            return None
+
+        self.logger.debug(f"텍스트 레이어로 감지 (페이지 {page_num}): {len(boxes)}개")
+        return self._questions_from_boxes(page_num, boxes, [1.0] * len(boxes))
+
+    @staticmethod
+    def _questions_from_boxes(
+        page_num: int, boxes: Sequence[List[float]], confidences: Sequence[float]
+    ) -> List[Dict]:
+        """정규화된 박스와 신뢰도로 페이지의 문제 목록을 만듭니다."""
+        return [
+            {
+                "id": f"page_{page_num}_q_{i + 1}",
+                "page": page_num,
+                "box": list(box),
+                "confidence": conf,
+            }
+            for i, (box, conf) in enumerate(zip(boxes, confidences))
+        ]
+
     def _detect_questions_on_page(
-        self, image_path: str, page_num: int, confidence: float
+        self, image: np.ndarray, page_num: int, confidence: float
     ) -> List[Dict]:
-        """페이지에서 문제를 감지합니다."""
-        questions: List[Dict] = []
+        """페이지 이미지(BGR 배열)에서 문제를 감지합니다."""
+        return self._detect_questions_on_pages([image], [page_num], confidence)[0]
+
+    def _detect_questions_on_pages(
+        self,
+        images: List[np.ndarray],
+        page_nums: List[int],
+        confidence: float,
+        imgsz: Optional[int] = None,
+        active: Optional[_ActiveModel] = None,
+    ) -> List[List[Dict]]:
+        """여러 페이지 이미지를 한 번의 모델 호출로 감지합니다.
+
+        Args:
+            images: 페이지 이미지 목록 (BGR 배열)
+            page_nums: 각 이미지의 페이지 번호 (1부터 시작)
+            confidence: 감지 신뢰도
+            imgsz: 모델 입력 크기 (None이면 모델 기본값)
+            active: 감지에 사용할 모델 (None이면 현재 모델)
+
+        Returns:
+            페이지별 감지 결과 목록 (images와 같은 순서)
+        """
+        page_results: List[List[Dict]] = []
 
         try:
-            if self.initialized and self.model:
-                # YOLO 모델로 감지
-                results = self.model(image_path, conf=confidence, verbose=False)
-
-                for i, result in enumerate(results):
-                    boxes = result.boxes
-                    if boxes is not None:
-                        for j, box in enumerate(boxes):
-                            # 바운딩 박스 좌표
-                            x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                            conf = float(box.conf[0].cpu().numpy())
-
-                            # 이미지 크기로 정규화
-                            img = cv2.imread(image_path)
-                            if img is not None:
-                                h, w = img.shape[:2]
-                                x1_norm, y1_norm = x1 / w, y1 / h
-                                x2_norm, y2_norm = x2 / w, y2 / h
-
-                                questions.append(
-                                    {
-                                        "id": f"page_{page_num}_q_{len(questions)+1}",
-                                        "page": page_num,
-                                        "box": [x1_norm, y1_norm, x2_norm, y2_norm],
-                                        "confidence": conf,
-                                        "image_path": image_path,
-                                    }
-                                )
+            if active is None and self.initialized and self.model:
+                active = self._active_model()
+
+            if active is not None:
+                # YOLO 모델로 배치 감지
+                with active.lock:
+                    if imgsz:
+                        results = active.model(
+                            images, conf=confidence, verbose=False, imgsz=imgsz
+                        )
+                    else:
+                        results = active.model(images, conf=confidence, verbose=False)
+
+                for page_num, result in zip(page_nums, results):
+                    page_results.append(self._result_to_questions(result, page_num))
 
             else:
                 # 모델이 없거나 로드 실패 시 예외 발생
                 raise Exception(
-                    "모델이 로드되지 않았습니다. models 폴더에 .pt 파일이 있는지 확인하세요."
+                    "모델이 로드되지 않았습니다. models 폴더에 .pt 또는 .onnx 파일이 있는지 확인하세요."
                 )
 
         except Exception as e:
             # 오류 발생 시 예외를 다시 발생시킴
             raise Exception(f"문제 감지 중 오류 발생: {str(e)}")
 
-        return questions
+        return page_results
+
+    def _result_to_questions(self, result: Any, page_num: int) -> List[Dict]:
+        """YOLO 결과 하나를 문제 목록으로 변환합니다.
+
+        박스 전체를 한 번에 NumPy로 옮긴 뒤 원본 이미지 크기(orig_shape)로
+        정규화하므로, 페이지당 비용이 박스 수와 무관하게 일정합니다.
+        ONNX Runtime 백엔드의 DetectionResult도 같은 방식으로 변환합니다.
+        """
+        # (N, 6) 배열: x1, y1, x2, y2, conf, cls
+        if isinstance(result, DetectionResult):
+            data = result.data
+        else:
+            boxes = result.boxes
+            if boxes is None or len(boxes) == 0:
+                return []
+            data = boxes.data.cpu().numpy()
+
+        if len(data) == 0:
+            return []
+
+        h, w = result.orig_shape[:2]
+        norm_boxes = data[:, :4] / np.array([w, h, w, h], dtype=data.dtype)
+
+        return [
+            {
+                "id": f"page_{page_num}_q_{i + 1}",
+                "page": page_num,
+                "box": box,
+                "confidence": conf,
+            }
+            for i, (box, conf) in enumerate(
+                zip(norm_boxes.tolist(), data[:, 4].tolist())
+            )
+        ]
 
     def _create_individual_question_images(
-        self, questions: List[Dict], output_dir: str
+        self,
+        questions: List[Dict],
+        img: np.ndarray,
+        output_dir: str,
+        start_index: int = 0,
+        source_page: Any = None,
+        dpi: Optional[int] = None,
     ) -> List[Dict]:
-        """개별 문제 이미지를 생성합니다."""
+        """한 페이지 이미지에서 개별 문제 이미지를 생성합니다.
 
-        for i, question in enumerate(questions):
+        Args:
+            questions: 해당 페이지에서 감지된 문제 목록
+            img: 페이지 이미지 (BGR 배열)
+            output_dir: 출력 디렉토리
+            start_index: 파일명에 사용할 문제 번호 시작값
+            source_page: 주어지면 문제 영역을 이 PDF 페이지에서 직접 렌더링
+            dpi: source_page 렌더링 DPI
+        """
+        for i, question in enumerate(questions, start=start_index):
             try:
-                # 원본 이미지 로드
-                img = cv2.imread(question["image_path"])
-                if img is None:
-                    continue
-
-                h, w = img.shape[:2]
-
-                # 정규화된 좌표를 픽셀 좌표로 변환
-                x1 = int(question["box"][0] * w)
-                y1 = int(question["box"][1] * h)
-                x2 = int(question["box"][2] * w)
-                y2 = int(question["box"][3] * h)
-
-                # 경계 확인
-                x1 = max(0, x1)
-                y1 = max(0, y1)
-                x2 = min(w, x2)
-                y2 = min(h, y2)
-
-                # 문제 영역 추출
-                question_img = img[y1:y2, x1:x2]
+                if source_page is not None and dpi:
+                    # 문제 영역만 출력 해상도로 렌더링
+                    question_img = render_region(source_page, question["box"], dpi)
+                else:
+                    # 문제 영역 추출
+                    question_img = crop_image(img, question["box"])
 
                 # 개별 이미지 저장
                 question_img_path = os.path.join(
@@ -291,35 +1496,55 @@ class QuestionDetector:
                 question["image_path"] = question_img_path
 
             except Exception as e:
-                # 실패 시 원본 이미지 경로 유지
-                pass
+                self.logger.warning(f"문제 이미지 생성 실패 ({question['id']}): {e}")
 
         return questions
 
     def get_model_info(self) -> Dict[str, Any]:
-        """모델 정보를 반환합니다."""
-        if self.model_path and Path(self.model_path).exists():
-            size_mb = Path(self.model_path).stat().st_size / (1024 * 1024)
+        """모델 정보를 반환합니다.
+
+        모델을 로드(변경)하는 중이면 요청한 모델의 정보를 반환합니다.
+        """
+        loading = not self._ready.done()
+        model_path = self._requested_model_path if loading else self.model_path
+
+        if model_path and Path(model_path).exists():
+            size_mb = Path(model_path).stat().st_size / (1024 * 1024)
             return {
-                "name": Path(self.model_path).name,
+                "name": Path(model_path).name,
                 "size_mb": f"{size_mb:.1f}",
-                "path": self.model_path,
-                "loaded": self.initialized,
+                "path": model_path,
+                "loaded": self.initialized and model_path == self.model_path,
+                "loading": loading,
             }
         else:
-            return {"name": "모델 없음", "size_mb": "0.0", "path": "", "loaded": False}
+            return {
+                "name": "모델 없음",
+                "size_mb": "0.0",
+                "path": "",
+                "loaded": False,
+                "loading": loading,
+            }
 
     def cleanup(self) -> None:
         """리소스 정리 작업을 수행합니다."""
         try:
-            # 모델 해제
-            if hasattr(self, "model") and self.model is not None:
-                del self.model
-                self.model = None
-
-            # 초기화 상태 리셋
-            self.initialized = False
-            self.model_path = None
+            with self._model_lock:
+                # 모델 해제
+                if hasattr(self, "model") and self.model is not None:
+                    del self.model
+                    self.model = None
+
+                # 초기화 상태 리셋 (모델 자체는 모델 풀이 관리)
+                self.initialized = False
+                self.model_path = None
+                self._pooled_model = None
+            self._loader.shutdown(wait=False)
+
+            # 렌더링 프로세스 풀 종료
+            if self._page_renderer is not None:
+                self._page_renderer.close()
+                self._page_renderer = None
 
         except Exception as e:
             # 정리 작업 중 오류가 발생해도 무시
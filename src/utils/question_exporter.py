@@ -0,0 +1,354 @@
+"""
+문제 내보내기 모듈
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from ..config.settings import get_app_config
+from .job_manager import CancellationToken
+from .logger import get_logger
+from .page_image_store import get_page_image_store
+from .page_renderer import covers_dpi, crop_image, extract_page_image, render_region
+from .pdf_generator import PDFGenerator
+
+
+class QuestionExporter:
+    """감지된 문제를 선택한 출력 형식으로 내보내는 클래스
+
+    GUI와 명령줄 도구가 같은 내보내기 과정을 사용하도록 tkinter에 의존하지 않습니다.
+    """
+
+    def __init__(self, pdf_generator: Optional[PDFGenerator] = None) -> None:
+        self.pdf_generator = pdf_generator or PDFGenerator()
+        self.logger = get_logger(__name__)
+
+    def export(
+        self,
+        questions: List[Dict],
+        page_images: List[str],
+        output_dir: str,
+        output_formats: Dict[str, bool],
+        group_size: int,
+        shuffle_seed: Optional[int] = None,
+        progress_callback: Optional[Callable] = None,
+        pdf_path: Optional[str] = None,
+        dpi: Optional[int] = None,
+        vector_pdf: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """문제들을 출력 형식별로 내보냅니다.
+
+        Args:
+            questions: 감지(및 편집)된 문제 목록
+            page_images: 페이지 이미지 경로 목록 (비어 있으면 감지 시 생성된 문제 이미지 사용)
+            output_dir: 출력 디렉토리
+            output_formats: 출력 형식별 활성화 여부
+            group_size: 그룹 PDF 한 개에 들어갈 문제 수
+            shuffle_seed: 셔플 문제집 시드 (None이면 무작위)
+            progress_callback: 진행률 콜백 함수
+            pdf_path: 원본 PDF 경로 (dpi와 함께 주어지면 문제 영역을 PDF에서 렌더링)
+            dpi: 개별 문제 이미지 DPI
+            vector_pdf: PDF 출력을 이미지 대신 원본 PDF 영역 복사로 생성할지 여부
+                (pdf_path 필요)
+            cancel_token: 취소 토큰 (단계와 문제 이미지마다 확인하며,
+                취소되면 JobCancelledError 발생)
+
+        Returns:
+            생성된 파일 경로 목록
+        """
+
+        def report(progress: int, message: str) -> None:
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            if progress_callback:
+                progress_callback(progress, message)
+
+        report(10, "문제 분할을 시작합니다...")
+
+        temp_images_dir = Path(output_dir) / "temp_images"
+        try:
+            return self._export(
+                questions,
+                page_images,
+                output_dir,
+                output_formats,
+                group_size,
+                shuffle_seed,
+                report,
+                pdf_path,
+                dpi,
+                vector_pdf,
+                temp_images_dir,
+                cancel_token,
+            )
+        finally:
+            # 임시 폴더 정리 (취소되거나 실패한 경우 포함)
+            if temp_images_dir.exists():
+                shutil.rmtree(temp_images_dir)
+
+    def _export(
+        self,
+        questions: List[Dict],
+        page_images: List[str],
+        output_dir: str,
+        output_formats: Dict[str, bool],
+        group_size: int,
+        shuffle_seed: Optional[int],
+        report: Callable[[int, str], None],
+        pdf_path: Optional[str],
+        dpi: Optional[int],
+        vector_pdf: bool,
+        temp_images_dir: Path,
+        cancel_token: Optional[CancellationToken],
+    ) -> List[str]:
+        """export()의 출력 형식별 생성 단계를 수행합니다."""
+        created_files: List[str] = []
+
+        # 벡터 PDF는 이미지 없이 원본 PDF에서 바로 생성
+        source_pdf = pdf_path if vector_pdf else None
+        metadata = {"source_pdf": source_pdf} if source_pdf else {}
+
+        # 감지 시 문제 이미지를 저장하지 않았으면 문제집도 이미지를 새로 만들어 사용
+        missing_images = any(not q.get("image_path") for q in questions)
+
+        # 개별 이미지 생성
+        individual_images = None
+        if output_formats.get("개별 이미지", False) or (
+            source_pdf is None
+            and (
+                output_formats.get("개별 PDF", False)
+                or output_formats.get("그룹 PDF", False)
+                or (
+                    missing_images
+                    and (
+                        output_formats.get("전체 문제집", False)
+                        or output_formats.get("셔플 문제집", False)
+                    )
+                )
+            )
+        ):
+            report(20, "개별 이미지 생성 중...")
+            # 임시 폴더에 이미지 생성
+            temp_images_dir.mkdir(parents=True, exist_ok=True)
+            individual_images = self.regenerate_question_images(
+                questions,
+                page_images,
+                str(temp_images_dir),
+                pdf_path,
+                dpi,
+                cancel_token,
+            )
+
+        report(30, "개별 이미지 생성 중...")
+        if output_formats.get("개별 이미지", False):
+            # 개별 이미지 폴더 생성
+            images_dir = Path(output_dir) / "개별_이미지"
+            images_dir.mkdir(exist_ok=True)
+            # 임시 이미지들을 개별 이미지 폴더로 복사
+            if individual_images is not None:
+                for i, img_path in enumerate(individual_images):
+                    new_path = images_dir / f"문제_{i+1:03d}.png"
+                    shutil.copy2(img_path, new_path)
+                    created_files.append(str(new_path))
+
+        report(40, "개별 PDF 생성 중...")
+        if output_formats.get("개별 PDF", False):
+            # 개별 PDF 폴더 생성
+            pdfs_dir = Path(output_dir) / "개별_PDF"
+            pdfs_dir.mkdir(exist_ok=True)
+            # 개별 PDF 생성
+            if source_pdf is not None:
+                created_files.extend(
+                    self.pdf_generator.create_individual_vector_pdfs(
+                        source_pdf, questions, str(pdfs_dir)
+                    )
+                )
+            elif individual_images is not None:
+                created_files.extend(
+                    self.pdf_generator.create_individual_pdfs(
+                        individual_images, str(pdfs_dir)
+                    )
+                )
+
+        report(60, "그룹 PDF 생성 중...")
+        if output_formats.get("그룹 PDF", False):
+            # 그룹 PDF 폴더 생성
+            groups_dir = Path(output_dir) / "그룹_PDF"
+            groups_dir.mkdir(exist_ok=True)
+            # 그룹 생성 및 PDF 생성
+            if source_pdf is not None:
+                created_files.extend(
+                    self.pdf_generator.create_grouped_vector_pdfs(
+                        source_pdf,
+                        self.pdf_generator.group_questions(questions, group_size),
+                        str(groups_dir),
+                    )
+                )
+            else:
+                groups: List[List[str]] = []
+                if individual_images is not None:
+                    groups = self.pdf_generator.group_questions(
+                        individual_images, group_size
+                    )
+                created_files.extend(
+                    self.pdf_generator.create_grouped_pdfs(groups, str(groups_dir))
+                )
+
+        # 문제집은 새로 만든 이미지가 있으면 그 이미지를 사용
+        workbook_questions = questions
+        if (
+            source_pdf is None
+            and individual_images is not None
+            and len(individual_images) == len(questions)
+        ):
+            workbook_questions = [
+                dict(question, image_path=image_path)
+                for question, image_path in zip(questions, individual_images)
+            ]
+
+        report(80, "전체 문제집 생성 중...")
+        if output_formats.get("전체 문제집", False):
+            workbook_path = Path(output_dir) / "전체_문제집.pdf"
+            self.pdf_generator.create_exam_workbook(
+                workbook_questions, metadata, str(workbook_path)
+            )
+            created_files.append(str(workbook_path))
+
+        report(90, "셔플 문제집 생성 중...")
+        if output_formats.get("셔플 문제집", False):
+            shuffled_path = Path(output_dir) / "셔플_문제집.pdf"
+            self.pdf_generator.create_shuffled_workbook(
+                workbook_questions, metadata, str(shuffled_path), shuffle_seed
+            )
+            created_files.append(str(shuffled_path))
+
+        return created_files
+
+    def regenerate_question_images(
+        self,
+        questions: List[Dict],
+        page_images: List[str],
+        output_dir: str,
+        pdf_path: Optional[str] = None,
+        dpi: Optional[int] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """편집된 박스 정보를 사용하여 개별 문제 이미지를 재생성합니다.
+
+        pdf_path와 dpi가 주어지면 문제 영역만 원본 PDF에서 dpi로 렌더링하고,
+        그렇지 않으면 페이지 이미지에서 잘라냅니다. 페이지 이미지도 없으면
+        (디스크에 저장하지 않은 경우) 감지 시 생성된 문제 이미지를 그대로 사용합니다.
+        cancel_token이 주어지면 문제마다 취소 여부를 확인합니다.
+        """
+        if pdf_path and dpi:
+            return self._render_question_images(
+                questions, pdf_path, dpi, output_dir, cancel_token
+            )
+
+        question_images: List[str] = []
+        page_store = get_page_image_store()
+
+        for i, question in enumerate(questions):
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            try:
+                if not 1 <= question["page"] <= len(page_images):
+                    question_images.append(question["image_path"])
+                    continue
+
+                # 원본 페이지 이미지 로드 (페이지당 한 번만 디코딩)
+                page_image_path = page_images[question["page"] - 1]
+                img = page_store.get(page_image_path)
+                if img is None:
+                    question_images.append(question["image_path"])
+                    continue
+
+                h, w = img.shape[:2]
+
+                # 편집된 박스 좌표를 픽셀 좌표로 변환
+                x1 = int(question["box"][0] * w)
+                y1 = int(question["box"][1] * h)
+                x2 = int(question["box"][2] * w)
+                y2 = int(question["box"][3] * h)
+
+                # 경계 확인
+                x1 = max(0, x1)
+                y1 = max(0, y1)
+                x2 = min(w, x2)
+                y2 = min(h, y2)
+
+                # 문제 영역 추출
+                question_img = img[y1:y2, x1:x2]
+
+                # 개별 이미지 저장
+                question_img_path = os.path.join(
+                    output_dir, f"question_{question['page']}_{i+1}.png"
+                )
+                cv2.imwrite(question_img_path, question_img)
+
+                question_images.append(question_img_path)
+
+            except Exception as e:
+                # 실패 시 기존 이미지 경로 사용
+                self.logger.warning(f"문제 이미지 재생성 실패 ({i+1}): {e}")
+                if "image_path" in question:
+                    question_images.append(question["image_path"])
+
+        return question_images
+
+    def _render_question_images(
+        self,
+        questions: List[Dict],
+        pdf_path: str,
+        dpi: int,
+        output_dir: str,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """원본 PDF에서 문제 영역만 렌더링하여 개별 문제 이미지를 생성합니다.
+
+        스캔 페이지의 내장 이미지가 dpi 이상의 해상도이면 렌더링하지 않고
+        원본 이미지에서 잘라냅니다.
+        """
+        import fitz  # PyMuPDF
+
+        question_images: List[str] = []
+        extract_images = get_app_config().scanned_page_extraction_enabled
+        # 같은 페이지의 문제마다 내장 이미지를 다시 디코딩하지 않도록 보관
+        scan_page_num: Optional[int] = None
+        scan_image: Optional[np.ndarray] = None
+
+        with fitz.open(pdf_path) as doc:
+            for i, question in enumerate(questions):
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+                try:
+                    page = doc.load_page(question["page"] - 1)
+                    if extract_images and question["page"] != scan_page_num:
+                        scan_page_num = question["page"]
+                        scan_image = extract_page_image(page)
+
+                    if scan_image is not None and covers_dpi(scan_image, page, dpi):
+                        question_img = crop_image(scan_image, question["box"])
+                    else:
+                        question_img = render_region(page, question["box"], dpi)
+
+                    question_img_path = os.path.join(
+                        output_dir, f"question_{question['page']}_{i+1}.png"
+                    )
+                    cv2.imwrite(question_img_path, question_img)
+
+                    question_images.append(question_img_path)
+
+                except Exception as e:
+                    # 실패 시 기존 이미지 경로 사용
+                    self.logger.warning(f"문제 이미지 렌더링 실패 ({i+1}): {e}")
+                    if "image_path" in question:
+                        question_images.append(question["image_path"])
+
+        return question_images
@@ -0,0 +1,283 @@
+"""
+문제 저장소 모듈
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.models import DetectionResult, ProcessingResult, ProcessingSettings
+
+
+class QuestionStore:
+    """감지된 문제를 열(column) 단위 NumPy 배열로 보관하는 저장소
+
+    문제마다 딕셔너리와 좌표 리스트를 만드는 대신 박스(float32, N×4), 페이지,
+    신뢰도, 편집 여부를 각각 하나의 배열로 보관합니다. 문제 id는 추가된 순서대로
+    부여되는 행 번호이며 바뀌지 않으므로, id로 박스를 읽고 고치는 것은 O(1)입니다.
+
+    페이지는 순서 없이 추가될 수 있으며, 페이지 색인은 페이지별 행 범위만 보관합니다.
+    한 페이지 안의 문제는 추가한 순서(읽는 순서)를 유지합니다.
+    스레드 안전하지 않으므로 한 스레드(예: Tk 스레드)에서만 사용합니다.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        capacity = max(1, capacity)
+        self._boxes = np.empty((capacity, 4), dtype=np.float32)
+        self._pages = np.empty(capacity, dtype=np.int32)
+        self._confidences = np.empty(capacity, dtype=np.float32)
+        self._edited = np.zeros(capacity, dtype=bool)
+        self._size = 0
+        # 페이지 번호 → 해당 페이지 문제의 행 범위 목록 [(시작, 끝), ...]
+        self._page_index: Dict[int, List[Tuple[int, int]]] = {}
+        # 문제 id → 문제 이미지 경로 (이미지를 저장한 문제만)
+        self._image_paths: Dict[int, str] = {}
+
+    @classmethod
+    def from_questions(cls, questions: Sequence[Dict]) -> "QuestionStore":
+        """문제 목록(딕셔너리)으로 저장소를 만듭니다."""
+        store = cls(len(questions))
+        store.add_questions(questions)
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def pages(self) -> List[int]:
+        """문제가 있는 페이지 번호 목록 (오름차순)"""
+        return sorted(self._page_index)
+
+    @property
+    def nbytes(self) -> int:
+        """열 배열이 차지하는 메모리 (바이트)"""
+        return (
+            self._boxes.nbytes
+            + self._pages.nbytes
+            + self._confidences.nbytes
+            + self._edited.nbytes
+        )
+
+    def add_page(
+        self,
+        page_num: int,
+        boxes: Any,
+        confidences: Any,
+        image_paths: Optional[Sequence[Optional[str]]] = None,
+    ) -> range:
+        """한 페이지의 문제들을 추가합니다.
+
+        Args:
+            page_num: 페이지 번호 (1부터)
+            boxes: (N, 4) 정규화된 xyxy 박스
+            confidences: (N,) 신뢰도
+            image_paths: 문제별 이미지 경로 (없으면 None)
+
+        Returns:
+            추가된 문제 id 범위
+        """
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        confidences = np.asarray(confidences, dtype=np.float32).reshape(-1)
+        if len(boxes) != len(confidences):
+            raise ValueError("박스와 신뢰도의 개수가 다릅니다")
+        if page_num < 1:
+            raise ValueError("페이지 번호는 1 이상이어야 합니다")
+
+        start, count = self._size, len(boxes)
+        self._reserve(count)
+        stop = start + count
+
+        self._boxes[start:stop] = boxes
+        self._pages[start:stop] = page_num
+        self._confidences[start:stop] = confidences
+        self._edited[start:stop] = False
+        self._size = stop
+
+        if count:
+            self._page_index.setdefault(page_num, []).append((start, stop))
+        if image_paths is not None:
+            for qid, image_path in zip(range(start, stop), image_paths):
+                if image_path:
+                    self._image_paths[qid] = image_path
+
+        return range(start, stop)
+
+    def add_questions(self, questions: Iterable[Dict]) -> List[int]:
+        """문제 목록(딕셔너리)을 추가하고 부여한 id 목록을 반환합니다.
+
+        같은 페이지의 연속된 문제는 한 번에 추가합니다.
+        """
+        ids: List[int] = []
+        chunk: List[Dict] = []
+
+        def flush() -> None:
+            if chunk:
+                ids.extend(
+                    self.add_page(
+                        chunk[0]["page"],
+                        [q["box"] for q in chunk],
+                        [q["confidence"] for q in chunk],
+                        [q.get("image_path") for q in chunk],
+                    )
+                )
+                chunk.clear()
+
+        for question in questions:
+            if chunk and question["page"] != chunk[0]["page"]:
+                flush()
+            chunk.append(question)
+        flush()
+
+        return ids
+
+    def ids(self, confidence: Optional[float] = None) -> np.ndarray:
+        """문제 id를 페이지 순서(페이지 안에서는 읽는 순서)로 반환합니다.
+
+        confidence가 주어지면 신뢰도가 그 이상이거나 편집된 문제만 반환합니다.
+        """
+        ranges = [
+            np.arange(start, stop)
+            for page_num in self.pages
+            for start, stop in self._page_index[page_num]
+        ]
+        ids = np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int64)
+        if confidence is not None:
+            ids = ids[self._visible(ids, confidence)]
+        return ids
+
+    def page_ids(self, page_num: int, confidence: Optional[float] = None) -> List[int]:
+        """한 페이지의 문제 id를 읽는 순서로 반환합니다.
+
+        confidence가 주어지면 신뢰도가 그 이상이거나 편집된 문제만 반환합니다.
+        """
+        ranges = self._page_index.get(page_num, [])
+        if not ranges:
+            return []
+
+        ids = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        if confidence is not None:
+            ids = ids[self._visible(ids, confidence)]
+        return [int(qid) for qid in ids]
+
+    def count(self, confidence: Optional[float] = None) -> int:
+        """문제 수를 반환합니다 (confidence가 주어지면 보이는 문제만)."""
+        if confidence is None:
+            return self._size
+        return int(self._visible(np.arange(self._size), confidence).sum())
+
+    def box(self, qid: int) -> List[float]:
+        """문제의 박스 좌표를 새 리스트로 반환합니다."""
+        self._check_id(qid)
+        return [float(v) for v in self._boxes[qid]]
+
+    def set_box(self, qid: int, box: Sequence[float]) -> None:
+        """문제의 박스 좌표를 바꾸고 편집된 문제로 표시합니다.
+
+        편집된 문제는 신뢰도와 관계없이 항상 보입니다.
+        """
+        self._check_id(qid)
+        if len(box) != 4:
+            raise ValueError("바운딩 박스는 4개의 값이 필요합니다")
+        self._boxes[qid] = box
+        self._edited[qid] = True
+
+    def is_edited(self, qid: int) -> bool:
+        """문제가 편집되었는지 확인합니다."""
+        self._check_id(qid)
+        return bool(self._edited[qid])
+
+    def get(self, qid: int) -> DetectionResult:
+        """문제 하나를 DetectionResult로 반환합니다."""
+        self._check_id(qid)
+        image_path = self._image_paths.get(qid)
+        return DetectionResult(
+            question_id=self._question_id(qid),
+            page_number=int(self._pages[qid]),
+            bounding_box=(
+                float(self._boxes[qid, 0]),
+                float(self._boxes[qid, 1]),
+                float(self._boxes[qid, 2]),
+                float(self._boxes[qid, 3]),
+            ),
+            confidence=float(self._confidences[qid]),
+            image_path=Path(image_path) if image_path else None,
+            metadata={"edited": bool(self._edited[qid])},
+        )
+
+    def to_detection_results(
+        self, confidence: Optional[float] = None
+    ) -> List[DetectionResult]:
+        """문제들을 페이지 순서의 DetectionResult 목록으로 반환합니다."""
+        return [self.get(int(qid)) for qid in self.ids(confidence)]
+
+    def to_processing_result(
+        self,
+        input_file: Path,
+        output_directory: Path,
+        page_images: List[Path],
+        processing_time: float,
+        settings: ProcessingSettings,
+    ) -> ProcessingResult:
+        """설정의 신뢰도 이상인(또는 편집된) 문제들로 처리 결과를 만듭니다."""
+        return ProcessingResult(
+            input_file=input_file,
+            output_directory=output_directory,
+            detection_results=self.to_detection_results(settings.confidence),
+            page_images=page_images,
+            processing_time=processing_time,
+            settings=settings,
+        )
+
+    def to_questions(self, confidence: Optional[float] = None) -> List[Dict]:
+        """문제들을 내보내기 등에서 사용하는 딕셔너리 목록으로 반환합니다."""
+        ids = self.ids(confidence)
+        questions = []
+        for qid, page_num, box, conf in zip(
+            ids.tolist(),
+            self._pages[ids].tolist(),
+            self._boxes[ids].tolist(),
+            self._confidences[ids].tolist(),
+        ):
+            question = {
+                "id": self._question_id(qid),
+                "page": page_num,
+                "box": box,
+                "confidence": conf,
+            }
+            if qid in self._image_paths:
+                question["image_path"] = self._image_paths[qid]
+            questions.append(question)
+        return questions
+
+    def clear(self) -> None:
+        """모든 문제를 삭제합니다 (id는 0부터 다시 부여)."""
+        self._size = 0
+        self._page_index.clear()
+        self._image_paths.clear()
+
+    def _visible(self, ids: np.ndarray, confidence: float) -> np.ndarray:
+        """신뢰도가 confidence 이상이거나 편집된 문제의 마스크를 반환합니다."""
+        mask: np.ndarray = (self._confidences[ids] >= confidence) | self._edited[ids]
+        return mask
+
+    def _question_id(self, qid: int) -> str:
+        return f"page_{int(self._pages[qid])}_q_{qid + 1}"
+
+    def _check_id(self, qid: int) -> None:
+        if not 0 <= qid < self._size:
+            raise KeyError(f"문제 id가 올바르지 않습니다: {qid}")
+
+    def _reserve(self, count: int) -> None:
+        """count개를 더 추가할 수 있도록 배열 용량을 (두 배씩) 늘립니다."""
+        required = self._size + count
+        capacity = len(self._pages)
+        if required <= capacity:
+            return
+
+        capacity = max(capacity * 2, required)
+        for name in ("_boxes", "_pages", "_confidences", "_edited"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
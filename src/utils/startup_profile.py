@@ -0,0 +1,135 @@
+"""
+시작 시간 측정 모듈
+
+`python -X importtime`으로 GUI 시작 시 불러오는 모듈을 측정하고 시간 예산과 비교합니다.
+
+사용법:
+    python -m src.utils.startup_profile [--budget-ms 300] [--top 15]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# GUI 진입 모듈
+STARTUP_MODULE = "src.main"
+
+# 시작 시간 예산 (밀리초)
+DEFAULT_BUDGET_MS = 300
+
+# 처음 사용할 때까지 불러오지 않아야 하는 무거운 모듈
+DEFERRED_MODULES = (
+    "torch",
+    "ultralytics",
+    "onnxruntime",
+    "cv2",
+    "numpy",
+    "fitz",
+    "reportlab",
+    "PIL",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """모듈 하나의 import 시간 (마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """`-X importtime` 출력을 파싱합니다."""
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return records
+
+
+def profile_startup(module: str = STARTUP_MODULE) -> List[ImportRecord]:
+    """새 인터프리터에서 모듈을 import하며 import 시간을 측정합니다."""
+    project_root = Path(__file__).resolve().parent.parent.parent
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def startup_time_ms(records: Sequence[ImportRecord], package: str) -> float:
+    """패키지와 그 패키지가 불러온 모듈의 import 시간 합계를 반환합니다."""
+    return (
+        sum(
+            r.cumulative_us
+            for r in records
+            if r.depth == 0
+            and (r.module == package or r.module.startswith(package + "."))
+        )
+        / 1000
+    )
+
+
+def loaded_deferred_modules(records: Sequence[ImportRecord]) -> List[str]:
+    """시작 시 불러온 무거운 모듈 목록을 반환합니다."""
+    loaded = {r.module.split(".")[0] for r in records}
+    return [name for name in DEFERRED_MODULES if name in loaded]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="GUI 시작 시 import 시간을 측정하고 예산과 비교합니다."
+    )
+    parser.add_argument("--module", default=STARTUP_MODULE, help="측정할 진입 모듈")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"허용 import 시간 (밀리초, 기본값: {DEFAULT_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="출력할 느린 모듈 수 (기본값: 15)"
+    )
+    args = parser.parse_args(argv)
+
+    records = profile_startup(args.module)
+    total_ms = startup_time_ms(records, args.module.split(".")[0])
+    deferred = loaded_deferred_modules(records)
+
+    print(f"느린 모듈 (자체 시간 기준 상위 {args.top}개):")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[: args.top]:
+        print(f"  {record.self_us / 1000:8.1f} ms  {record.module}")
+
+    print(
+        f"\n{args.module} import 시간: {total_ms:.1f} ms (예산 {args.budget_ms:.0f} ms)"
+    )
+
+    ok = True
+    if deferred:
+        print(f"시작 시 불러오면 안 되는 모듈: {', '.join(deferred)}")
+        ok = False
+    if total_ms > args.budget_ms:
+        print("시작 시간 예산을 초과했습니다.")
+        ok = False
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+텍스트 레이어 문제 감지 모듈
+
+평가원 시험지처럼 텍스트 레이어가 있는 PDF는 "1.", "23." 같은 문제 번호의 위치를
+PDF에서 바로 읽을 수 있습니다. 문제 번호를 기준점(anchor)으로 단(column)을 나누고,
+같은 단의 다음 문제 번호 앞까지를 한 문제 영역으로 잡으므로 모델 추론 없이
+페이지당 수 밀리초 안에 문제를 찾습니다. 결과가 검사를 통과하지 못하면 None을
+반환하며, 이 경우 호출하는 쪽에서 모델로 감지합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+# 줄 맨 앞의 문제 번호 ("1.", "23." / "2.5" 같은 소수는 제외)
+_QUESTION_NUMBER = re.compile(r"^\s*(\d{1,2})\s*[.．](?!\d)")
+
+# 한 페이지에서 허용하는 최대 단 수와 문제 수
+MAX_COLUMNS = 3
+MAX_QUESTIONS_PER_PAGE = 20
+
+# 페이지 크기 대비 비율
+COLUMN_TOLERANCE = 0.05  # 같은 단으로 보는 문제 번호의 가로 위치 차이
+FOOTER_RATIO = 0.06  # 쪽 번호, 저작권 문구 등이 있는 하단 영역
+MARGIN_RATIO = 0.005  # 문제 영역 여백
+MIN_QUESTION_WIDTH = 0.2
+MIN_QUESTION_HEIGHT = 0.015
+
+# bboxlog 항목 중 화면에 보이는 내용
+_CONTENT_TYPES = ("fill-text", "stroke-text", "fill-path", "stroke-path", "fill-image")
+
+Rect = Tuple[float, float, float, float]
+
+
+@dataclass
+class QuestionAnchor:
+    """문제 번호의 위치 (PDF 좌표)"""
+
+    number: int
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+def find_question_anchors(page: Any) -> List[QuestionAnchor]:
+    """페이지 텍스트 레이어에서 줄 맨 앞의 문제 번호를 찾습니다.
+
+    Args:
+        page: PyMuPDF 페이지
+
+    Returns:
+        문제 번호 목록 (텍스트 레이어에 나온 순서)
+    """
+    import fitz  # PyMuPDF
+
+    # 이미지 블록은 필요 없으므로 이미지 데이터를 복사하지 않도록 플래그를 지정
+    text = page.get_text(
+        "dict", flags=fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+    )
+
+    anchors = []
+    for block in text["blocks"]:
+        for line in block.get("lines", []):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            match = _QUESTION_NUMBER.match("".join(span["text"] for span in spans))
+            if match:
+                x0, y0, x1, y1 = spans[0]["bbox"]
+                anchors.append(QuestionAnchor(int(match.group(1)), x0, y0, x1, y1))
+    return anchors
+
+
+def detect_question_regions(page: Any) -> Optional[List[List[float]]]:
+    """텍스트 레이어로 페이지의 문제 영역을 찾습니다.
+
+    문제 번호를 가로 위치로 묶어 단을 나누고, 각 문제 번호부터 같은 단의 다음 문제
+    번호 앞까지(마지막 문제는 단의 내용 끝까지)를 문제 영역으로 잡습니다.
+    다음 경우에는 None을 반환합니다.
+
+    - 회전된 페이지, 텍스트 레이어나 문제 번호가 없는 페이지
+    - 페이지 전체를 덮는 이미지가 있는 페이지 (스캔본)
+    - 단이나 문제 수가 너무 많거나, 읽는 순서의 문제 번호가 1씩 증가하지 않는 경우
+    - 너무 작은 문제 영역이 있거나, 어느 문제 영역에도 속하지 않는 본문 내용이 있는 경우
+      (예: 앞 페이지에서 이어지는 문제)
+
+    Args:
+        page: PyMuPDF 페이지
+
+    Returns:
+        읽는 순서로 정렬된 정규화 (x1, y1, x2, y2) 박스 목록, 또는 None
+    """
+    if page.rotation:
+        return None
+
+    width, height = page.rect.width, page.rect.height
+    if width <= 0 or height <= 0:
+        return None
+
+    anchors = find_question_anchors(page)
+    if not anchors or len(anchors) > MAX_QUESTIONS_PER_PAGE:
+        return None
+
+    content = _content_rects(page, width, height)
+    if content is None:
+        return None
+
+    columns = _group_columns(anchors, width * COLUMN_TOLERANCE)
+    if len(columns) > MAX_COLUMNS:
+        return None
+
+    # 읽는 순서(단 → 위에서 아래)로 문제 번호가 1씩 증가해야 함
+    ordered = [anchor for column in columns for anchor in column]
+    numbers = [anchor.number for anchor in ordered]
+    if numbers != list(range(numbers[0], numbers[0] + len(numbers))):
+        return None
+
+    margin_x, margin_y = width * MARGIN_RATIO, height * MARGIN_RATIO
+    body_top = min(anchor.y0 for anchor in anchors) - margin_y
+    body_bottom = height * (1 - FOOTER_RATIO)
+
+    regions: List[Rect] = []
+    for index, column in enumerate(columns):
+        left = min(anchor.x0 for anchor in column) - margin_x
+        right_limit = (
+            min(anchor.x0 for anchor in columns[index + 1]) - margin_x
+            if index + 1 < len(columns)
+            else width
+        )
+        # 머리글과 하단 영역을 제외한 이 단의 내용
+        column_rects = [
+            rect
+            for rect in content
+            if left <= _center(rect)[0] < right_limit
+            and _center(rect)[1] >= body_top
+            and rect[3] <= body_bottom
+        ]
+        right = max([rect[2] for rect in column_rects] + [column[0].x1])
+
+        for i, anchor in enumerate(column):
+            top = anchor.y0 - margin_y
+            limit = column[i + 1].y0 - margin_y if i + 1 < len(column) else body_bottom
+            bottom = max(
+                [rect[3] for rect in column_rects if top <= _center(rect)[1] < limit]
+                + [anchor.y1]
+            )
+            regions.append(
+                (
+                    max(left, 0.0),
+                    max(top, 0.0),
+                    min(right + margin_x, width),
+                    min(bottom + margin_y, limit, height),
+                )
+            )
+
+    for x0, y0, x1, y1 in regions:
+        if (
+            x1 - x0 < width * MIN_QUESTION_WIDTH
+            or y1 - y0 < height * MIN_QUESTION_HEIGHT
+        ):
+            return None
+
+    # 본문(첫 문제 번호 아래, 하단 영역 위)의 내용은 모두 문제 영역 안에 있어야 함
+    for rect in content:
+        cx, cy = _center(rect)
+        if body_top <= cy < body_bottom and not any(
+            x0 <= cx <= x1 and y0 <= cy <= y1 for x0, y0, x1, y1 in regions
+        ):
+            return None
+
+    return [
+        [x0 / width, y0 / height, x1 / width, y1 / height] for x0, y0, x1, y1 in regions
+    ]
+
+
+def _content_rects(page: Any, width: float, height: float) -> Optional[List[Rect]]:
+    """페이지에 보이는 내용(글자, 그림, 이미지)의 영역 목록을 반환합니다.
+
+    단 구분선이나 머리글 밑줄처럼 페이지를 가로지르는 선은 제외하며,
+    페이지 전체를 덮는 이미지가 있으면(스캔본) None을 반환합니다.
+    """
+    rects: List[Rect] = []
+    for kind, (x0, y0, x1, y1) in page.get_bboxlog():
+        if kind not in _CONTENT_TYPES or (x1 <= x0 and y1 <= y0):
+            continue
+        w, h = x1 - x0, y1 - y0
+        if kind == "fill-image" and w >= width * 0.8 and h >= height * 0.8:
+            return None
+        if kind.endswith("path") and (w >= width * 0.8 or h >= height * 0.5):
+            continue
+        rects.append((x0, y0, x1, y1))
+    return rects
+
+
+def _group_columns(
+    anchors: Sequence[QuestionAnchor], tolerance: float
+) -> List[List[QuestionAnchor]]:
+    """문제 번호를 가로 위치로 묶어 왼쪽 단부터, 단 안에서는 위에서부터 정렬합니다."""
+    columns: List[List[QuestionAnchor]] = []
+    for anchor in sorted(anchors, key=lambda a: a.x0):
+        if columns and anchor.x0 - columns[-1][0].x0 <= tolerance:
+            columns[-1].append(anchor)
+        else:
+            columns.append([anchor])
+    return [sorted(column, key=lambda a: a.y0) for column in columns]
+
+
+def _center(rect: Rect) -> Tuple[float, float]:
+    return (rect[0] + rect[2]) / 2, (rect[1] + rect[3]) / 2